@@ -0,0 +1,106 @@
+"""
+Persistent cache of contract ABIs fetched from block explorers
+
+ABIs are stored under the telliot home directory by content hash, so
+identical ABIs deployed on several chains are stored once.  An index file
+maps each (chain_id, address) to the hash of its ABI.
+"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Optional
+
+from telliot_core.utils.home import telliot_homedir
+
+logger = logging.getLogger(__name__)
+
+
+class AbiCache:
+    """On-disk ABI cache keyed by (chain_id, address)
+
+    Args:
+        cache_dir: Cache folder (default: `abi_cache` in the telliot home directory)
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = cache_dir or telliot_homedir() / "abi_cache"
+        self._index: Optional[Dict[str, str]] = None
+
+    @property
+    def index_file(self) -> Path:
+        return self.cache_dir / "index.json"
+
+    def _key(self, chain_id: int, address: str) -> str:
+        return f"{chain_id}:{address.strip().lower()}"
+
+    def _abi_file(self, digest: str) -> Path:
+        return self.cache_dir / "abis" / f"{digest}.json"
+
+    def _load_index(self) -> Dict[str, str]:
+        if self._index is None:
+            try:
+                with open(self.index_file, "r") as f:
+                    self._index = json.load(f)
+            except FileNotFoundError:
+                self._index = {}
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable ABI cache index {self.index_file}: {e!r}")
+                self._index = {}
+        assert self._index is not None
+        return self._index
+
+    def get(self, chain_id: int, address: str) -> Optional[list[Any]]:
+        """Returns the cached ABI, or None if not cached"""
+        digest = self._load_index().get(self._key(chain_id, address))
+        if digest is None:
+            return None
+
+        try:
+            with open(self._abi_file(digest), "r") as f:
+                abi: list[Any] = json.load(f)
+            return abi
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cached ABI {digest}: {e!r}")
+            return None
+
+    def put(self, chain_id: int, address: str, abi: list[Any]) -> None:
+        """Store an ABI"""
+        content = json.dumps(abi, sort_keys=True, separators=(",", ":"))
+        digest = hashlib.sha256(content.encode()).hexdigest()
+
+        abi_file = self._abi_file(digest)
+        if not abi_file.exists():
+            _write_atomic(abi_file, content)
+
+        index = self._load_index()
+        index[self._key(chain_id, address)] = digest
+        _write_atomic(self.index_file, json.dumps(index, indent=2, sort_keys=True))
+
+
+def _write_atomic(path: Path, content: str) -> None:
+    """Write a file so that readers never see partial content"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+_abi_cache: Optional[AbiCache] = None
+
+
+def default_abi_cache() -> AbiCache:
+    """Returns the ABI cache in the telliot home directory"""
+    global _abi_cache
+    if _abi_cache is None:
+        _abi_cache = AbiCache()
+    return _abi_cache
@@ -4,6 +4,8 @@ from datetime import datetime
 from pathlib import Path
 from traceback import format_tb
 from typing import cast
+from typing import Dict
+from typing import Iterator
 from typing import Optional
 from typing import Union
 
@@ -14,8 +16,12 @@ from chained_accounts import find_accounts
 from telliot_core.apps.session_manager import ClientSessionManager
 from telliot_core.apps.telliot_config import TelliotConfig
 from telliot_core.contract.contract import Contract
+from telliot_core.contract.gas_cache import GasEstimateCache
 from telliot_core.contract.listener import Listener
-from telliot_core.directory import contract_directory
+from telliot_core.contract.nonce_manager import NonceManager
+from telliot_core.contract.read_cache import ReadCache
+from telliot_core.contract.receipt_tracker import ReceiptTracker
+from telliot_core.directory import get_contract_directory
 from telliot_core.logs import init_logging
 from telliot_core.model.endpoints import RPCEndpoint
 from telliot_core.tellor.tellor360.autopay import Tellor360AutopayContract
@@ -150,6 +156,7 @@ class TelliotCore:
             autopay = TellorFlexAutopayContract(node=self.endpoint, account=account)
             autopay.connect()
 
+            self._configure_contracts(oracle, token, autopay)
             self._tellorflex = TellorFlexContractSet(oracle=oracle, token=token, autopay=autopay)
 
         return self._tellorflex
@@ -168,6 +175,7 @@ class TelliotCore:
             oracle = TellorxOracleContract(node=self.endpoint, account=account)
             oracle.connect()
 
+            self._configure_contracts(master, oracle)
             self._tellorx = TellorxContractSet(
                 master=master,
                 oracle=oracle,
@@ -194,12 +202,127 @@ class TelliotCore:
             token = TokenContract(node=self.endpoint, account=account)
             token.connect()
 
+            self._configure_contracts(oracle, autopay, token)
             self._tellor360 = Tellor360ContractSet(oracle=oracle, autopay=autopay, token=token)
 
         return self._tellor360
 
     _tellor360: Optional[Tellor360ContractSet]
 
+    def _contracts(self) -> Iterator[Contract]:
+        """Iterate over contracts in the contract sets created so far"""
+        for contract_set in (self._tellorx, self._tellorflex, self._tellor360):
+            if contract_set is not None:
+                yield from vars(contract_set).values()
+
+    def _configure_contracts(self, *contracts: Contract) -> None:
+        """Share optional core services with contracts"""
+        for contract in contracts:
+            contract.read_cache = self._read_cache
+            contract.receipt_tracker = self._receipt_tracker
+            contract.gas_cache = self._gas_cache
+            if self._nonce_manager_enabled and contract.account is not None and contract.node is self._endpoint:
+                contract.nonce_manager = self.get_nonce_manager(contract.account)
+
+    def get_nonce_manager(self, account: ChainedAccount) -> NonceManager:
+        """Get or create the nonce manager for an account on the current endpoint
+
+        Contracts sharing an account share its nonce manager, so transactions
+        sent through different contracts never reuse a nonce.
+        """
+        address = account.address
+        if address not in self._nonce_managers:
+            self._nonce_managers[address] = NonceManager(node=self.endpoint, address=address)
+
+        return self._nonce_managers[address]
+
+    _nonce_managers: Dict[str, NonceManager]
+
+    #: True if contracts with an account assign nonces locally (see enable_nonce_manager())
+    nonce_manager_enabled = property(lambda self: self._nonce_manager_enabled)
+    _nonce_manager_enabled: bool
+
+    def enable_nonce_manager(self) -> None:
+        """Assign transaction nonces locally instead of reading them from the node
+
+        Contracts of the contract sets and from get_contract() get the nonce
+        manager of their account (see get_nonce_manager()), so several
+        transactions can be in flight at once.  Only enable this if no other
+        process or wallet sends transactions from the same accounts.
+        """
+        if not self._nonce_manager_enabled:
+            self._nonce_manager_enabled = True
+            self._configure_contracts(*self._contracts())
+
+    #: Shared contract read cache (see enable_read_cache())
+    read_cache = property(lambda self: self._read_cache)
+    _read_cache: Optional[ReadCache]
+
+    async def enable_read_cache(
+        self,
+        maxsize: int = 1024,
+        ttl: Optional[Dict[str, Optional[float]]] = None,
+    ) -> ReadCache:
+        """Cache contract reads within each block
+
+        Reads by the contract sets and by contracts from get_contract() share
+        one ReadCache, which is invalidated on each new block seen by the listener.
+
+        Args:
+            maxsize: Maximum number of cached reads
+            ttl: Per-function cache lifetime overrides in seconds (None caches forever)
+        """
+        if self._read_cache is None:
+            self._read_cache = ReadCache(maxsize=maxsize, ttl=ttl)
+            await self._read_cache.attach(self.listener)
+            self._configure_contracts(*self._contracts())
+
+        return self._read_cache
+
+    #: Shared transaction receipt tracker (see enable_receipt_tracker())
+    receipt_tracker = property(lambda self: self._receipt_tracker)
+    _receipt_tracker: Optional[ReceiptTracker]
+
+    async def enable_receipt_tracker(self, timeout: float = 360.0) -> ReceiptTracker:
+        """Confirm transactions on new blocks instead of polling for receipts
+
+        Transactions sent by the contract sets and by contracts from get_contract()
+        are confirmed by one ReceiptTracker, which looks up all pending receipts
+        in a single batch on each new block seen by the listener.
+
+        Args:
+            timeout: Default seconds to wait for a receipt
+        """
+        if self._receipt_tracker is None:
+            self._receipt_tracker = ReceiptTracker(self.endpoint, timeout=timeout)
+            await self._receipt_tracker.attach(self.listener)
+            self._configure_contracts(*self._contracts())
+
+        return self._receipt_tracker
+
+    #: Shared gas estimate cache (see enable_gas_cache())
+    gas_cache = property(lambda self: self._gas_cache)
+    _gas_cache: Optional[GasEstimateCache]
+
+    def enable_gas_cache(
+        self,
+        margin: float = 1.2,
+        window: int = 10,
+        refresh_interval: float = 60.0,
+    ) -> GasEstimateCache:
+        """Reuse recent gas estimates for transactions without a gas limit
+
+        Args:
+            margin: Multiplier applied to the largest recent estimate
+            window: Number of recent estimates kept per function and argument sizes
+            refresh_interval: Seconds after which estimates are refreshed in the background
+        """
+        if self._gas_cache is None:
+            self._gas_cache = GasEstimateCache(margin=margin, window=window, refresh_interval=refresh_interval)
+            self._configure_contracts(*self._contracts())
+
+        return self._gas_cache
+
     #: User-specified account name
     account_name = property(lambda self: self._account_name)
     _account_name: Optional[str] = None
@@ -229,6 +352,8 @@ class TelliotCore:
             connected = self._endpoint.connect()
             if not connected:
                 raise Exception(f"Could not connect to endpoint: {self._endpoint.url}")
+            if self._session_manager.is_open:
+                self._endpoint.use_session(self.shared_session)
 
         return self._endpoint
 
@@ -255,6 +380,11 @@ class TelliotCore:
         self._tellorx = None
         self._tellorflex = None
         self._tellor360 = None
+        self._read_cache = None
+        self._receipt_tracker = None
+        self._gas_cache = None
+        self._nonce_managers = {}
+        self._nonce_manager_enabled = False
 
         loglevel = LOGLEVEL_MAP[self._config.main.loglevel]
         self._log = init_logging(loglevel)
@@ -285,6 +415,8 @@ class TelliotCore:
             raise RuntimeError("Cannot start tellor-core application.  No account found.")
 
         await self._session_manager.open()
+        if self._endpoint:
+            self._endpoint.use_session(self.shared_session)
 
         msg = f"Connected to {NETWORKS[chain_id]} [default account: {account.name}], time: {datetime.now()}"
         self.log.info(msg)
@@ -322,7 +454,7 @@ class TelliotCore:
         if not account:
             account = self.get_account()
 
-        entries = contract_directory.find(org=org, name=name, address=address, chain_id=resolved_chain_id)
+        entries = get_contract_directory().find(org=org, name=name, address=address, chain_id=resolved_chain_id)
         if len(entries) > 1:
             raise Exception("More than one contract found.")
         elif len(entries) == 0:
@@ -344,6 +476,7 @@ class TelliotCore:
             account=account,
         )
         contract.connect()
+        self._configure_contracts(contract)
         return contract
 
     def get_account(
@@ -382,6 +515,7 @@ class TelliotCore:
 
         # Release/close endpoint
         if self._endpoint:
+            self._endpoint.use_session(None)
             self._endpoint = None
 
         # SHut down listeners
@@ -22,6 +22,11 @@ class ClientSessionManager:
 
     _session: Optional[aiohttp.ClientSession]
 
+    @property
+    def is_open(self) -> bool:
+        """True if the client session exists and is not closed"""
+        return self._session is not None and not self._session.closed
+
     def __init__(self) -> None:
         self._session = None
 
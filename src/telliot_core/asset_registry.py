@@ -1,14 +1,18 @@
+import functools
 import json
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 from typing import Dict
 from typing import Optional
+from typing import TYPE_CHECKING
 
 from clamfig import deserialize
 
 from telliot_core.model.base import Base
 from telliot_core.model.tokens import BlockChainAsset
 from telliot_core.utils.home import TELLIOT_CORE_ROOT
+from telliot_core.utils.lazy import load_with_snapshot
 
 
 @dataclass
@@ -40,4 +44,24 @@ class AssetRegistry(Base):
         return self.assets.get(asset_id)
 
 
-asset_registry = AssetRegistry.from_file(TELLIOT_CORE_ROOT / "data/assets.json")
+def load_asset_registry() -> AssetRegistry:
+    """Load the packaged asset registry"""
+    return load_with_snapshot(TELLIOT_CORE_ROOT / "data/assets.json", AssetRegistry.from_file)
+
+
+@functools.lru_cache(maxsize=None)
+def get_asset_registry() -> AssetRegistry:
+    """Packaged asset registry, loaded on first use"""
+    return load_asset_registry()
+
+
+if TYPE_CHECKING:
+    #: Packaged asset registry (see `get_asset_registry`)
+    asset_registry: AssetRegistry
+
+
+def __getattr__(name: str) -> Any:
+    # Load the asset registry when the module attribute is first used
+    if name == "asset_registry":
+        return get_asset_registry()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,3 +1,10 @@
+import asyncio
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import TYPE_CHECKING
+
 import click
 from chained_accounts import ChainedAccount
 from chained_accounts import find_accounts
@@ -5,6 +12,11 @@ from chained_accounts import find_accounts
 from telliot_core.cli.commands.read import get_staker_info
 from telliot_core.cli.utils import async_run
 from telliot_core.cli.utils import cli_config
+from telliot_core.utils.response import ResponseStatus
+
+if TYPE_CHECKING:
+    from telliot_core.contract.contract import Contract
+    from telliot_core.tellor.staker_info import StakerInfo
 
 
 @click.group()
@@ -15,11 +27,70 @@ def account(ctx: click.Context, name: str) -> None:
     ctx.obj["ACCOUNT_NAME"] = name
 
 
+async def get_chain_staker_infos(
+    ctx: click.Context, chain_id: int, accounts: List[ChainedAccount]
+) -> List[Tuple[Optional["StakerInfo"], ResponseStatus]]:
+    """Get the staker info of accounts on one chain with a single batched read"""
+    from telliot_core.apps.core import TelliotCore
+    from telliot_core.directory import get_contract_directory
+    from telliot_core.tellor.staker_info import get_staker_infos
+
+    cfg = cli_config(ctx)
+    cfg.main.chain_id = chain_id
+
+    async with TelliotCore(config=cfg, account_name=accounts[0].name) as core:
+        contract: "Contract"
+        if get_contract_directory().get("tellor360-oracle", chain_id=chain_id):
+            contract = core.get_tellor360_contracts().oracle
+        elif get_contract_directory().get("tellorflex-oracle", chain_id=chain_id):
+            contract = core.get_tellorflex_contracts().oracle
+        else:
+            contract = core.get_tellorx_contracts().master
+        return await get_staker_infos(contract, [acc.address for acc in accounts])
+
+
+async def report_all_accounts(ctx: click.Context) -> None:
+    """Print the staker status of all accounts on all of their chains"""
+    accounts_by_chain: Dict[int, List[ChainedAccount]] = {}
+    for acc in find_accounts():
+        for chain_id in acc.chains:
+            accounts_by_chain.setdefault(chain_id, []).append(acc)
+
+    if not accounts_by_chain:
+        print("No accounts found.")
+        return
+
+    chains = sorted(accounts_by_chain.items())
+    results = await asyncio.gather(
+        *(get_chain_staker_infos(ctx, chain_id, accounts) for chain_id, accounts in chains), return_exceptions=True
+    )
+
+    for (chain_id, accounts), result in zip(chains, results):
+        if isinstance(result, BaseException):
+            print(f"Chain {chain_id}: failed to retrieve account status ({result!r})")
+            continue
+        for acc, (info, status) in zip(accounts, result):
+            if info is None:
+                print(f"{acc.name} on chain {chain_id}: failed to retrieve account status ({status.error})")
+                continue
+            msg = f"{acc.name} ({info.address}) on chain {chain_id}: {info.status}"
+            if info.status != "NotStaked":
+                msg += f", staked on {info.date_staked} ({info.date_staked.age} ago)"
+            if info.staked_balance:
+                msg += f", {info.staked_balance / 1e18} TRB"
+            print(msg)
+
+
 @account.command()
+@click.option("--all", "all_accounts", is_flag=True, help="Report all accounts on all of their chains.")
 @click.pass_context
 @async_run
-async def status(ctx: click.Context) -> None:
+async def status(ctx: click.Context, all_accounts: bool) -> None:
     """Get on-chain staker status."""
+    if all_accounts:
+        await report_all_accounts(ctx)
+        return
+
     cfg = cli_config(ctx)
     account_name = ctx.obj["ACCOUNT_NAME"]
     if account_name:
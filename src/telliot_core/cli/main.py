@@ -3,17 +3,111 @@
 A simple interface for interacting with telliot_core's functionality.
 Configure telliot_core's settings via this interface's command line flags
 or in the configuration file.
+
+Subcommands are imported only when invoked, so that e.g. `--version` and
+`--help` do not import web3 and the contract wrappers.
 """
+import importlib
+import time
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
 import click
 
-from telliot_core.cli.commands.account import account
-from telliot_core.cli.commands.config import config
-from telliot_core.cli.commands.listen import listen
-from telliot_core.cli.commands.read import read
-from telliot_core.utils.versions import show_telliot_versions
+from telliot_core.cli.profile import ImportProfiler
+
+
+class LazyGroup(click.Group):
+    """Click group that imports its subcommands on first use
+
+    Args:
+        lazy_commands: Maps command names to "module:attribute" import paths
+        lazy_help: Short help of the lazy commands, listed by `--help`
+            without importing them
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        lazy_commands: Optional[Dict[str, str]] = None,
+        lazy_help: Optional[Dict[str, str]] = None,
+        **kwargs: Any,
+    ):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands or {}
+        self.lazy_help = lazy_help or {}
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            module_name, attr = self.lazy_commands[cmd_name].split(":")
+            command = getattr(importlib.import_module(module_name), attr)
+            self.add_command(command, cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        rows = []
+        for cmd_name in self.list_commands(ctx):
+            if cmd_name not in self.commands and cmd_name in self.lazy_help:
+                rows.append((cmd_name, self.lazy_help[cmd_name]))
+                continue
+            command = self.get_command(ctx, cmd_name)
+            if command is not None and not command.hidden:
+                rows.append((cmd_name, command.get_short_help_str(formatter.width - 6 - len(cmd_name))))
+
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+
+def start_profiler(ctx: click.Context, param: click.Parameter, value: bool) -> None:
+    """Start timing imports before the subcommand is loaded"""
+    if value and not ctx.resilient_parsing:
+        ctx.meta["import_profiler"] = ImportProfiler()
+        ctx.meta["import_profiler"].start()
+
 
+def report_startup(ctx: click.Context) -> None:
+    """Report import times and the configuration load time
 
-@click.group(invoke_without_command=True)
+    Called when the command finishes, so that the imports deferred to the
+    subcommand (e.g. of TelliotCore in `cli_core`) are included.
+    """
+    profiler: ImportProfiler = ctx.meta["import_profiler"]
+
+    # Importing the config module is included in the import report
+    from telliot_core.apps.telliot_config import TelliotConfig
+
+    profiler.stop()
+
+    start = time.perf_counter()
+    TelliotConfig()
+    config_time = time.perf_counter() - start
+
+    click.echo(profiler.report(), err=True)
+    click.echo(f"Loaded configuration in {config_time * 1e3:.1f} ms", err=True)
+
+
+@click.group(
+    cls=LazyGroup,
+    invoke_without_command=True,
+    lazy_commands={
+        "config": "telliot_core.cli.commands.config:config",
+        "read": "telliot_core.cli.commands.read:read",
+        "account": "telliot_core.cli.commands.account:account",
+        "listen": "telliot_core.cli.commands.listen:listen",
+    },
+    lazy_help={
+        "config": "Manage Telliot configuration.",
+        "read": "Read on-chain TellorX contracts.",
+        "account": "Manage Telliot stakers.",
+        "listen": "Listen for Tellor network events.",
+    },
+)
 @click.pass_context
 @click.option(
     "--chain_id",
@@ -26,23 +120,30 @@ from telliot_core.utils.versions import show_telliot_versions
     help="Runs command with test configuration (developer use only)",
 )
 @click.option("--version", is_flag=True, help="Display telliot-core version and exit.")
+@click.option(
+    "--profile-startup",
+    is_flag=True,
+    is_eager=True,
+    expose_value=False,
+    callback=start_profiler,
+    help="Report module import times and configuration load time.",
+)
 def main(ctx: click.Context, version: bool, chain_id: int, test_config: bool) -> None:
     ctx.ensure_object(dict)
     ctx.obj["CHAIN_ID"] = chain_id
     ctx.obj["TEST_CONFIG"] = test_config
+    if "import_profiler" in ctx.meta:
+        ctx.call_on_close(lambda: report_startup(ctx))
     if version:
+        from telliot_core.utils.versions import show_telliot_versions
+
         show_telliot_versions()
         return
 
     """Telliot command line interface"""
-    if ctx.invoked_subcommand is None:
+    if ctx.invoked_subcommand is None and "import_profiler" not in ctx.meta:
         print(ctx.command.get_help(ctx))
 
 
-main.add_command(config)
-main.add_command(read)
-main.add_command(account)
-main.add_command(listen)
-
 if __name__ == "__main__":
     main()
@@ -0,0 +1,138 @@
+"""
+Startup profiling for the telliot CLI
+
+`ImportProfiler` times every module imported while it is active, similar
+to `python -X importtime`, but can be switched on from a command line flag.
+Only the standard library is imported here, so that profiling does not
+change what it measures.
+"""
+import importlib.abc
+import importlib.machinery
+import sys
+import time
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Any
+from typing import Callable
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+
+@dataclass
+class ImportTiming:
+    """Import time of a single module"""
+
+    #: Module name
+    name: str
+
+    #: Seconds spent executing the module, excluding nested imports
+    self_time: float
+
+    #: Seconds spent executing the module, including nested imports
+    cumulative_time: float
+
+    #: Import nesting level (0 for modules imported directly)
+    depth: int
+
+
+class _TimedLoader(importlib.abc.Loader):
+    """Wraps a module loader to time `exec_module`"""
+
+    def __init__(self, loader: importlib.abc.Loader, profiler: "ImportProfiler"):
+        self._loader = loader
+        self._profiler = profiler
+
+    def create_module(self, spec: importlib.machinery.ModuleSpec) -> Optional[ModuleType]:
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module: ModuleType) -> None:
+        self._profiler._timed(module.__name__, lambda: self._loader.exec_module(module))
+
+    def __getattr__(self, name: str) -> Any:
+        # Forward resource readers, get_source, etc. to the wrapped loader
+        return getattr(self._loader, name)
+
+
+class ImportProfiler(importlib.abc.MetaPathFinder):
+    """Records the import time of each module imported while active
+
+    Usage::
+
+        with ImportProfiler() as profiler:
+            import web3
+        print(profiler.report())
+    """
+
+    def __init__(self) -> None:
+        self.timings: List[ImportTiming] = []
+        self._stack: List[float] = []
+        self._finding: set[str] = set()
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Optional[Sequence[str]],
+        target: Optional[ModuleType] = None,
+    ) -> Optional[importlib.machinery.ModuleSpec]:
+        # Let the other finders locate the module, then wrap its loader
+        if fullname in self._finding:
+            return None
+        self._finding.add(fullname)
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._finding.discard(fullname)
+
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, self)
+        return spec
+
+    def _timed(self, name: str, exec_module: Callable[[], None]) -> None:
+        depth = len(self._stack)
+        self._stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            exec_module()
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += elapsed
+            self.timings.append(ImportTiming(name, elapsed - nested, elapsed, depth))
+
+    def start(self) -> None:
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def stop(self) -> None:
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def __enter__(self) -> "ImportProfiler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    @property
+    def total_time(self) -> float:
+        """Seconds spent importing modules directly, including nested imports"""
+        return sum(t.cumulative_time for t in self.timings if t.depth == 0)
+
+    def report(self, limit: int = 20) -> str:
+        """Table of the slowest modules by cumulative import time"""
+        lines = [f"{'cumulative [ms]':>15} | {'self [ms]':>9} | module"]
+        slowest = sorted(self.timings, key=lambda t: t.cumulative_time, reverse=True)[:limit]
+        for t in slowest:
+            lines.append(f"{t.cumulative_time * 1e3:15.1f} | {t.self_time * 1e3:9.1f} | {t.name}")
+        lines.append(f"Imported {len(self.timings)} modules in {self.total_time * 1e3:.1f} ms")
+        return "\n".join(lines)
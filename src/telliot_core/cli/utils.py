@@ -3,14 +3,17 @@ from functools import wraps
 from typing import Any
 from typing import Callable
 from typing import Coroutine
+from typing import TYPE_CHECKING
 from typing import TypeVar
 
 import click
 
-from telliot_core.apps.core import TelliotCore
 from telliot_core.apps.telliot_config import override_test_config
 from telliot_core.apps.telliot_config import TelliotConfig
 
+if TYPE_CHECKING:
+    from telliot_core.apps.core import TelliotCore
+
 F = TypeVar("F", bound=Callable[..., Coroutine[Any, Any, Any]])
 
 
@@ -39,11 +42,13 @@ def cli_config(ctx: click.Context) -> TelliotConfig:
     return cfg
 
 
-def cli_core(ctx: click.Context) -> TelliotCore:
+def cli_core(ctx: click.Context) -> "TelliotCore":
     """Returns a TelliotCore configured with the CLI context
 
     The returned object should be used as a context manager for CLI commands
     """
+    from telliot_core.apps.core import TelliotCore
+
     account_name = ctx.obj.get("ACCOUNT_NAME", None)
 
     cfg = cli_config(ctx)
@@ -0,0 +1,161 @@
+"""
+Process-wide registry of precompiled contract ABIs
+
+Parsing an ABI and resolving functions by name are repeated for every
+`Contract` instance with web3 alone.  `compile_abi` parses each distinct ABI
+once, keyed by its hash, into selectors, codec types and event topics, and
+`contract_factory` shares one web3 contract class per ABI and connection.
+Compiled ABIs are only held weakly by the registry, so ABIs fetched at run
+time are released together with the last contract using them.
+"""
+import hashlib
+import json
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Type
+from typing import Union
+
+from eth_typing import ABIEvent
+from eth_typing import ABIFunction
+from eth_utils.abi import event_abi_to_log_topic
+from eth_utils.abi import function_abi_to_4byte_selector
+from eth_utils.abi import get_abi_input_types
+from eth_utils.abi import get_abi_output_types
+
+
+@dataclass(frozen=True)
+class FunctionInfo:
+    """Precompiled ABI metadata of a contract function"""
+
+    name: str
+    abi: ABIFunction
+    selector: bytes
+    input_types: List[str]
+    output_types: List[str]
+
+
+@dataclass(frozen=True)
+class EventInfo:
+    """Precompiled ABI metadata of a contract event"""
+
+    name: str
+    abi: ABIEvent
+    topic: bytes
+
+
+@dataclass(frozen=True, eq=False)
+class CompiledAbi:
+    """Precompiled ABI, shared by all contracts with the same ABI"""
+
+    abi_hash: str
+    abi: List[Dict[str, Any]]
+
+    #: Functions by name (names of overloaded functions are excluded)
+    functions: Dict[str, FunctionInfo]
+
+    #: Functions by 4-byte selector
+    selectors: Dict[bytes, FunctionInfo]
+
+    #: Events by name and by topic hash
+    events: Dict[str, EventInfo]
+    topics: Dict[bytes, EventInfo]
+
+    def function(self, name: str) -> FunctionInfo:
+        """Look up a function by name
+
+        Raises ValueError if the function is not found (or overloaded),
+        the same as web3's `get_function_by_name`.
+        """
+        try:
+            return self.functions[name]
+        except KeyError:
+            raise ValueError(f"Could not find a distinct function named '{name}' in the contract ABI")
+
+
+_lock = threading.Lock()
+_compiled: "weakref.WeakValueDictionary[str, CompiledAbi]" = weakref.WeakValueDictionary()
+
+#: Attribute of a web3 connection holding its contract classes by compiled ABI
+_FACTORIES_ATTR = "_telliot_contract_factories"
+
+
+def abi_hash(abi: Union[List[Dict[str, Any]], str]) -> str:
+    """Hash of the canonical JSON encoding of an ABI"""
+    if isinstance(abi, str):
+        abi = json.loads(abi)
+    content = json.dumps(abi, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def compile_abi(abi: Union[List[Dict[str, Any]], str]) -> CompiledAbi:
+    """Get or create the precompiled form of an ABI"""
+    if isinstance(abi, str):
+        return compile_abi(json.loads(abi))
+
+    key = abi_hash(abi)
+    compiled = _compiled.get(key)
+    if compiled is not None:
+        return compiled
+
+    functions: Dict[str, FunctionInfo] = {}
+    selectors: Dict[bytes, FunctionInfo] = {}
+    overloaded = set()
+    events: Dict[str, EventInfo] = {}
+    topics: Dict[bytes, EventInfo] = {}
+
+    for element in abi:
+        if element.get("type") == "function":
+            fn_abi: ABIFunction = element  # type: ignore
+            info = FunctionInfo(
+                name=fn_abi["name"],
+                abi=fn_abi,
+                selector=function_abi_to_4byte_selector(fn_abi),
+                input_types=get_abi_input_types(fn_abi),
+                output_types=get_abi_output_types(fn_abi),
+            )
+            selectors[info.selector] = info
+            if info.name in functions:
+                overloaded.add(info.name)
+            functions[info.name] = info
+        elif element.get("type") == "event":
+            event_abi: ABIEvent = element  # type: ignore
+            event = EventInfo(name=event_abi["name"], abi=event_abi, topic=event_abi_to_log_topic(event_abi))
+            events[event.name] = event
+            topics[event.topic] = event
+
+    for name in overloaded:
+        del functions[name]
+
+    compiled = CompiledAbi(
+        abi_hash=key,
+        abi=abi,
+        functions=functions,
+        selectors=selectors,
+        events=events,
+        topics=topics,
+    )
+    with _lock:
+        return _compiled.setdefault(key, compiled)
+
+
+def contract_factory(w3: Any, compiled: CompiledAbi) -> Type[Any]:
+    """Get or create the web3 contract class for an ABI on a (sync or async) connection
+
+    The contract classes refer to their connection, so they are stored on the
+    connection object itself and released together with it.
+    """
+    with _lock:
+        factories: "Optional[weakref.WeakKeyDictionary[CompiledAbi, Type[Any]]]" = getattr(w3, _FACTORIES_ATTR, None)
+        if factories is None:
+            factories = weakref.WeakKeyDictionary()
+            setattr(w3, _FACTORIES_ATTR, factories)
+        factory = factories.get(compiled)
+        if factory is None:
+            factory = w3.eth.contract(abi=compiled.abi)
+            factories[compiled] = factory
+        return factory
@@ -0,0 +1,177 @@
+"""
+JSON-RPC batching transport for async Web3 connections
+
+Requests issued in the same event loop iteration (or within a short,
+configurable window) are coalesced into a single JSON-RPC batch and sent
+in one HTTP request.  Responses are matched back to callers by request id.
+"""
+import asyncio
+import logging
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import Union
+
+from web3 import AsyncHTTPProvider
+from web3.types import RPCEndpoint
+from web3.types import RPCResponse
+
+logger = logging.getLogger(__name__)
+
+PendingRequest = Tuple[Dict[str, Any], "asyncio.Future[RPCResponse]"]
+
+#: Error messages of nodes that do not accept JSON-RPC batches
+BATCH_NOT_SUPPORTED = (
+    "batch requests not supported",
+    "batch requests are not supported",
+    "batch request not supported",
+    "batching not supported",
+    "batch not supported",
+    "batch requests are disabled",
+)
+
+
+def _error_response(request_id: Any, message: str) -> RPCResponse:
+    """JSON-RPC error response for a request that got no answer"""
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": -32603, "message": message}}
+
+
+class BatchingHTTPProvider(AsyncHTTPProvider):
+    """AsyncHTTPProvider that coalesces concurrent requests into JSON-RPC batches
+
+    Args:
+        endpoint_uri:
+            JSON-RPC HTTP URL
+        batch_window:
+            Seconds to wait for more requests before sending a batch.
+            With 0, only requests issued in the same event loop iteration are batched.
+        max_batch_size:
+            A batch is sent as soon as it holds this many requests.
+        batch_retry_delay:
+            Seconds to send single requests after a failed batch (e.g. rate
+            limited) before batching again.
+
+    If the node rejects batch requests as not supported, the provider falls
+    back to sending one request at a time.
+    """
+
+    def __init__(
+        self,
+        endpoint_uri: Optional[str] = None,
+        batch_window: float = 0.0,
+        max_batch_size: int = 100,
+        batch_retry_delay: float = 30.0,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(endpoint_uri, **kwargs)
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.batch_retry_delay = batch_retry_delay
+
+        #: Number of HTTP requests sent (a batch counts as one)
+        self.http_request_count = 0
+
+        self._pending: List[PendingRequest] = []
+        self._flush_handle: Optional[asyncio.Handle] = None
+        self._tasks: Set["asyncio.Task[None]"] = set()
+        self._batching_supported = True
+        self._batching_paused_until = 0.0
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        """Queue a request for the next batch and wait for its response"""
+        loop = asyncio.get_running_loop()
+        if not self._batching_supported or loop.time() < self._batching_paused_until:
+            return await self._send_single(self.form_request(method, params))  # type: ignore
+
+        future: "asyncio.Future[RPCResponse]" = loop.create_future()
+        self._pending.append((self.form_request(method, params), future))  # type: ignore
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            if self.batch_window > 0:
+                self._flush_handle = loop.call_later(self.batch_window, self._flush)
+            else:
+                self._flush_handle = loop.call_soon(self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        """Send all pending requests in a background task"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        task = asyncio.create_task(self._send_batch(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _post(self, request_data: bytes) -> Union[RPCResponse, List[RPCResponse]]:
+        """POST raw JSON-RPC data using the cached session"""
+        assert self.endpoint_uri is not None
+        self.http_request_count += 1
+        raw_response = await self._request_session_manager.async_make_post_request(
+            self.endpoint_uri, request_data, **self.get_request_kwargs()
+        )
+        return self.decode_rpc_response(raw_response)
+
+    async def _send_single(self, request: Dict[str, Any]) -> RPCResponse:
+        response = await self._post(self.encode_rpc_dict(request))  # type: ignore
+        assert not isinstance(response, list)
+        return response
+
+    async def _send_batch(self, pending: List[PendingRequest]) -> None:
+        """Send a batch and resolve each caller's future with its response"""
+        try:
+            if len(pending) == 1:
+                request, future = pending[0]
+                if not future.done():
+                    future.set_result(await self._send_single(request))
+                return
+
+            request_data = b"[" + b",".join(self.encode_rpc_dict(r) for r, _ in pending) + b"]"  # type: ignore
+            logger.debug(f"Sending JSON-RPC batch of {len(pending)} requests to {self.endpoint_uri}")
+            response = await self._post(request_data)
+
+            if not isinstance(response, list):
+                # The batch failed as a whole (single error object): resend the requests one by one
+                error = str(response.get("error", response)).lower()
+                if any(m in error for m in BATCH_NOT_SUPPORTED):
+                    logger.warning(f"JSON-RPC batches not supported by {self.endpoint_uri}: {response}")
+                    self._batching_supported = False
+                else:
+                    logger.warning(
+                        f"JSON-RPC batch failed on {self.endpoint_uri}, "
+                        f"sending single requests for {self.batch_retry_delay} s: {response}"
+                    )
+                    self._batching_paused_until = asyncio.get_running_loop().time() + self.batch_retry_delay
+                results = await asyncio.gather(*[self._send_single(r) for r, _ in pending], return_exceptions=True)
+                for (_, future), result in zip(pending, results):
+                    if future.done():
+                        continue
+                    if isinstance(result, BaseException):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
+                return
+
+            responses = {r.get("id"): r for r in response}
+            for request, future in pending:
+                if future.done():
+                    continue
+                rpc_response = responses.get(request["id"])
+                if rpc_response is None:
+                    rpc_response = _error_response(request["id"], "No response in JSON-RPC batch")
+                future.set_result(rpc_response)
+
+        except Exception as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
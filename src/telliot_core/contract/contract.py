@@ -3,18 +3,34 @@ Utils for connecting to an EVM contract
 """
 import asyncio
 import logging
+from dataclasses import dataclass
 from typing import Any
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Sequence
 from typing import Tuple
 from typing import Union
 
 from chained_accounts import ChainedAccount
 from eth_typing.evm import ChecksumAddress
 from eth_utils.address import to_checksum_address
+from hexbytes import HexBytes
+from web3.contract import AsyncContract
+from web3.contract import Contract as Web3Contract
 from web3.datastructures import AttributeDict
 
+from telliot_core.contract.abi_registry import compile_abi
+from telliot_core.contract.abi_registry import CompiledAbi
+from telliot_core.contract.abi_registry import contract_factory
+from telliot_core.contract.gas_cache import GasEstimateCache
+from telliot_core.contract.gas_cache import GasKey
+from telliot_core.contract.multicall import MulticallBatch
+from telliot_core.contract.nonce_manager import is_nonce_error
+from telliot_core.contract.nonce_manager import NonceManager
+from telliot_core.contract.read_cache import CacheKey
+from telliot_core.contract.read_cache import ReadCache
+from telliot_core.contract.receipt_tracker import ReceiptTracker
 from telliot_core.model.endpoints import RPCEndpoint
 from telliot_core.utils.key_helpers import lazy_key_getter
 from telliot_core.utils.response import error_status
@@ -23,6 +39,47 @@ from telliot_core.utils.response import ResponseStatus
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class PendingTransaction:
+    """A broadcast transaction awaiting confirmation"""
+
+    func_name: str
+    tx_hash: HexBytes
+    nonce: int
+
+    #: Resolves to the transaction receipt once the transaction is mined
+    receipt: "asyncio.Future[AttributeDict[Any, Any]]"
+
+    explorer: Optional[str] = None
+
+    @property
+    def url(self) -> str:
+        return f"{self.explorer}/tx/{self.tx_hash.hex()}"
+
+    async def wait(self) -> Tuple[Optional[AttributeDict[Any, Any]], ResponseStatus]:
+        """Wait for the transaction receipt and check the transaction status"""
+
+        status = ResponseStatus()
+
+        try:
+            # Confirm transaction
+            tx_receipt = await self.receipt
+
+            if tx_receipt["status"] == 1:
+                logger.info(f"{self.func_name} transaction succeeded. ({self.url})")
+                return tx_receipt, status
+
+            elif tx_receipt["status"] == 0:
+                msg = f"{self.func_name} transaction reverted. ({self.url})"
+                return tx_receipt, error_status(msg, log=logger.error)
+
+            return tx_receipt, status
+
+        except Exception as e:
+            note = "Failed to confirm transaction"
+            return None, error_status(note, log=logger.error, e=e)
+
+
 class Contract:
     """Convenience wrapper for connecting to an Ethereum contract"""
 
@@ -37,21 +94,87 @@ class Contract:
         self.address = to_checksum_address(address)
         self.abi = abi
         self.node = node
-        self.contract = None
+        self.contract: Optional[Web3Contract] = None
+        self.async_contract: Optional[AsyncContract] = None
+
+        self._compiled_abi: Optional[CompiledAbi] = None
+        self._functions: Dict[str, Any] = {}
+        self._async_functions: Dict[str, Any] = {}
         self.account = account
         self._private_key: Optional[bytes] = None
 
+        #: Optional cache for read results (see ReadCache)
+        self.read_cache: Optional[ReadCache] = None
+
+        #: Optional local nonce source for transactions (see NonceManager)
+        self.nonce_manager: Optional[NonceManager] = None
+
+        #: Optional block-driven receipt lookups for transactions (see ReceiptTracker)
+        self.receipt_tracker: Optional[ReceiptTracker] = None
+
+        #: Optional cache of recent gas estimates for transactions (see GasEstimateCache)
+        self.gas_cache: Optional[GasEstimateCache] = None
+
+    @property
+    def compiled_abi(self) -> CompiledAbi:
+        """Precompiled ABI shared by all contracts with the same ABI
+
+        Compiled on first use; raises an exception if the ABI is malformed.
+        """
+        if self._compiled_abi is None:
+            self._compiled_abi = compile_abi(self.abi)
+        return self._compiled_abi
+
     def connect(self) -> ResponseStatus:
         """Connect to EVM contract through an RPC Endpoint"""
 
+        try:
+            compiled_abi = self.compiled_abi
+        except Exception as e:
+            msg = "invalid contract abi"
+            return ResponseStatus(ok=False, e=e, error=msg)
+
         if not self.node.web3:
             msg = "node is not instantiated"
             return ResponseStatus(ok=False, error=msg)
 
         self.node.connect()
-        self.contract = self.node.web3.eth.contract(address=self.address, abi=self.abi)
+        self.contract = contract_factory(self.node.web3, compiled_abi)(address=self.address)
+        self.async_contract = None
+        self._functions = {}
         return ResponseStatus(ok=True)
 
+    async def get_async_contract(self) -> AsyncContract:
+        """Get or create the contract on the endpoint's async connection"""
+
+        async_web3 = await self.node.connect_async()
+        if self.async_contract is None or self.async_contract.w3 is not async_web3:
+            self.async_contract = contract_factory(async_web3, self.compiled_abi)(address=self.address)
+            self._async_functions = {}
+
+        return self.async_contract
+
+    def get_function(self, func_name: str) -> Any:
+        """Look up a function of the connected contract by name
+
+        Raises ValueError if the function is not in the contract ABI.
+        """
+        function = self._functions.get(func_name)
+        if function is None:
+            assert self.contract is not None
+            self.compiled_abi.function(func_name)
+            function = self._functions[func_name] = self.contract.get_function_by_name(func_name)
+        return function
+
+    async def get_async_function(self, func_name: str) -> Any:
+        """Look up a function of the contract on the async connection by name"""
+        async_contract = await self.get_async_contract()
+        function = self._async_functions.get(func_name)
+        if function is None:
+            self.compiled_abi.function(func_name)
+            function = self._async_functions[func_name] = async_contract.get_function_by_name(func_name)
+        return function
+
     async def read(self, func_name: str, *args: Any, **kwargs: Any) -> Tuple[Any, ResponseStatus]:
         """
         Reads data from contract
@@ -63,9 +186,19 @@ class Contract:
         """
 
         if self.contract:
+            cache_key = None
+            if self.read_cache is not None:
+                cache_key = self.read_cache.key(self.address, func_name, args, kwargs)
+                if cache_key is not None:
+                    hit, output = self.read_cache.get(cache_key)
+                    if hit:
+                        return output, ResponseStatus(ok=True)
+
             try:
-                contract_function = self.contract.get_function_by_name(func_name)
-                output = contract_function(*args, **kwargs).call()
+                contract_function = await self.get_async_function(func_name)
+                output = await contract_function(*args, **kwargs).call()
+                if self.read_cache is not None and cache_key is not None:
+                    self.read_cache.set(cache_key, output)
                 return output, ResponseStatus(ok=True)
             except ValueError as e:
                 msg = f"function '{func_name}' not found in contract abi"
@@ -80,6 +213,42 @@ class Contract:
             msg = "no instance of contract"
             return None, ResponseStatus(ok=False, error=msg)
 
+    async def read_many(self, calls: Sequence[Tuple[str, Dict[str, Any]]]) -> List[Tuple[Any, ResponseStatus]]:
+        """
+        Reads several functions from contract with a single Multicall3 request
+        inputs:
+        calls (list): (func_name, kwargs) pairs, one per read
+
+        returns:
+        list: (value, ResponseStatus) pairs, in the same order as calls
+
+        Cached reads (see ReadCache) are answered without a request.  On chains
+        without Multicall3, the functions are read one by one.
+        """
+
+        results: List[Tuple[Any, ResponseStatus]] = [(None, ResponseStatus()) for _ in calls]
+        batch = MulticallBatch(self.node)
+        batched: List[Tuple[int, Optional[CacheKey]]] = []
+        for i, (func_name, kwargs) in enumerate(calls):
+            cache_key = None
+            if self.read_cache is not None:
+                cache_key = self.read_cache.key(self.address, func_name, (), kwargs)
+                if cache_key is not None:
+                    hit, output = self.read_cache.get(cache_key)
+                    if hit:
+                        results[i] = output, ResponseStatus(ok=True)
+                        continue
+            batch.add(self, func_name, **kwargs)
+            batched.append((i, cache_key))
+
+        if batched:
+            for (i, cache_key), (output, status) in zip(batched, await batch.execute()):
+                if status.ok and self.read_cache is not None and cache_key is not None:
+                    self.read_cache.set(cache_key, output)
+                results[i] = output, status
+
+        return results
+
     @property
     def private_key(self) -> bytes:
 
@@ -92,9 +261,9 @@ class Contract:
         self,
         func_name: str,
         gas_limit: int,
-        legacy_gas_price: Optional[int] = None,
-        max_priority_fee_per_gas: Optional[int] = None,
-        max_fee_per_gas: Optional[int] = None,
+        legacy_gas_price: Optional[float] = None,
+        max_priority_fee_per_gas: Optional[float] = None,
+        max_fee_per_gas: Optional[float] = None,
         acc_nonce: Optional[int] = None,
         **kwargs: Any,
     ) -> Tuple[Optional[AttributeDict[Any, Any]], ResponseStatus]:
@@ -104,6 +273,42 @@ class Contract:
 
         """
 
+        pending_tx, status = await self.send(
+            func_name=func_name,
+            gas_limit=gas_limit,
+            legacy_gas_price=legacy_gas_price,
+            max_priority_fee_per_gas=max_priority_fee_per_gas,
+            max_fee_per_gas=max_fee_per_gas,
+            acc_nonce=acc_nonce,
+            **kwargs,
+        )
+
+        if pending_tx is None:
+            return None, status
+
+        return await pending_tx.wait()
+
+    async def send(
+        self,
+        func_name: str,
+        gas_limit: int,
+        legacy_gas_price: Optional[float] = None,
+        max_priority_fee_per_gas: Optional[float] = None,
+        max_fee_per_gas: Optional[float] = None,
+        acc_nonce: Optional[int] = None,
+        **kwargs: Any,
+    ) -> Tuple[Optional[PendingTransaction], ResponseStatus]:
+        """Build, sign and broadcast a contract transaction without waiting for confirmation
+
+        Takes the same arguments as `write()`.  If the contract has a nonce
+        manager and no nonce is given, the nonce is assigned locally, so
+        several transactions from one account can be in flight at once.
+
+        returns:
+            PendingTransaction with a future for the transaction receipt
+
+        """
+
         # Validate inputs
         if (legacy_gas_price is not None) and ((max_fee_per_gas is not None) or (max_priority_fee_per_gas is not None)):
             raise ValueError(
@@ -114,12 +319,6 @@ class Contract:
         if (legacy_gas_price is None) and (max_fee_per_gas is None) and (max_priority_fee_per_gas is None):
             raise ValueError("no gas strategy selected!")
 
-        status = ResponseStatus()
-
-        if not acc_nonce:
-            acc = self.node.web3.eth.account.from_key(self.private_key)
-            acc_nonce = self.node.web3.eth.get_transaction_count(acc.address)
-
         if not self.contract:
             msg = f"Contract.write({func_name}) error: Unable to connect to contract"
             return None, error_status(msg, log=logger.error)
@@ -134,9 +333,20 @@ class Contract:
             msg = f"Contract.write({func_name}) error: Private key missing"
             return None, error_status(msg, log=logger.error)
 
+        # Only nonces reserved from the nonce manager are returned to it
+        reserved = False
+        if acc_nonce is not None:
+            if self.nonce_manager is not None:
+                self.nonce_manager.observe(acc_nonce)
+        elif self.nonce_manager is not None:
+            acc_nonce = await self.nonce_manager.next_nonce()
+            reserved = True
+        else:
+            acc_nonce = self.node.web3.eth.get_transaction_count(acc.address)
+
         try:
             # build transaction
-            contract_function = self.contract.get_function_by_name(func_name)
+            contract_function = self.get_function(func_name)
             transaction = contract_function(**kwargs)
 
             # start tx dict with static elements
@@ -144,13 +354,23 @@ class Contract:
                 "from": acc.address,
                 "nonce": acc_nonce,
             }
-            # Estimate gas_limit if not provided
+            # Estimate gas_limit if not provided, preferably from recent estimates
+            gas_key = None
+            if gas_limit is None and self.gas_cache is not None:
+                gas_key = self.gas_cache.key(self.address, func_name, kwargs)
+                gas_limit = self.gas_cache.get(gas_key)
+                self.gas_cache.refresh(gas_key, lambda: self._estimate_gas(func_name, {"from": acc.address}, kwargs))
+
             if gas_limit is None:
                 try:
-                    gas_limit = transaction.estimate_gas(tx_dict)
+                    gas_limit = await self._estimate_gas(func_name, tx_dict, kwargs)
                 except Exception as e:
+                    if reserved:
+                        self._release_nonce(acc_nonce)
                     msg = f"Contract.write({func_name}) error: Unable to estimate gas"
                     return None, error_status(msg, e=e, log=logger.error)
+                if self.gas_cache is not None and gas_key is not None:
+                    self.gas_cache.record(gas_key, gas_limit)
 
             tx_dict["gas"] = gas_limit
             # use legacy gas strategy if only legacy gas price is provided
@@ -197,33 +417,66 @@ class Contract:
             tx_signed = acc.sign_transaction(built_tx)
 
         except Exception as e:
+            if reserved:
+                self._release_nonce(acc_nonce)
             note = "Failed to build transaction"
             return None, error_status(note, log=logger.error, e=e)
 
         try:
             logger.debug(f"Sending transaction: {func_name}")
-            tx_hash = self.node.web3.eth.send_raw_transaction(tx_signed.raw_transaction)
+            async_web3 = await self.node.connect_async()
+            tx_hash = await async_web3.eth.send_raw_transaction(tx_signed.raw_transaction)
 
         except Exception as e:
+            if self.nonce_manager is not None:
+                if reserved:
+                    self.nonce_manager.handle_error(acc_nonce, e)
+                elif is_nonce_error(e):
+                    self.nonce_manager.invalidate()
             note = "Send transaction failed"
             return None, error_status(note, log=logger.error, e=e)
 
-        try:
-            # Confirm transaction
-            tx_receipt = self.node.web3.eth.wait_for_transaction_receipt(tx_hash, timeout=360)
-
-            tx_url = f"{self.node.explorer}/tx/{tx_hash.hex()}"
-
-            if tx_receipt["status"] == 1:
-                logger.info(f"{func_name} transaction succeeded. ({tx_url})")
-                return tx_receipt, status
-
-            elif tx_receipt["status"] == 0:
-                msg = f"{func_name} transaction reverted. ({tx_url})"
-                return tx_receipt, error_status(msg, log=logger.error)
+        if self.nonce_manager is not None and reserved:
+            self.nonce_manager.confirm(acc_nonce)
+
+        receipt = asyncio.ensure_future(self._wait_for_receipt(tx_hash, gas_key, gas_limit))
+        pending_tx = PendingTransaction(
+            func_name=func_name,
+            tx_hash=HexBytes(tx_hash),
+            nonce=acc_nonce,
+            receipt=receipt,
+            explorer=self.node.explorer,
+        )
+        return pending_tx, ResponseStatus()
+
+    def _release_nonce(self, nonce: int) -> None:
+        """Return an unused nonce to the nonce manager"""
+        if self.nonce_manager is not None:
+            self.nonce_manager.release(nonce)
+
+    async def _estimate_gas(self, func_name: str, tx_dict: Dict[str, Any], kwargs: Dict[str, Any]) -> int:
+        """Estimate the gas used by a contract transaction"""
+        contract_function = await self.get_async_function(func_name)
+        return await contract_function(**kwargs).estimate_gas(tx_dict)  # type: ignore
+
+    async def _wait_for_receipt(
+        self,
+        tx_hash: HexBytes,
+        gas_key: Optional[GasKey] = None,
+        gas_limit: int = 0,
+    ) -> AttributeDict[Any, Any]:
+        """Wait until a transaction is mined
+
+        If the gas limit came from the gas cache, the receipt is checked
+        so that estimates causing reverts or out-of-gas errors are dropped.
+        """
+        if self.receipt_tracker is not None:
+            tx_receipt = await self.receipt_tracker.wait_for_receipt(tx_hash)
+        else:
+            async_web3 = await self.node.connect_async()
+            tx_receipt = await async_web3.eth.wait_for_transaction_receipt(tx_hash, timeout=360)  # type: ignore
 
-            return tx_receipt, status
+        if self.gas_cache is not None and gas_key is not None:
+            self.gas_cache.check_receipt(gas_key, gas_limit, tx_receipt)
 
-        except Exception as e:
-            note = "Failed to confirm transaction"
-            return None, error_status(note, log=logger.error, e=e)
+        return tx_receipt
@@ -0,0 +1,206 @@
+"""
+ABI decoding of contract event logs
+
+An `EventTable` maps the topic0 hash of each event in a set of ABIs to a
+precomputed decoder, so each log message is decoded with a single lookup.
+The default table covers all ABIs packaged in `data/abi`.  Listener
+subscriptions use `EventTable.format_log` as their message formatter (see
+`Listener.subscribe_events`).
+"""
+import json
+import logging
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+from eth_abi import decode
+from eth_utils.abi import get_abi_input_types
+from hexbytes import HexBytes
+from web3._utils.abi import map_abi_data
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+from web3.datastructures import AttributeDict
+
+from telliot_core.contract.abi_registry import compile_abi
+from telliot_core.contract.listener import log_entry_formatter
+from telliot_core.contract.listener import LogEntry
+
+logger = logging.getLogger(__name__)
+
+_abi_folder = Path(__file__).resolve().parent.parent / "data" / "abi"
+
+
+class ContractEvent:
+    """Decoded contract event
+
+    Fields follow web3's processed event logs and can also be read by key.
+    """
+
+    __slots__ = ("event", "args", "address", "blockNumber", "logIndex", "log")
+
+    def __init__(self, event: str, args: AttributeDict[str, Any], log: LogEntry):
+        #: Event name
+        self.event = event
+
+        #: Event arguments by name
+        self.args = args
+
+        #: Address of the emitting contract
+        self.address = log.address
+
+        self.blockNumber = log.blockNumber
+        self.logIndex = log.logIndex
+
+        #: Undecoded log entry
+        self.log = log
+
+    @property
+    def transactionHash(self) -> Optional[HexBytes]:
+        return self.log.transactionHash
+
+    @property
+    def removed(self) -> bool:
+        return self.log.removed
+
+    def __getitem__(self, key: str) -> Any:
+        return getattr(self, key)
+
+    def __repr__(self) -> str:
+        return f"ContractEvent(event={self.event!r}, args={dict(self.args)!r}, blockNumber={self.blockNumber})"
+
+
+def _is_dynamic(abi_type: str) -> bool:
+    """Indexed values of these types are stored as a keccak hash in the topic"""
+    return abi_type in ("string", "bytes") or abi_type.endswith("]") or abi_type.startswith("(")
+
+
+@dataclass(frozen=True)
+class EventDecoder:
+    """Precomputed decoder of one event"""
+
+    name: str
+    topic: bytes
+
+    #: Names and types of indexed arguments, in topic order
+    indexed: Tuple[Tuple[str, str], ...]
+
+    #: Names and types of arguments ABI-encoded in the log data
+    data_names: Tuple[str, ...]
+    data_types: Tuple[str, ...]
+
+    #: Argument names in declaration order
+    arg_names: Tuple[str, ...]
+
+    @classmethod
+    def from_abi(cls, event_abi: Dict[str, Any], topic: bytes) -> "EventDecoder":
+        types = get_abi_input_types(event_abi)  # type: ignore
+        inputs = list(zip(event_abi["inputs"], types))
+        return cls(
+            name=event_abi["name"],
+            topic=topic,
+            indexed=tuple((i["name"], t) for i, t in inputs if i.get("indexed")),
+            data_names=tuple(i["name"] for i, t in inputs if not i.get("indexed")),
+            data_types=tuple(t for i, t in inputs if not i.get("indexed")),
+            arg_names=tuple(i["name"] for i, t in inputs),
+        )
+
+    def decode(self, log: LogEntry) -> ContractEvent:
+        """Decode the arguments of a log entry, with checksummed addresses like web3"""
+        values: Dict[str, Any] = {}
+        for (name, abi_type), topic in zip(self.indexed, log.topics[1:]):
+            if _is_dynamic(abi_type):
+                values[name] = topic
+            else:
+                values[name] = map_abi_data(BASE_RETURN_NORMALIZERS, [abi_type], decode([abi_type], topic))[0]
+        if self.data_types:
+            data = map_abi_data(BASE_RETURN_NORMALIZERS, self.data_types, decode(self.data_types, log.data))
+            values.update(zip(self.data_names, data))
+
+        args = AttributeDict({name: values[name] for name in self.arg_names})
+        return ContractEvent(self.name, args, log)
+
+
+class EventTable:
+    """Event decoders by topic0 hash
+
+    Events with the same signature but different indexed arguments are
+    told apart by their number of topics.
+    """
+
+    def __init__(self) -> None:
+        self._decoders: Dict[Tuple[bytes, int], EventDecoder] = {}
+        self._topics_by_name: Dict[str, List[bytes]] = {}
+
+    @classmethod
+    def from_abis(cls, abis: Iterable[Union[List[Dict[str, Any]], str]]) -> "EventTable":
+        table = cls()
+        for abi in abis:
+            table.add_abi(abi)
+        return table
+
+    def add_abi(self, abi: Union[List[Dict[str, Any]], str]) -> None:
+        """Add the (non-anonymous) events of a contract ABI"""
+        for event in compile_abi(abi).topics.values():
+            if event.abi.get("anonymous"):
+                continue
+            decoder = EventDecoder.from_abi(event.abi, event.topic)  # type: ignore
+            self._decoders[(decoder.topic, len(decoder.indexed) + 1)] = decoder
+            topics = self._topics_by_name.setdefault(decoder.name, [])
+            if decoder.topic not in topics:
+                topics.append(decoder.topic)
+
+    @property
+    def event_names(self) -> List[str]:
+        return sorted(self._topics_by_name)
+
+    def topics(self, names: Iterable[str]) -> List[str]:
+        """Topic0 hashes of all events with the given names, for eth_subscribe/eth_getLogs filters"""
+        topics: List[str] = []
+        for name in names:
+            if name not in self._topics_by_name:
+                raise ValueError(f"Unknown event: {name}")
+            topics.extend("0x" + topic.hex() for topic in self._topics_by_name[name])
+        return topics
+
+    def decode(self, log: LogEntry) -> Optional[ContractEvent]:
+        """Decode a log entry, or return None if its event is not in the table"""
+        if not log.topics:
+            return None
+        decoder = self._decoders.get((log.topics[0], len(log.topics)))
+        if decoder is None:
+            return None
+        return decoder.decode(log)
+
+    def format_log(self, log_data: Dict[str, Any]) -> Union[ContractEvent, LogEntry]:
+        """Listener message formatter
+
+        Returns the decoded event, or the log entry if the event is not in the table
+        """
+        log = log_entry_formatter(log_data)
+        event = self.decode(log)
+        return event if event is not None else log
+
+
+_default_table: Optional[EventTable] = None
+_lock = threading.Lock()
+
+
+def default_event_table() -> EventTable:
+    """Event table of all ABIs packaged with telliot-core (loaded on first use)"""
+    global _default_table
+    with _lock:
+        if _default_table is None:
+            abis = []
+            for abi_file in sorted(_abi_folder.glob("*.json")):
+                with open(abi_file, "r") as f:
+                    abi = json.load(f)
+                if isinstance(abi, list):
+                    abis.append(abi)
+            _default_table = EventTable.from_abis(abis)
+    return _default_table
@@ -0,0 +1,123 @@
+"""
+Cache of transaction gas estimates
+
+Estimating gas before each transaction costs a round trip on the critical
+path of every submission.  Repeated calls of a contract function with
+arguments of the same size usually need about the same gas, so
+`GasEstimateCache` keeps recent estimates per (address, function,
+argument-size signature) and returns their maximum plus a safety margin.
+Cached estimates are refreshed in the background, and dropped when a
+transaction using one reverts or runs out of gas.
+"""
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Deque
+from typing import Dict
+from typing import Hashable
+from typing import Optional
+from typing import Tuple
+
+logger = logging.getLogger(__name__)
+
+GasKey = Tuple[str, str, Hashable]
+
+
+def size_signature(value: Any) -> Hashable:
+    """Describe the encoded size of a function argument
+
+    Dynamic values (bytes, strings, arrays) are described by their length,
+    static values by their type.
+    """
+    if isinstance(value, (bytes, bytearray, str)):
+        return len(value)
+    elif isinstance(value, (list, tuple)):
+        return tuple(size_signature(v) for v in value)
+    elif isinstance(value, dict):
+        return tuple(sorted((k, size_signature(v)) for k, v in value.items()))
+    return type(value).__name__
+
+
+class GasEstimateCache:
+    """Rolling maximum of recent gas estimates
+
+    Args:
+        margin:
+            Multiplier applied to the largest recent estimate
+        window:
+            Number of recent estimates kept per key
+        refresh_interval:
+            Seconds after which a cached estimate is refreshed in the background
+
+    Example:
+        oracle.gas_cache = GasEstimateCache(margin=1.25)
+    """
+
+    def __init__(self, margin: float = 1.2, window: int = 10, refresh_interval: float = 60.0):
+        self.margin = margin
+        self.window = window
+        self.refresh_interval = refresh_interval
+
+        self._estimates: Dict[GasKey, Deque[int]] = {}
+        self._updated: Dict[GasKey, float] = {}
+        self._tasks: Dict[GasKey, "asyncio.Task[None]"] = {}
+
+    def __len__(self) -> int:
+        return len(self._estimates)
+
+    def key(self, address: str, func_name: str, kwargs: Dict[str, Any]) -> GasKey:
+        """Build the cache key for a contract function call"""
+        return address, func_name, size_signature(kwargs)
+
+    def get(self, key: GasKey) -> Optional[int]:
+        """Gas limit for a call, or None if a live estimate is required"""
+        estimates = self._estimates.get(key)
+        if not estimates:
+            return None
+        return int(max(estimates) * self.margin)
+
+    def record(self, key: GasKey, estimate: int) -> None:
+        """Store a fresh gas estimate"""
+        estimates = self._estimates.setdefault(key, deque(maxlen=self.window))
+        estimates.append(estimate)
+        self._updated[key] = time.monotonic()
+
+    def invalidate(self, key: GasKey) -> None:
+        """Drop the estimates for a key, forcing a live estimate on the next call"""
+        logger.debug(f"Dropping gas estimates for {key[1]} at {key[0]}")
+        self._estimates.pop(key, None)
+        self._updated.pop(key, None)
+        task = self._tasks.pop(key, None)
+        if task is not None:
+            # An estimate started before the failure may be too low
+            task.cancel()
+
+    def refresh(self, key: GasKey, estimate_gas: Callable[[], Awaitable[int]]) -> None:
+        """Update the estimates for a key in the background, if they are due"""
+        updated = self._updated.get(key)
+        if updated is None or time.monotonic() - updated < self.refresh_interval or key in self._tasks:
+            return
+
+        async def _refresh() -> None:
+            try:
+                self.record(key, await estimate_gas())
+            except Exception as e:
+                logger.debug(f"Background gas estimate for {key[1]} failed: {e!r}")
+            finally:
+                if self._tasks.get(key) is task:
+                    del self._tasks[key]
+
+        task = asyncio.create_task(_refresh())
+        self._tasks[key] = task
+
+    def check_receipt(self, key: GasKey, gas_limit: int, receipt: Any) -> None:
+        """Check the receipt of a transaction sent with a cached gas limit
+
+        Estimates are dropped if the transaction reverted or used all of its gas.
+        """
+        if receipt["status"] == 0 or receipt.get("gasUsed", 0) >= gas_limit:
+            self.invalidate(key)
@@ -0,0 +1,218 @@
+"""
+Bounded work queue for listener handlers
+
+Listener messages are passed to a fixed number of worker tasks through a
+bounded queue, so that bursts of messages (e.g. from a pending transaction
+subscription) cannot grow the number of tasks and memory without limit.
+When the queue is full, the overflow policy of the subscription decides
+whether the message waits for space, the oldest message is dropped, or
+the newest queued message of the same subscription is replaced.
+"""
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Deque
+from typing import Dict
+from typing import Hashable
+from typing import List
+from typing import Literal
+
+logger = logging.getLogger(__name__)
+
+AsyncCallable = Callable[[Any], Awaitable[Any]]
+
+#: What to do with a new message for a full queue:
+#:   "block": wait for space (listener connections hold the message back without stopping the websocket reader)
+#:   "drop_oldest": drop the oldest queued message
+#:   "coalesce": replace the newest queued message of the same subscription and handler
+#:               (the new message is dropped if there is none, so other subscriptions are not affected)
+OverflowPolicy = Literal["block", "drop_oldest", "coalesce"]
+
+
+@dataclass
+class HandlerStats:
+    """Listener handler queue statistics"""
+
+    #: Number of queued messages
+    depth: int = 0
+
+    #: Largest number of queued messages seen
+    max_depth: int = 0
+
+    #: Number of handler calls completed (including failures)
+    processed: int = 0
+
+    #: Number of handler calls that raised an exception
+    failed: int = 0
+
+    #: Number of messages dropped from a full queue
+    dropped: int = 0
+
+    #: Number of messages replaced by a newer message of the same subscription
+    coalesced: int = 0
+
+    #: Total and maximum seconds spent in handlers
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+
+    #: Total seconds messages waited in the queue
+    total_wait: float = 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        return self.total_latency / self.processed if self.processed else 0.0
+
+    @property
+    def mean_wait(self) -> float:
+        return self.total_wait / self.processed if self.processed else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"depth={self.depth} (max {self.max_depth}), processed={self.processed}, failed={self.failed}, "
+            f"dropped={self.dropped}, coalesced={self.coalesced}, "
+            f"latency={self.mean_latency * 1e3:.1f} ms (max {self.max_latency * 1e3:.1f} ms), "
+            f"wait={self.mean_wait * 1e3:.1f} ms"
+        )
+
+
+@dataclass
+class _Job:
+    key: Hashable
+    handler: AsyncCallable
+    message: Any
+    enqueued: float
+
+
+class HandlerQueue:
+    """Runs message handlers on a fixed pool of workers
+
+    Args:
+        workers: Number of worker tasks (handlers running at the same time)
+        maxsize: Maximum number of queued messages
+    """
+
+    def __init__(self, workers: int = 8, maxsize: int = 1000):
+        self.workers = max(1, workers)
+        self.maxsize = max(1, maxsize)
+
+        #: Live queue statistics
+        self.stats = HandlerStats()
+
+        self._jobs: Deque[_Job] = deque()
+        self._coalescing: Dict[Hashable, _Job] = {}
+        self._active = 0
+        self._lock = asyncio.Lock()
+        self._not_empty = asyncio.Condition(self._lock)
+        self._not_full = asyncio.Condition(self._lock)
+        self._idle = asyncio.Condition(self._lock)
+        self._tasks: List[asyncio.Task[None]] = []
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def full(self) -> bool:
+        return len(self._jobs) >= self.maxsize
+
+    async def put(
+        self, key: Hashable, handler: AsyncCallable, message: Any, overflow: OverflowPolicy = "block"
+    ) -> None:
+        """Queue a handler call
+
+        Args:
+            key: Subscription and handler identity, used to coalesce messages
+            handler: Async function called with the message
+            message: Formatted message
+            overflow: Policy applied if the queue is full
+        """
+        self._start_workers()
+
+        async with self._lock:
+            if len(self._jobs) >= self.maxsize:
+                if overflow == "block":
+                    await self._not_full.wait_for(lambda: len(self._jobs) < self.maxsize)
+                elif overflow == "coalesce":
+                    self._coalesce(key, message)
+                    return
+                else:
+                    self._drop_oldest()
+
+            job = _Job(key=key, handler=handler, message=message, enqueued=time.perf_counter())
+            self._jobs.append(job)
+            if overflow == "coalesce":
+                self._coalescing[key] = job
+
+            self.stats.depth = len(self._jobs)
+            self.stats.max_depth = max(self.stats.max_depth, self.stats.depth)
+            self._not_empty.notify()
+
+    def _drop_oldest(self) -> None:
+        job = self._jobs.popleft()
+        if self._coalescing.get(job.key) is job:
+            del self._coalescing[job.key]
+        self._dropped()
+
+    def _coalesce(self, key: Hashable, message: Any) -> None:
+        job = self._coalescing.get(key)
+        if job is None:
+            self._dropped()
+        else:
+            job.message = message
+            self.stats.coalesced += 1
+
+    def _dropped(self) -> None:
+        self.stats.dropped += 1
+        if self.stats.dropped % 1000 == 1:
+            logger.warning(f"Listener handler queue full, dropping messages ({self.stats})")
+
+    def _start_workers(self) -> None:
+        if not self._tasks:
+            self._tasks = [
+                asyncio.create_task(self._worker(), name=f"listener_worker_{i}") for i in range(self.workers)
+            ]
+
+    async def _worker(self) -> None:
+        while True:
+            async with self._lock:
+                await self._not_empty.wait_for(lambda: bool(self._jobs))
+                job = self._jobs.popleft()
+                if self._coalescing.get(job.key) is job:
+                    del self._coalescing[job.key]
+                self.stats.depth = len(self._jobs)
+                self._active += 1
+                self._not_full.notify()
+
+            start = time.perf_counter()
+            try:
+                await job.handler(job.message)
+            except Exception:
+                self.stats.failed += 1
+                logger.exception(f"Exception raised by listener handler {job.handler!r}")
+            finally:
+                latency = time.perf_counter() - start
+                self.stats.processed += 1
+                self.stats.total_latency += latency
+                self.stats.max_latency = max(self.stats.max_latency, latency)
+                self.stats.total_wait += start - job.enqueued
+                async with self._lock:
+                    self._active -= 1
+                    self._idle.notify_all()
+
+    async def join(self) -> None:
+        """Wait until all queued messages are handled"""
+        async with self._lock:
+            await self._idle.wait_for(lambda: not self._jobs and not self._active)
+
+    async def close(self) -> None:
+        """Cancel the workers, discarding queued messages"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._jobs.clear()
+        self._coalescing.clear()
+        self.stats.depth = 0
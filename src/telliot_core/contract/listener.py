@@ -4,24 +4,43 @@ This module adds contract event listening capability for websocket endpoints
 (like infura) that is lacking from web3.py.
 
 The goal is to allow users to subscribe to and define async callbacks for each event.
+All subscriptions are multiplexed over a small pool of websocket connections.
 
 *Work in Progress*
 """
 import asyncio
+import functools
+import json
 import logging
 import warnings
+from collections import deque
+from dataclasses import dataclass
+from dataclasses import field
 from typing import Any
 from typing import Awaitable
 from typing import Callable
+from typing import Deque
 from typing import Dict
 from typing import List
 from typing import Literal
+from typing import Optional
+from typing import Sequence
+from typing import Set
+from typing import Tuple
+from typing import TYPE_CHECKING
 
 import aiohttp
 from aiohttp.client import _WSRequestContextManager
+from eth_utils.address import to_checksum_address
 from hexbytes import HexBytes
 from web3.datastructures import AttributeDict
 
+from telliot_core.contract.handler_queue import HandlerQueue
+from telliot_core.contract.handler_queue import OverflowPolicy
+
+if TYPE_CHECKING:
+    from telliot_core.contract.events import EventTable
+
 logger = logging.getLogger(__name__)
 
 AsyncCallable = Callable[[Any], Awaitable[Any]]
@@ -41,16 +60,146 @@ def _hex_to_int(value: Any) -> Any:
     return value
 
 
-def block_formatter(block_data: Dict[str, Any]) -> AttributeDict[str, Any]:
-    """Format block data similar to web3 v6 block_formatter."""
-    formatted = _hex_to_int(block_data)
-    return AttributeDict(formatted)
+def _int(value: Optional[str]) -> Optional[int]:
+    return int(value, 16) if value is not None else None
+
+
+def _hexbytes(value: str) -> HexBytes:
+    # bytes.fromhex validates the input, so skip HexBytes' own conversion
+    return bytes.__new__(HexBytes, bytes.fromhex(value[2:]))
+
 
+def _bytes(value: Optional[str]) -> Optional[HexBytes]:
+    return _hexbytes(value) if value is not None else None
 
-def log_entry_formatter(log_data: Dict[str, Any]) -> AttributeDict[str, Any]:
-    """Format log entry data similar to web3 v6 log_entry_formatter."""
-    formatted = _hex_to_int(log_data)
-    return AttributeDict(formatted)
+
+@functools.lru_cache(maxsize=1024)
+def _checksum(address: str) -> str:
+    # Messages repeat a few contract addresses, so cache their (keccak based) checksums
+    return to_checksum_address(address)
+
+
+class _Record:
+    """Lightweight message record
+
+    Fields are read as attributes or, like web3's AttributeDict, by key.
+    Fields without a schema entry are read (unconverted) from the raw message.
+    """
+
+    __slots__ = ("raw",)
+
+    raw: Dict[str, Any]
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for names that are not schema fields
+        if name != "raw" and not name.startswith("__"):
+            try:
+                return self.raw[name]
+            except KeyError:
+                pass
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.__slots__ or isinstance(getattr(type(self), key, None), property):
+            return getattr(self, key)
+        return self.raw[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.__slots__ or key in self.raw
+
+    def __eq__(self, other: object) -> bool:
+        return type(other) is type(self) and self.raw == other.raw
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class BlockHeader(_Record):
+    """New block header (newHeads message)"""
+
+    __slots__ = ("number", "hash", "parentHash", "timestamp", "baseFeePerGas", "gasLimit", "gasUsed", "miner")
+
+    number: int
+    hash: HexBytes
+    parentHash: HexBytes
+    timestamp: int
+    baseFeePerGas: Optional[int]
+    gasLimit: int
+    gasUsed: int
+    miner: str
+
+    def __init__(self, raw: Dict[str, Any]):
+        self.raw = raw
+        self.number = int(raw["number"], 16)
+        self.hash = _bytes(raw.get("hash"))  # type: ignore
+        self.parentHash = _bytes(raw.get("parentHash"))  # type: ignore
+        self.timestamp = _int(raw.get("timestamp"))  # type: ignore
+        self.baseFeePerGas = _int(raw.get("baseFeePerGas"))
+        self.gasLimit = _int(raw.get("gasLimit"))  # type: ignore
+        self.gasUsed = _int(raw.get("gasUsed"))  # type: ignore
+        self.miner = _checksum(raw["miner"]) if raw.get("miner") else None  # type: ignore
+
+
+class LogEntry(_Record):
+    """Contract event log (logs message or eth_getLogs result)"""
+
+    __slots__ = (
+        "address",
+        "topics",
+        "data",
+        "blockNumber",
+        "transactionIndex",
+        "logIndex",
+        "removed",
+    )
+
+    address: str
+    topics: List[HexBytes]
+    data: HexBytes
+    blockNumber: int
+    transactionIndex: int
+    logIndex: int
+    removed: bool
+
+    def __init__(self, raw: Dict[str, Any]):
+        self.raw = raw
+        self.address = _checksum(raw["address"])
+        self.topics = [_hexbytes(topic) for topic in raw.get("topics", ())]
+        self.data = _bytes(raw.get("data", "0x"))  # type: ignore
+        self.blockNumber = _int(raw.get("blockNumber"))  # type: ignore
+        self.transactionIndex = _int(raw.get("transactionIndex"))  # type: ignore
+        self.logIndex = _int(raw.get("logIndex"))  # type: ignore
+        self.removed = raw.get("removed", False)
+
+    # Hashes are rarely used by handlers, so they are converted on access
+
+    @property
+    def blockHash(self) -> Optional[HexBytes]:
+        return _bytes(self.raw.get("blockHash"))
+
+    @property
+    def transactionHash(self) -> Optional[HexBytes]:
+        return _bytes(self.raw.get("transactionHash"))
+
+
+def block_formatter(block_data: Dict[str, Any]) -> BlockHeader:
+    """Format a block header, converting only its numeric and hash fields"""
+    return BlockHeader(block_data)
+
+
+def log_entry_formatter(log_data: Dict[str, Any]) -> LogEntry:
+    """Format a log entry, converting only its numeric and byte fields
+
+    As with web3's log_entry_formatter, the address is checksummed.
+    """
+    return LogEntry(log_data)
 
 
 def syncing_formatter(sync_data: Any) -> Any:
@@ -64,14 +213,56 @@ def syncing_formatter(sync_data: Any) -> Any:
 SubscriptionType = Literal["newHeads", "logs", "newPendingTransactions", "syncing"]
 
 
+async def receive_messages(
+    ws: aiohttp.ClientWebSocketResponse,
+    dispatch: Callable[[Dict[str, Any]], Awaitable[None]],
+) -> None:
+    """A long running task that listens for JSON messages on an open websocket.
+    The dispatch function is awaited once for each message, so messages are
+    not read faster than they are dispatched.
+
+    Args:
+        ws: Open websocket connection
+        dispatch: An async function that takes the JSON message as a single argument
+
+    Returns: None
+        Does not return until the task is cancelled or the websocket is closed.
+
+    """
+    while True:
+        try:
+            message = await asyncio.wait_for(ws.receive(), timeout=60)
+        except asyncio.CancelledError:
+            logger.debug("Listener cancelled")
+            raise
+        except asyncio.exceptions.TimeoutError:
+            continue
+
+        if message.type == aiohttp.WSMsgType.TEXT:
+            try:
+                data = message.json()
+            except ValueError:
+                logger.error(f"Invalid JSON message: {message.data!r}")
+                continue
+            await dispatch(data)
+        elif message.type in (aiohttp.WSMsgType.CLOSE, aiohttp.WSMsgType.CLOSING, aiohttp.WSMsgType.CLOSED):
+            logger.info("Websocket closed")
+            break
+        elif message.type == aiohttp.WSMsgType.ERROR:
+            logger.error(f"Websocket error: {ws.exception()!r}")
+            break
+
+
 async def receive_message_task(
     ws: aiohttp.ClientWebSocketResponse,
     handler: AsyncCallable,
     formatter: Callable[..., Any],
 ) -> None:
-    """A long running task that listens for JSON messages on an open websocket.
+    """A long running task that listens for subscription messages on an open websocket.
     The handler is called once for each message.
 
+    Deprecated: use `Listener`, or `receive_messages` with a dispatch function.
+
     Args:
         ws: Open websocket connection
         handler: An async function that takes the JSON message as a single argument
@@ -81,20 +272,20 @@ async def receive_message_task(
         Does not return until task is cancelled.
 
     """
-    while True:
-        try:
-            message = await asyncio.wait_for(ws.receive_json(), timeout=60)
-            # sub_id = message["params"]["subscription"]
-            # logger.info(f"handled block subscription: {sub_id}")
-            result = message["params"]["result"]
-            formatted_result = formatter(result)
-            asyncio.create_task(handler(formatted_result))  # type: ignore
+    warnings.warn(
+        "receive_message_task(ws, handler, formatter) is deprecated, use Listener or receive_messages",
+        DeprecationWarning,
+        stacklevel=2,
+    )
 
-        except asyncio.CancelledError:
-            logger.debug("Listener cancelled")
-            break
-        except asyncio.exceptions.TimeoutError:
-            continue
+    async def dispatch(message: Dict[str, Any]) -> None:
+        if message.get("method") == "eth_subscription":
+            asyncio.create_task(handler(formatter(message["params"]["result"])))  # type: ignore
+
+    try:
+        await receive_messages(ws, dispatch)
+    except asyncio.CancelledError:
+        pass
 
 
 async def eth_subscribe(
@@ -106,6 +297,9 @@ async def eth_subscribe(
 ) -> HexBytes:
     """Subscribe
 
+    Deprecated: use `Listener.eth_subscribe`, which shares the websocket
+    between subscriptions.
+
     Args:
         ws: Websocket connection
         lid: Listener ID
@@ -116,6 +310,11 @@ async def eth_subscribe(
         Subscription ID
 
     """
+    warnings.warn(
+        "The module-level eth_subscribe is deprecated, use Listener.eth_subscribe",
+        DeprecationWarning,
+        stacklevel=2,
+    )
 
     logger.debug(f"New {name} subscription")
 
@@ -144,30 +343,524 @@ async def eth_subscribe(
     return HexBytes(sub_result)
 
 
+@dataclass
+class ListenerOptions:
+    """Settings shared by all listener connections"""
+
+    #: Seconds before the first reconnect attempt (doubled after each failed attempt)
+    reconnect_delay: float = 1.0
+
+    #: Maximum seconds between reconnect attempts
+    max_reconnect_delay: float = 60.0
+
+    #: Blocks per eth_getLogs request when backfilling missed events after a reconnect
+    backfill_chunk_size: int = 1000
+
+    #: Maximum number of blocks backfilled after a reconnect
+    max_backfill_blocks: int = 100_000
+
+    #: Number of handlers running at the same time
+    handler_workers: int = 8
+
+    #: Maximum number of messages waiting for a handler
+    max_queued_messages: int = 1000
+
+    #: Default policy for messages arriving when the handler queue is full.  With "block",
+    #: up to max_queued_messages more messages per connection wait for space (the oldest
+    #: are dropped beyond that), while the websocket is still read.
+    overflow: OverflowPolicy = "block"
+
+
+@dataclass
+class Subscription:
+    """An eth_subscribe stream, shared by all handlers with the same parameters"""
+
+    #: Subscription type/name
+    name: SubscriptionType
+
+    #: Subscription parameter dict
+    params: Dict[str, Any]
+
+    #: Message formatter, applied once per message for all handlers
+    formatter: Callable[..., Any]
+
+    #: Async functions called with each formatted message
+    handlers: List[AsyncCallable] = field(default_factory=list)
+
+    #: Subscription ID assigned by the node (None until subscribed)
+    sub_id: Optional[str] = None
+
+    #: Last block number processed (log subscriptions are backfilled from here after a reconnect)
+    last_block: Optional[int] = None
+
+    #: Log indexes processed in the last block, or None if all its logs were processed
+    last_block_logs: Optional[Set[Optional[int]]] = None
+
+    #: Live messages held back while missed events are backfilled
+    buffer: Optional[List[Any]] = None
+
+    #: Handler queue overflow policy (default: ListenerOptions.overflow)
+    overflow: Optional[OverflowPolicy] = None
+
+    @property
+    def key(self) -> Tuple[str, str, Callable[..., Any]]:
+        return self.name, json.dumps(self.params, sort_keys=True), self.formatter
+
+    def describe(self) -> str:
+        if self.name == "logs":
+            return f"contract address={self.params.get('address')}"
+        return self.name
+
+
+def _to_int(value: Any) -> Optional[int]:
+    if isinstance(value, str):
+        return int(value, 16)
+    if isinstance(value, int):
+        return value
+    return None
+
+
+def _block_number(result: Any) -> Optional[int]:
+    """Block number of a raw block header or log message"""
+    if isinstance(result, dict):
+        return _to_int(result.get("blockNumber", result.get("number")))
+    return None
+
+
+def _log_position(result: Any) -> Tuple[Optional[int], Optional[int], bool]:
+    """Block number, log index and removed flag of a raw log message"""
+    if isinstance(result, dict):
+        return _to_int(result.get("blockNumber")), _to_int(result.get("logIndex")), bool(result.get("removed"))
+    return None, None, False
+
+
+class ListenerConnection:
+    """A websocket connection that multiplexes any number of subscriptions
+
+    Messages are routed to subscriptions by `params.subscription` ID and
+    request responses by JSON-RPC ID.  If the websocket drops, the connection
+    reconnects with exponential backoff, resubscribes, and backfills the log
+    subscriptions with the events emitted while disconnected.
+    """
+
+    def __init__(
+        self,
+        *,
+        session: aiohttp.ClientSession,
+        ws_url: str,
+        options: Optional[ListenerOptions] = None,
+        queue: Optional[HandlerQueue] = None,
+    ):
+        self._session = session
+        self._url = ws_url
+        self.options = options or ListenerOptions()
+
+        #: Queue of handler calls
+        self.queue = (
+            queue
+            if queue is not None
+            else HandlerQueue(workers=self.options.handler_workers, maxsize=self.options.max_queued_messages)
+        )
+
+        #: Subscriptions by subscription ID
+        self.subscriptions: Dict[str, Subscription] = {}
+
+        #: Subscriptions assigned to this connection
+        self.assigned: List[Subscription] = []
+
+        #: Number of successful (re)connections
+        self.connect_count = 0
+
+        self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
+        self._connected = asyncio.Event()
+        self._task: Optional[asyncio.Task[None]] = None
+        self._request_id = 0
+        self._requests: Dict[int, asyncio.Future[Any]] = {}
+        self._subscribing: Dict[int, Subscription] = {}
+        self._subscribe_tasks: Set[asyncio.Task[None]] = set()
+
+        # Messages waiting for space in the handler queue ("block" overflow policy)
+        self._backlog: Deque[Tuple[Subscription, AsyncCallable, Any]] = deque()
+        self._feeder: Optional[asyncio.Task[None]] = None
+
+    def start(self, name: str) -> asyncio.Task[None]:
+        """Start the connection task"""
+        if self._task is None:
+            self._task = asyncio.create_task(self.run(), name=name)
+            self._task.add_done_callback(_handle_task_result)
+        return self._task
+
+    async def run(self) -> None:
+        """Connect and route incoming messages, reconnecting until cancelled"""
+        attempt = 0
+        while True:
+            try:
+                async with self._session.ws_connect(self._url, heartbeat=30) as ws:
+                    self._ws = ws
+                    self._connected.set()
+                    self.connect_count += 1
+                    attempt = 0
+                    self._start_subscribe(list(self.assigned))
+                    await receive_messages(ws=ws, dispatch=self.dispatch)
+            except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as e:
+                logger.warning(f"Websocket connection to {self._url} failed: {e!r}")
+            except Exception:
+                logger.exception(f"Websocket connection to {self._url} failed")
+            finally:
+                self._disconnected()
+
+            delay = min(self.options.max_reconnect_delay, self.options.reconnect_delay * 2**attempt)
+            attempt += 1
+            logger.info(f"Reconnecting to {self._url} in {delay:.1f} s")
+            await asyncio.sleep(delay)
+
+    def _disconnected(self) -> None:
+        self._ws = None
+        self._connected.clear()
+        self._fail_requests(ConnectionError(f"Websocket connection to {self._url} closed"))
+        for task in self._subscribe_tasks:
+            task.cancel()
+        for subscription in self.subscriptions.values():
+            subscription.sub_id = None
+        self.subscriptions = {}
+
+    def add(self, subscription: Subscription) -> None:
+        """Assign a subscription to this connection
+
+        The subscription is created now if connected, or else when connected.
+        """
+        self.assigned.append(subscription)
+        if self._connected.is_set():
+            self._start_subscribe([subscription])
+
+    def _start_subscribe(self, subscriptions: List[Subscription]) -> None:
+        for subscription in subscriptions:
+            task = asyncio.create_task(self.subscribe(subscription))
+            self._subscribe_tasks.add(task)
+            task.add_done_callback(self._subscribe_done)
+
+    def _subscribe_done(self, task: asyncio.Task[None]) -> None:
+        self._subscribe_tasks.discard(task)
+        _handle_task_result(task)
+
+    async def _wait_connected(self) -> aiohttp.ClientWebSocketResponse:
+        await self._connected.wait()
+        if self._ws is None:
+            raise ConnectionError(f"Websocket connection to {self._url} closed")
+        return self._ws
+
+    async def request(self, method: str, params: List[Any], subscription: Optional[Subscription] = None) -> Any:
+        """Send a JSON-RPC request over the websocket and wait for its response"""
+        ws = await self._wait_connected()
+
+        self._request_id += 1
+        request_id = self._request_id
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._requests[request_id] = future
+        if subscription is not None:
+            self._subscribing[request_id] = subscription
+        try:
+            await ws.send_json({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params})
+            return await asyncio.wait_for(future, timeout=60)
+        finally:
+            self._requests.pop(request_id, None)
+            self._subscribing.pop(request_id, None)
+
+    async def subscribe(self, subscription: Subscription) -> None:
+        """Create a subscription using eth_subscribe
+
+        Log subscriptions that were live before are backfilled from their last
+        processed block.  Live messages are held back until the backfill is done,
+        and a failed backfill is retried while connected.  If the connection
+        drops first, the held messages are kept and replayed after the backfill
+        on the next connection.
+        """
+        backfill = subscription.name == "logs" and subscription.last_block is not None
+        if backfill and subscription.buffer is None:
+            subscription.buffer = []
+
+        params: List[Any] = [subscription.name, subscription.params] if subscription.params else [subscription.name]
+        sub_id = await self.request("eth_subscribe", params, subscription=subscription)
+        logger.info(f"Subscribed to {subscription.describe()} (id={sub_id})")
+
+        if subscription.name != "logs":
+            return
+
+        attempt = 0
+        while True:
+            try:
+                head = int(await self.request("eth_blockNumber", []), 16)
+                if backfill:
+                    await self._backfill(subscription, head)
+                elif subscription.last_block is None:
+                    subscription.last_block = head
+                break
+            except ConnectionError:
+                raise
+            except Exception as e:
+                delay = min(self.options.max_reconnect_delay, self.options.reconnect_delay * 2**attempt)
+                attempt += 1
+                logger.warning(f"Backfill of {subscription.describe()} failed, retrying in {delay:.1f} s: {e!r}")
+                await asyncio.sleep(delay)
+
+        buffer, subscription.buffer = subscription.buffer, None
+
+        # Live messages may repeat backfilled logs; reorg (removed) notifications are always delivered
+        for result in buffer or []:
+            if not self._is_delivered(subscription, result):
+                await self._deliver(subscription, result)
+
+    @staticmethod
+    def _is_delivered(subscription: Subscription, result: Any) -> bool:
+        """True if a log was already delivered (for replayed and backfilled logs)"""
+        block, log_index, removed = _log_position(result)
+        if removed or block is None or subscription.last_block is None:
+            return False
+        if block < subscription.last_block:
+            return True
+        if block == subscription.last_block:
+            return subscription.last_block_logs is None or log_index in subscription.last_block_logs
+        return False
+
+    async def _backfill(self, subscription: Subscription, head: int) -> None:
+        """Deliver the log events emitted since the last processed block
+
+        The last block is fetched again if only some of its logs were
+        processed; logs that were already delivered are skipped.  Chunks with
+        too many results are split (see `LogBackfill`).
+        """
+        from telliot_core.contract.log_backfill import _classify
+        from telliot_core.contract.log_backfill import LogBackfill
+
+        async def get_logs(log_filter: Dict[str, Any]) -> List[Dict[str, Any]]:
+            try:
+                return await self.request("eth_getLogs", [{**subscription.params, **log_filter}])  # type: ignore
+            except ConnectionError:
+                raise
+            except Exception as e:
+                classified = _classify(str(e))
+                if classified is not None:
+                    raise classified from e
+                raise
+
+        backfill = LogBackfill(
+            get_logs,
+            chunk_size=self.options.backfill_chunk_size,
+            max_chunk_size=self.options.backfill_chunk_size,
+            concurrency=1,
+            retry_delay=self.options.reconnect_delay,
+        )
+
+        assert subscription.last_block is not None
+        start = subscription.last_block + (1 if subscription.last_block_logs is None else 0)
+        if head - start + 1 > self.options.max_backfill_blocks:
+            logger.warning(
+                f"Skipping blocks {start} to {head - self.options.max_backfill_blocks} "
+                f"for {subscription.describe()} (max_backfill_blocks={self.options.max_backfill_blocks})"
+            )
+            start = head - self.options.max_backfill_blocks + 1
+
+        count = 0
+        for from_block in range(start, head + 1, self.options.backfill_chunk_size):
+            to_block = min(head, from_block + self.options.backfill_chunk_size - 1)
+            for log in await backfill.get_logs(from_block, to_block):
+                if not self._is_delivered(subscription, log.raw):
+                    await self._deliver(subscription, log.raw)
+                    count += 1
+
+        # All logs up to the head have been processed
+        if head >= subscription.last_block:
+            subscription.last_block = head
+            subscription.last_block_logs = None
+        if count:
+            logger.info(f"Backfilled {count} events for {subscription.describe()} up to block {head}")
+
+    async def dispatch(self, message: Dict[str, Any]) -> None:
+        """Route a message to its subscription or pending request
+
+        Errors are logged, so that a malformed message does not stop the connection.
+        """
+        try:
+            await self._route(message)
+        except Exception:
+            logger.exception(f"Unable to handle message: {message}")
+
+    async def _route(self, message: Dict[str, Any]) -> None:
+        if message.get("method") == "eth_subscription":
+            params = message["params"]
+            subscription = self.subscriptions.get(params["subscription"])
+            if subscription is None:
+                logger.debug(f"Message for unknown subscription {params['subscription']}")
+            elif subscription.buffer is not None:
+                subscription.buffer.append(params["result"])
+            else:
+                await self._deliver(subscription, params["result"])
+            return
+
+        request_id = message.get("id")
+        future = self._requests.get(request_id)  # type: ignore
+        if future is None or future.done():
+            logger.debug(f"Unexpected message: {message}")
+            return
+
+        if "error" in message or "result" not in message:
+            logger.error(f"Request failed: {message}")
+            future.set_exception(Exception(f"Request failed: {message.get('error')}"))
+            return
+
+        # Register subscriptions before yielding, since notifications may follow immediately
+        subscription = self._subscribing.get(request_id)  # type: ignore
+        if subscription is not None:
+            subscription.sub_id = message["result"]
+            self.subscriptions[message["result"]] = subscription
+        future.set_result(message["result"])
+
+    async def _deliver(self, subscription: Subscription, result: Any) -> None:
+        """Format a message and queue the subscription handlers"""
+        if subscription.name == "logs":
+            self._track(subscription, result)
+
+        try:
+            formatted = subscription.formatter(result)
+        except Exception:
+            logger.exception(f"Unable to format {subscription.describe()} message: {result}")
+            return
+
+        overflow = subscription.overflow or self.options.overflow
+        for handler in subscription.handlers:
+            if overflow == "block" and (self._feeding or self.queue.full()):
+                self._hold(subscription, handler, formatted)
+            else:
+                await self.queue.put((subscription.key, handler), handler, formatted, overflow)
+
+    @property
+    def _feeding(self) -> bool:
+        return self._feeder is not None and not self._feeder.done()
+
+    def _hold(self, subscription: Subscription, handler: AsyncCallable, message: Any) -> None:
+        """Wait for space in the handler queue without blocking the websocket reader
+
+        The reader must keep reading, since responses to eth_subscribe and
+        eth_getLogs requests arrive on the same websocket.
+        """
+        if len(self._backlog) >= self.options.max_queued_messages:
+            self._backlog.popleft()
+            self.queue.stats.dropped += 1
+            if self.queue.stats.dropped % 1000 == 1:
+                logger.warning(f"Listener handler queue full, dropping oldest messages ({self.queue.stats})")
+        self._backlog.append((subscription, handler, message))
+
+        if not self._feeding:
+            self._feeder = asyncio.create_task(self._feed())
+            self._feeder.add_done_callback(_handle_task_result)
+
+    async def _feed(self) -> None:
+        while self._backlog:
+            subscription, handler, message = self._backlog.popleft()
+            await self.queue.put((subscription.key, handler), handler, message, "block")
+
+    @staticmethod
+    def _track(subscription: Subscription, result: Any) -> None:
+        """Record the position of a delivered log"""
+        block, log_index, removed = _log_position(result)
+        if block is None:
+            return
+        if removed:
+            # The block was reorganized, so logs with this index may be delivered again
+            if block == subscription.last_block and subscription.last_block_logs is not None:
+                subscription.last_block_logs.discard(log_index)
+        elif subscription.last_block is None or block > subscription.last_block:
+            subscription.last_block = block
+            subscription.last_block_logs = {log_index}
+        elif block == subscription.last_block and subscription.last_block_logs is not None:
+            subscription.last_block_logs.add(log_index)
+
+    def _fail_requests(self, exc: Exception) -> None:
+        for future in self._requests.values():
+            if not future.done():
+                future.set_exception(exc)
+
+    async def close(self) -> None:
+        """Cancel the connection task and close the websocket"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._feeder is not None:
+            self._feeder.cancel()
+            await asyncio.gather(self._feeder, return_exceptions=True)
+            self._feeder = None
+        self._backlog.clear()
+
+
 class Listener:
-    def __init__(self, *, session: aiohttp.ClientSession, ws_url: str):
+    """Subscribes handlers to websocket streams
+
+    All subscriptions share a small pool of websocket connections.  Handlers
+    subscribing to the same stream (e.g. several new block handlers) share a
+    single node subscription.  Dropped connections are re-established and
+    missed contract events are backfilled (see ListenerOptions).
+
+    Args:
+        session: aiohttp client session
+        ws_url: Websocket endpoint URL
+        pool_size: Maximum number of websocket connections
+        options: Reconnect, backfill and handler queue settings
+    """
+
+    def __init__(
+        self,
+        *,
+        session: aiohttp.ClientSession,
+        ws_url: str,
+        pool_size: int = 1,
+        options: Optional[ListenerOptions] = None,
+    ):
 
         self._session = session
 
         self._url: str = ws_url
-        self._tasks: List[asyncio.Task[None]] = []
-        self._listener_id: int = 0
+        self._tasks: List[asyncio.Task[Any]] = []
+        self._pool_size = max(1, pool_size)
+        self.options = options or ListenerOptions()
+
+        #: Handler queue shared by all connections
+        self.queue = HandlerQueue(workers=self.options.handler_workers, maxsize=self.options.max_queued_messages)
+
+        self._connections: List[ListenerConnection] = []
+        self._subscriptions: Dict[Tuple[str, str, Callable[..., Any]], Subscription] = {}
 
     def connect(self) -> _WSRequestContextManager:  # aiohttp.ClientWebSocketResponse:
         return self._session.ws_connect(self._url)
 
-    def _get_listener_id(self) -> int:
-        """Generate sequential IDs for subscription requests"""
-        self._listener_id += 1
-        return self._listener_id
+    #: Handler queue statistics (depth, drops, handler latency)
+    stats = property(lambda self: self.queue.stats)
+
+    @property
+    def connections(self) -> List[ListenerConnection]:
+        """Open websocket connections"""
+        return list(self._connections)
+
+    def _get_connection(self) -> ListenerConnection:
+        """Open a new connection up to the pool size, else use the least loaded one"""
+        if len(self._connections) < self._pool_size:
+            connection = ListenerConnection(
+                session=self._session, ws_url=self._url, options=self.options, queue=self.queue
+            )
+            self._connections.append(connection)
+            self._tasks.append(connection.start(name=f"listener_connection_{len(self._connections)}"))
+            return connection
+
+        return min(self._connections, key=lambda c: len(c.assigned))
 
     async def eth_subscribe(
         self,
         handler: AsyncCallable,
         name: SubscriptionType,
         formatter: Callable[..., Any],
+        overflow: Optional[OverflowPolicy] = None,
         **kwargs: Any,
-    ) -> None:
+    ) -> Subscription:
         """Create a subscription using eth_subscribe
 
         Args:
@@ -176,85 +869,108 @@ class Listener:
             name:
                 Subscription type/name, one of:
                     "newHeads", "logs", "newPendingTransactions", "syncing"
+            overflow:
+                Handler queue overflow policy (default: options.overflow)
             **kwargs:
                 Subscription parameter dict.
                 See (see https://geth.ethereum.org/docs/rpc/pubsub)
 
         Returns:
-
+            The (possibly shared) subscription
         """
 
-        # Create a unique ID/name for the subscription
-        lid = self._get_listener_id()
-        task_name = f"listener_task_{lid}"
+        subscription = Subscription(name=name, params=kwargs, formatter=formatter, overflow=overflow)
+        existing = self._subscriptions.get(subscription.key)
+        if existing is not None:
+            existing.handlers.append(handler)
+            return existing
 
-        # Launch a task and store a reference locally for later cancellation
-        # Note that storing this reference delays exceptions until garbage collection.
-        # Therefore, task is wrapped with a task_done callback to immediately catch exceptions
-        task = asyncio.create_task(
-            self._eth_subscribe_task(handler=handler, name=name, lid=lid, formatter=formatter, **kwargs),
-            name=task_name,
-        )
+        subscription.handlers.append(handler)
+        self._subscriptions[subscription.key] = subscription
 
-        task.add_done_callback(_handle_task_result)
-        self._tasks.append(task)
+        self._get_connection().add(subscription)
 
-    async def subscribe_new_blocks(self, handler: AsyncCallable) -> None:
+        return subscription
 
-        await self.eth_subscribe(handler=handler, name="newHeads", formatter=block_formatter)
+    async def subscribe_new_blocks(
+        self, handler: AsyncCallable, overflow: Optional[OverflowPolicy] = None
+    ) -> Subscription:
 
-    async def subscribe_contract_events(self, handler: AsyncCallable, address: str) -> None:
+        return await self.eth_subscribe(handler=handler, name="newHeads", formatter=block_formatter, overflow=overflow)
 
-        await self.eth_subscribe(handler=handler, name="logs", address=address, formatter=log_entry_formatter)
+    async def subscribe_contract_events(self, handler: AsyncCallable, address: str) -> Subscription:
 
-    async def subscribe_pending_transactions(self, handler: AsyncCallable) -> None:
+        return await self.eth_subscribe(handler=handler, name="logs", address=address, formatter=log_entry_formatter)
 
-        await self.eth_subscribe(
-            handler=handler,
-            name="newPendingTransactions",
-            formatter=pending_transaction_formatter,
-        )
-        # await self.eth_subscribe(handler=handler, name='newPendingTransactions')
+    async def subscribe_events(
+        self,
+        handler: AsyncCallable,
+        address: str,
+        events: Optional[Sequence[str]] = None,
+        table: Optional["EventTable"] = None,
+        overflow: Optional[OverflowPolicy] = None,
+    ) -> Subscription:
+        """Subscribe to decoded contract events
 
-    async def subscribe_syncing(self, handler: AsyncCallable) -> None:
+        Args:
+            handler: An async function called with each ContractEvent
+            address: Contract address
+            events: Event names (e.g. ["NewReport", "TipAdded"]); the node only
+                sends these events.  All events are sent if not specified.
+            table: Event decoders (default: all ABIs packaged with telliot-core)
+            overflow: Handler queue overflow policy
+        """
+        from telliot_core.contract.events import default_event_table
 
-        await self.eth_subscribe(handler=handler, name="syncing", formatter=syncing_formatter)
+        if table is None:
+            table = default_event_table()
 
-    async def _eth_subscribe_task(
-        self,
-        handler: AsyncCallable,
-        name: SubscriptionType,
-        lid: int,
-        formatter: Callable[..., Any],
-        **kwargs: Any,
-    ) -> None:
-        """A long running listener task.
+        params: Dict[str, Any] = {"address": address}
+        if events:
+            params["topics"] = [table.topics(events)]
 
-        Note: Does not return until asyncio.Cancelled event
+        return await self.eth_subscribe(
+            handler=handler, name="logs", formatter=table.format_log, overflow=overflow, **params
+        )
+
+    async def subscribe_pending_transactions(
+        self, handler: AsyncCallable, overflow: OverflowPolicy = "drop_oldest"
+    ) -> Subscription:
+        """Subscribe to pending transaction hashes
+
+        Note: the transaction rate is very high, so by default the oldest
+        messages are dropped if handlers fall behind.
         """
+        return await self.eth_subscribe(
+            handler=handler,
+            name="newPendingTransactions",
+            formatter=pending_transaction_formatter,
+            overflow=overflow,
+        )
 
-        async with self.connect() as ws:
-            sub_result = await eth_subscribe(ws=ws, name=name, lid=lid, **kwargs)
-            if name == "logs":
-                logger.info(f"Subscribed to contract address={kwargs['address']} (id={sub_result.hex()})")
-            else:
-                logger.info(f"New {name} subscription (id={sub_result.hex()})")
-            await receive_message_task(ws=ws, handler=handler, formatter=formatter)
+    async def subscribe_syncing(self, handler: AsyncCallable) -> Subscription:
+
+        return await self.eth_subscribe(handler=handler, name="syncing", formatter=syncing_formatter)
 
     async def shutdown(self) -> None:
-        """Shut down all asyncio subscription tasks"""
+        """Shut down all asyncio subscription tasks and close the connections"""
         for task in self._tasks:
             logger.info(f"Shutting down listener {task.get_name()}")
             task.cancel()
-        await asyncio.gather(*self._tasks)
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        for connection in self._connections:
+            await connection.close()
+        await self.queue.close()
         self._tasks = []
+        self._connections = []
+        self._subscriptions = {}
 
     def __del__(self) -> None:
         if self._tasks:
             warnings.warn("Listener.shutdown() not awaited.", stacklevel=2)
 
 
-def _handle_task_result(task: asyncio.Task[Any]) -> None:
+def _handle_task_result(task: "asyncio.Future[Any]") -> None:
     # https://quantlane.com/blog/ensure-asyncio-task-exceptions-get-logged/
     try:
         task.result()
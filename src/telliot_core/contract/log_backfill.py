@@ -0,0 +1,252 @@
+"""
+Historical event log backfill
+
+`LogBackfill` reads the event logs of a block range with `eth_getLogs`.
+The range is split into chunks that are fetched concurrently, with bounded
+parallelism.  When the provider rejects a chunk because it has too many
+results, the chunk is split in half and retried, and later chunks are
+made smaller.  After successful chunks the chunk size grows again.  Rate
+limit errors and other failures are retried with exponential backoff.
+"""
+import asyncio
+import logging
+from collections import deque
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Deque
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Union
+
+from web3.types import RPCEndpoint as RPCMethod
+
+from telliot_core.contract.events import ContractEvent
+from telliot_core.contract.events import default_event_table
+from telliot_core.contract.events import EventTable
+from telliot_core.contract.listener import LogEntry
+from telliot_core.model.endpoints import RPCEndpoint
+
+logger = logging.getLogger(__name__)
+
+#: Provider error messages meaning the requested block range is too large
+TOO_MANY_RESULTS = (
+    "too many results",
+    "query returned more than",
+    "log response size exceeded",
+    "response size should not",
+    "exceed maximum block range",
+    "eth_getlogs is limited to",
+    "range is too large",
+    "range too large",
+    "query timeout exceeded",
+)
+
+#: Provider error messages meaning the request was rate limited
+RATE_LIMITED = (
+    "rate limit",
+    "too many requests",
+    "429",
+    "request rate exceeded",
+    "request count exceeded",
+    "compute units per second",
+)
+
+GetLogs = Callable[[Dict[str, Any]], Awaitable[List[Dict[str, Any]]]]
+
+
+class TooManyResults(Exception):
+    """The provider rejected an eth_getLogs request for returning too many results"""
+
+
+class RateLimited(Exception):
+    """The provider rejected an eth_getLogs request because of its rate limit"""
+
+
+def _classify(message: str) -> Optional[Exception]:
+    # Rate limit messages come first, since they may also mention limits being exceeded
+    if any(m in message.lower() for m in RATE_LIMITED):
+        return RateLimited(message)
+    if any(m in message.lower() for m in TOO_MANY_RESULTS):
+        return TooManyResults(message)
+    return None
+
+
+def _check_error(error: Any) -> None:
+    message = str(error.get("message", error) if isinstance(error, dict) else error)
+    if isinstance(error, dict) and error.get("code") == 429:
+        raise RateLimited(message)
+    raise _classify(message) or ValueError(f"eth_getLogs failed: {message}")
+
+
+class LogBackfill:
+    """Chunked, concurrent eth_getLogs over a block range
+
+    Args:
+        get_logs: Async function sending one eth_getLogs request (see from_endpoint())
+        chunk_size: Initial number of blocks per request
+        min_chunk_size: Smallest number of blocks per request
+        max_chunk_size: Largest number of blocks per request
+        concurrency: Maximum number of requests in flight
+        retries: Attempts per chunk for errors other than too many results
+        retry_delay: Seconds before the first retry (doubled after each attempt)
+
+    Example:
+        backfill = LogBackfill.from_endpoint(core.endpoint)
+        events = await backfill.get_events(start, end, address=oracle.address, events=["NewReport"])
+    """
+
+    def __init__(
+        self,
+        get_logs: GetLogs,
+        chunk_size: int = 2000,
+        min_chunk_size: int = 1,
+        max_chunk_size: int = 100_000,
+        concurrency: int = 4,
+        retries: int = 3,
+        retry_delay: float = 0.5,
+    ):
+        self._get_logs = get_logs
+        self.min_chunk_size = max(1, min_chunk_size)
+        self.max_chunk_size = max(self.min_chunk_size, max_chunk_size)
+        self.chunk_size = min(max(chunk_size, self.min_chunk_size), self.max_chunk_size)
+        self.concurrency = max(1, concurrency)
+        self.retries = max(1, retries)
+        self.retry_delay = retry_delay
+
+        #: Number of eth_getLogs requests sent
+        self.requests = 0
+
+    @classmethod
+    def from_endpoint(cls, node: RPCEndpoint, **kwargs: Any) -> "LogBackfill":
+        """Backfill using the endpoint's async connection"""
+
+        async def get_logs(log_filter: Dict[str, Any]) -> List[Dict[str, Any]]:
+            async_web3 = await node.connect_async()
+            try:
+                response = await async_web3.provider.make_request(RPCMethod("eth_getLogs"), [log_filter])
+            except Exception as e:
+                classified = _classify(str(e))
+                if classified is not None:
+                    raise classified from e
+                raise
+            if "error" in response:
+                _check_error(response["error"])
+            return response["result"]  # type: ignore
+
+        return cls(get_logs, **kwargs)
+
+    async def _fetch(self, log_filter: Dict[str, Any]) -> List[Dict[str, Any]]:
+        for attempt in range(self.retries):
+            self.requests += 1
+            try:
+                return await self._get_logs(log_filter)
+            except TooManyResults:
+                raise
+            except Exception as e:
+                if attempt + 1 == self.retries:
+                    raise
+                if isinstance(e, RateLimited):
+                    logger.info(f"eth_getLogs rate limited, retrying: {e}")
+                else:
+                    logger.warning(f"eth_getLogs failed, retrying: {e!r}")
+                await asyncio.sleep(self.retry_delay * 2**attempt)
+        raise AssertionError("unreachable")
+
+    async def get_logs(
+        self,
+        from_block: int,
+        to_block: int,
+        address: Union[str, Sequence[str], None] = None,
+        topics: Optional[List[Any]] = None,
+    ) -> List[LogEntry]:
+        """Get the logs of a block range, ordered by block and log index
+
+        Args:
+            from_block: First block (inclusive)
+            to_block: Last block (inclusive)
+            address: Contract address(es)
+            topics: Topic filter (see eth_getLogs)
+        """
+        base_filter: Dict[str, Any] = {}
+        if address is not None:
+            base_filter["address"] = address if isinstance(address, str) else list(address)
+        if topics is not None:
+            base_filter["topics"] = topics
+
+        logs: List[LogEntry] = []
+        retry: Deque[Tuple[int, int]] = deque()
+        cursor = from_block
+
+        def next_range() -> Optional[Tuple[int, int]]:
+            nonlocal cursor
+            if retry:
+                return retry.popleft()
+            if cursor > to_block:
+                return None
+            end = min(to_block, cursor + self.chunk_size - 1)
+            start, cursor = cursor, end + 1
+            return start, end
+
+        async def worker() -> None:
+            while True:
+                block_range = next_range()
+                if block_range is None:
+                    return
+                start, end = block_range
+                log_filter = {**base_filter, "fromBlock": hex(start), "toBlock": hex(end)}
+                try:
+                    result = await self._fetch(log_filter)
+                except TooManyResults:
+                    if start == end:
+                        raise
+                    middle = (start + end) // 2
+                    retry.extendleft([(middle + 1, end), (start, middle)])
+                    self.chunk_size = max(self.min_chunk_size, min(self.chunk_size, end - start + 1) // 2)
+                    logger.debug(f"Too many logs in blocks {start}-{end}, chunk size now {self.chunk_size}")
+                    continue
+
+                logs.extend(LogEntry(log) for log in result)
+                if end - start + 1 >= self.chunk_size:
+                    self.chunk_size = min(self.max_chunk_size, self.chunk_size + max(1, self.chunk_size // 4))
+
+        workers = [asyncio.create_task(worker()) for _ in range(self.concurrency)]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+
+        logs.sort(key=lambda log: (log.blockNumber, log.logIndex or 0))
+        return logs
+
+    async def get_events(
+        self,
+        from_block: int,
+        to_block: int,
+        address: Union[str, Sequence[str], None] = None,
+        events: Optional[Sequence[str]] = None,
+        table: Optional[EventTable] = None,
+    ) -> List[ContractEvent]:
+        """Get the decoded events of a block range, ordered by block and log index
+
+        Args:
+            from_block: First block (inclusive)
+            to_block: Last block (inclusive)
+            address: Contract address(es)
+            events: Event names (all events if not specified)
+            table: Event decoders (default: all ABIs packaged with telliot-core)
+        """
+        if table is None:
+            table = default_event_table()
+        topics = [table.topics(events)] if events else None
+
+        decoded = []
+        for log in await self.get_logs(from_block, to_block, address=address, topics=topics):
+            event = table.decode(log)
+            if event is not None:
+                decoded.append(event)
+        return decoded
@@ -0,0 +1,242 @@
+"""
+Utils for batching EVM contract reads with Multicall3
+
+Multicall3 is deployed at the same address on most EVM chains
+(see https://github.com/mds1/multicall), which allows many read-only
+calls, across any number of contracts, to be made with a single `eth_call`.
+"""
+import asyncio
+import itertools
+import json
+import logging
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import TYPE_CHECKING
+from typing import Union
+
+from eth_abi.exceptions import DecodingError
+from eth_typing import ABIFunction
+from eth_utils.abi import get_abi_output_types
+from eth_utils.address import to_checksum_address
+from web3 import Web3
+from web3._utils.abi import map_abi_data
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+from web3.exceptions import ContractLogicError
+
+from telliot_core.contract.abi_registry import FunctionInfo
+from telliot_core.model.endpoints import RPCEndpoint
+from telliot_core.utils.response import ResponseStatus
+
+if TYPE_CHECKING:
+    from telliot_core.contract.contract import Contract
+
+logger = logging.getLogger(__name__)
+
+#: Multicall3 deployment address (identical on most EVM chains)
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+#: Selector of the solidity `Error(string)` revert reason
+_ERROR_STRING_SELECTOR = bytes.fromhex("08c379a0")
+
+_multicall_abi_file = Path(__file__).resolve().parent.parent / "data" / "abi" / "multicall3-abi.json"
+_multicall_abi: Optional[List[Dict[str, Any]]] = None
+
+#: (endpoint URL, address) pairs where no Multicall3 contract is deployed
+_missing_multicall: Set[Tuple[str, str]] = set()
+
+
+def multicall_abi() -> List[Dict[str, Any]]:
+    """Returns the Multicall3 ABI, loading it from file the first time"""
+    global _multicall_abi
+    if _multicall_abi is None:
+        with open(_multicall_abi_file, "r") as f:
+            _multicall_abi = json.load(f)
+    return _multicall_abi
+
+
+def decode_function_output(w3: Web3, fn_abi: Union[ABIFunction, FunctionInfo], data: bytes) -> Any:
+    """Decode the return data of a contract function call
+
+    Decoding mirrors `ContractFunction.call()` so that batched reads
+    return exactly what `Contract.read` would.
+    """
+    if isinstance(fn_abi, FunctionInfo):
+        output_types = fn_abi.output_types
+    else:
+        output_types = get_abi_output_types(fn_abi)
+    output_data = w3.codec.decode(output_types, data)
+    normalized_data = map_abi_data(BASE_RETURN_NORMALIZERS, output_types, output_data)
+
+    if len(normalized_data) == 1:
+        return normalized_data[0]
+    else:
+        return normalized_data
+
+
+def revert_error(data: bytes) -> ContractLogicError:
+    """Build a ContractLogicError from the revert data of a failed call"""
+    if data[:4] == _ERROR_STRING_SELECTOR:
+        try:
+            (reason,) = Web3().codec.decode(["string"], data[4:])
+            return ContractLogicError(f"execution reverted: {reason}", data="0x" + data.hex())
+        except DecodingError:
+            pass
+    return ContractLogicError("execution reverted", data="0x" + data.hex())
+
+
+@dataclass
+class ContractCall:
+    """A single contract read queued in a MulticallBatch"""
+
+    contract: "Contract"
+    func_name: str
+    args: Tuple[Any, ...] = ()
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+
+    def encode(self) -> Tuple[FunctionInfo, bytes]:
+        """Returns the precompiled function ABI and the encoded calldata"""
+        fn_info = self.contract.compiled_abi.function(self.func_name)
+        contract_function = self.contract.get_function(self.func_name)
+        calldata = contract_function(*self.args, **self.kwargs)._encode_transaction_data()
+        return fn_info, bytes.fromhex(calldata[2:])
+
+
+class MulticallBatch:
+    """Aggregate contract reads into Multicall3 `aggregate3` calls
+
+    Reads can be queued for any `Contract` connected to the same endpoint.
+    `execute()` sends them in as few `eth_call` requests as possible
+    and returns the usual `(value, ResponseStatus)` pair for each read,
+    in the order they were added.
+
+    Example:
+        batch = MulticallBatch(node)
+        batch.add(oracle, "getStakerInfo", address)
+        batch.add(autopay, "getCurrentTip", _queryId=query_id)
+        (staker_info, status), (tip, status) = await batch.execute()
+    """
+
+    def __init__(
+        self,
+        node: RPCEndpoint,
+        address: Optional[str] = None,
+        max_calls: int = 500,
+    ):
+        self.node = node
+        self.address = to_checksum_address(address or MULTICALL3_ADDRESS)
+        self.max_calls = max_calls
+        self.calls: List[ContractCall] = []
+
+    def __len__(self) -> int:
+        return len(self.calls)
+
+    def add(self, contract: "Contract", func_name: str, *args: Any, **kwargs: Any) -> int:
+        """Queue a contract read
+
+        returns:
+            Index of the read in the results returned by `execute()`
+        """
+        if contract.node is not self.node and contract.node.url != self.node.url:
+            raise ValueError(f"Contract {contract.address} is not connected to endpoint {self.node.url}")
+
+        self.calls.append(ContractCall(contract=contract, func_name=func_name, args=args, kwargs=kwargs))
+        return len(self.calls) - 1
+
+    async def execute(self) -> List[Tuple[Any, ResponseStatus]]:
+        """Send all queued reads and decode the results
+
+        A failure of one read (e.g. a revert) does not affect the others.
+        Reverts are reported with a `ContractLogicError` in the status,
+        the same as `Contract.read`.  On chains without a Multicall3
+        contract, the reads are sent individually with `Contract.read`.
+        """
+        results: List[Tuple[Any, ResponseStatus]] = [(None, ResponseStatus()) for _ in self.calls]
+
+        if not self.node.web3:
+            msg = "node is not instantiated"
+            return [(None, ResponseStatus(ok=False, error=msg)) for _ in self.calls]
+
+        # Encode calldata, reporting encoding errors per call
+        encoded: List[Tuple[int, FunctionInfo, bytes]] = []
+        for i, call in enumerate(self.calls):
+            if not call.contract.contract:
+                results[i] = None, ResponseStatus(ok=False, error="no instance of contract")
+                continue
+            try:
+                fn_info, calldata = call.encode()
+                encoded.append((i, fn_info, calldata))
+            except ValueError as e:
+                msg = f"function '{call.func_name}' not found in contract abi"
+                results[i] = None, ResponseStatus(ok=False, e=e, error=msg)
+            except Exception as e:
+                msg = f"error encoding call to '{call.func_name}'"
+                results[i] = None, ResponseStatus(ok=False, e=e, error=msg)
+
+        if (self.node.url, self.address) in _missing_multicall:
+            await self._read_individually([i for i, _, _ in encoded], results)
+            return results
+
+        async_web3 = await self.node.connect_async()
+        multicall = async_web3.eth.contract(address=self.address, abi=multicall_abi())
+
+        for chunk in _chunks(encoded, self.max_calls):
+            calls = [(self.calls[i].contract.address, True, calldata) for i, _, calldata in chunk]
+            try:
+                response = await multicall.functions.aggregate3(calls).call()
+            except Exception as e:
+                if not await self._multicall_deployed(async_web3):
+                    logger.warning(f"No Multicall3 contract at {self.address}, reading contracts individually")
+                    _missing_multicall.add((self.node.url, self.address))
+                    await self._read_individually([i for i, _, _ in chunk], results)
+                    continue
+                msg = "error reading from multicall contract"
+                logger.error(f"{msg}: {e!r}")
+                for i, _, _ in chunk:
+                    results[i] = None, ResponseStatus(ok=False, e=e, error=msg)
+                continue
+
+            for (i, fn_info, _), (success, return_data) in zip(chunk, response):
+                results[i] = self._decode(fn_info, success, return_data)
+
+        return results
+
+    async def _multicall_deployed(self, async_web3: Any) -> bool:
+        try:
+            return len(await async_web3.eth.get_code(self.address)) > 0
+        except Exception:
+            # Unknown, keep reporting the multicall error
+            return True
+
+    async def _read_individually(self, indices: List[int], results: List[Tuple[Any, ResponseStatus]]) -> None:
+        """Fallback for chains without Multicall3: one `Contract.read` per call"""
+        reads = [
+            self.calls[i].contract.read(self.calls[i].func_name, *self.calls[i].args, **self.calls[i].kwargs)
+            for i in indices
+        ]
+        for i, result in zip(indices, await asyncio.gather(*reads)):
+            results[i] = result
+
+    def _decode(self, fn_info: FunctionInfo, success: bool, return_data: bytes) -> Tuple[Any, ResponseStatus]:
+        """Decode a single aggregate3 result"""
+        if not success:
+            e = revert_error(return_data)
+            return None, ResponseStatus(ok=False, e=e, error="error reading from contract")
+        try:
+            assert self.node.web3 is not None
+            return decode_function_output(self.node.web3, fn_info, return_data), ResponseStatus(ok=True)
+        except Exception as e:
+            msg = f"error decoding output of '{fn_info.name}'"
+            return None, ResponseStatus(ok=False, e=e, error=msg)
+
+
+def _chunks(items: List[Any], size: int) -> List[List[Any]]:
+    """Split a list into chunks of at most `size` items"""
+    it = iter(items)
+    return list(iter(lambda: list(itertools.islice(it, size)), []))
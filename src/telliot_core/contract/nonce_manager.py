@@ -0,0 +1,150 @@
+"""
+Local transaction nonce management
+
+Fetching the account nonce from the node before every transaction costs a
+round trip and only allows one transaction in flight per account.
+`NonceManager` syncs the nonce from the node once, then hands out
+consecutive nonces locally.  Nonces released without being broadcast are
+reused, and the manager resyncs when the node reports a nonce error.
+"""
+import asyncio
+import heapq
+import logging
+from typing import List
+from typing import Optional
+from typing import Set
+
+from eth_utils.address import to_checksum_address
+
+from telliot_core.model.endpoints import RPCEndpoint
+
+logger = logging.getLogger(__name__)
+
+#: Fragments of node error messages that indicate an out-of-sync nonce
+NONCE_ERRORS = (
+    "nonce too low",
+    "nonce too high",
+    "already known",
+    "replacement transaction underpriced",
+    "invalid nonce",
+    "invalid transaction nonce",
+)
+
+
+def is_nonce_error(e: Exception) -> bool:
+    """True if the exception was caused by an out-of-sync nonce"""
+    msg = str(e).lower()
+    return any(fragment in msg for fragment in NONCE_ERRORS)
+
+
+class NonceManager:
+    """Hands out transaction nonces for one account
+
+    Args:
+        node: Endpoint used to sync the nonce
+        address: Account address
+    """
+
+    def __init__(self, node: RPCEndpoint, address: str):
+        self.node = node
+        self.address = to_checksum_address(address)
+
+        self._next_nonce: Optional[int] = None
+        self._needs_sync = True
+        self._lock = asyncio.Lock()
+
+        #: Nonces handed out but not broadcast yet
+        self._reserved: Set[int] = set()
+
+        #: Released nonces below the next nonce, reused before new ones
+        self._released: List[int] = []
+
+    #: Next nonce to be handed out, or None if a sync is required
+    next = property(lambda self: None if self._needs_sync else self._next_nonce)
+
+    #: Nonces handed out but not broadcast yet
+    reserved = property(lambda self: frozenset(self._reserved))
+
+    async def sync(self) -> int:
+        """Reset the next nonce from the node's pending transaction count
+
+        The pending count does not include reserved nonces that are not
+        broadcast yet, so the next nonce is kept above them.  Nor does it
+        include broadcast nonces above an unused (released) nonce, so while
+        such a gap is open the local counter is not rewound.
+        """
+        async_web3 = await self.node.connect_async()
+        pending = await async_web3.eth.get_transaction_count(self.address, "pending")
+
+        gaps = [nonce for nonce in self._released if nonce >= pending]
+        floor = [pending] + [nonce + 1 for nonce in self._reserved]
+        if gaps and self._next_nonce is not None:
+            floor.append(self._next_nonce)
+
+        self._next_nonce = max(floor)
+        self._released = gaps
+        heapq.heapify(self._released)
+        self._needs_sync = False
+        logger.debug(f"Synced nonce for {self.address}: {self._next_nonce}")
+        return self._next_nonce
+
+    async def next_nonce(self) -> int:
+        """Reserve the next nonce, reusing released nonces first"""
+        async with self._lock:
+            if self._needs_sync:
+                await self.sync()
+            assert self._next_nonce is not None
+
+            if self._released:
+                nonce = heapq.heappop(self._released)
+            else:
+                nonce = self._next_nonce
+                self._next_nonce += 1
+            self._reserved.add(nonce)
+            return nonce
+
+    def observe(self, nonce: int) -> None:
+        """Record a nonce that was chosen outside of the manager"""
+        if nonce in self._released:
+            self._released.remove(nonce)
+            heapq.heapify(self._released)
+        if not self._needs_sync and self._next_nonce is not None and nonce >= self._next_nonce:
+            self._next_nonce = nonce + 1
+
+    def confirm(self, nonce: int) -> None:
+        """Record that a reserved nonce was broadcast"""
+        self._reserved.discard(nonce)
+
+    def release(self, nonce: int) -> None:
+        """Return a reserved nonce that was never broadcast
+
+        Releasing the most recent nonce simply rewinds the counter.
+        Otherwise later nonces were already handed out, so the released
+        nonce fills the gap at the next reservation.
+        """
+        self._reserved.discard(nonce)
+        if self._next_nonce is None:
+            return
+        if nonce == self._next_nonce - 1 and not self._needs_sync:
+            self._next_nonce = nonce
+            # Released nonces now at the end of the sequence also rewind the counter
+            while self._released and max(self._released) == self._next_nonce - 1:
+                self._released.remove(self._next_nonce - 1)
+                self._next_nonce -= 1
+            heapq.heapify(self._released)
+        elif nonce < self._next_nonce and nonce not in self._released:
+            heapq.heappush(self._released, nonce)
+
+    def invalidate(self) -> None:
+        """Force a sync with the node before the next reservation"""
+        self._needs_sync = True
+
+    def handle_error(self, nonce: int, e: Exception) -> None:
+        """Update the nonce state after a failed broadcast"""
+        if is_nonce_error(e):
+            # The node already knows this nonce (or rejects it): do not reuse it
+            logger.warning(f"Nonce {nonce} out of sync for {self.address}: {e}")
+            self._reserved.discard(nonce)
+            self.invalidate()
+        else:
+            self.release(nonce)
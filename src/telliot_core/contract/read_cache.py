@@ -0,0 +1,147 @@
+"""
+Block-scoped cache for contract reads
+
+Most contract getters return the same value for every call within a block.
+`ReadCache` stores successful `Contract.read` results keyed by
+(address, function, args, block number), so duplicate reads in a block
+never reach the node.  Entries from older blocks are dropped when a new
+block is seen, typically via `Listener.subscribe_new_blocks`.
+
+Functions with values that rarely or never change can be given a TTL,
+in which case their entries are kept across blocks until they expire.
+"""
+import logging
+import time
+from collections import OrderedDict
+from typing import Any
+from typing import Dict
+from typing import Hashable
+from typing import Optional
+from typing import Tuple
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from telliot_core.contract.listener import Listener
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[str, str, Hashable, Hashable, Optional[int]]
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert (nested) lists and dicts to hashable tuples"""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    elif isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    hash(value)  # raises TypeError for other unhashable values
+    return value  # type: ignore
+
+
+class ReadCache:
+    """LRU cache of contract reads, invalidated on each new block
+
+    Args:
+        maxsize:
+            Maximum number of cached reads.  The least recently used
+            entry is evicted when the cache is full.
+        ttl:
+            Per-function cache lifetime overrides, in seconds.
+            Reads of these functions are cached independently of the block
+            number.  A TTL of None caches the value for the life of the cache.
+
+    Example:
+        cache = ReadCache(ttl={"getTokenAddress": None, "getStakeAmount": 60})
+        await cache.attach(core.listener)
+        oracle.read_cache = cache
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[Dict[str, Optional[float]]] = None):
+        self.maxsize = maxsize
+        self.ttl: Dict[str, Optional[float]] = dict(ttl or {})
+
+        #: Cache statistics
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: "OrderedDict[CacheKey, Tuple[Any, Optional[float]]]" = OrderedDict()
+        self._block_number: Optional[int] = None
+
+    #: Latest block number seen, or None if unknown
+    block_number = property(lambda self: self._block_number)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def key(self, address: str, func_name: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Optional[CacheKey]:
+        """Build the cache key for a read, or None if the read cannot be cached
+
+        The key should be built before the read is sent, so that a value read
+        while a new block arrives is not cached for the new block.
+        """
+        if func_name in self.ttl:
+            block_number = None
+        elif self._block_number is None:
+            # Block-scoped entries cannot be invalidated without knowing the block
+            return None
+        else:
+            block_number = self._block_number
+
+        try:
+            return address, func_name, _freeze(args), _freeze(kwargs), block_number
+        except TypeError:
+            return None
+
+    def get(self, key: CacheKey) -> Tuple[bool, Any]:
+        """Look up a read
+
+        returns:
+            (hit, value) tuple
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, expires = entry
+            if expires is None or expires > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, value
+            del self._entries[key]
+
+        self.misses += 1
+        return False, None
+
+    def set(self, key: CacheKey, value: Any) -> None:
+        """Store the result of a successful read"""
+        _, func_name, _, _, block_number = key
+        if block_number is not None and block_number != self._block_number:
+            return
+
+        ttl = self.ttl.get(func_name)
+        expires = time.monotonic() + ttl if ttl is not None else None
+
+        self._entries[key] = (value, expires)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def set_block_number(self, block_number: int) -> None:
+        """Record a new block, dropping reads cached for earlier blocks"""
+        if block_number == self._block_number:
+            return
+
+        self._block_number = block_number
+        stale = [key for key in self._entries if key[4] is not None and key[4] != block_number]
+        for key in stale:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all cached reads"""
+        self._entries.clear()
+
+    async def handle_new_block(self, block: Any) -> None:
+        """Listener handler for new block headers"""
+        self.set_block_number(int(block["number"]))
+
+    async def attach(self, listener: "Listener") -> None:
+        """Invalidate the cache on each new block seen by the listener"""
+        await listener.subscribe_new_blocks(handler=self.handle_new_block)
@@ -0,0 +1,142 @@
+"""
+Block-driven transaction confirmation
+
+`web3.eth.wait_for_transaction_receipt` polls the node in a loop for each
+transaction.  `ReceiptTracker` instead checks all pending transactions once
+per new block, typically via `Listener.subscribe_new_blocks`, with a single
+JSON-RPC batch of `eth_getTransactionReceipt` requests.
+"""
+import asyncio
+import logging
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import TYPE_CHECKING
+from typing import Union
+
+from hexbytes import HexBytes
+from web3._utils.method_formatters import receipt_formatter
+from web3.datastructures import AttributeDict
+from web3.exceptions import TimeExhausted
+from web3.types import RPCEndpoint as RPCMethod
+
+from telliot_core.model.endpoints import RPCEndpoint
+
+if TYPE_CHECKING:
+    from telliot_core.contract.listener import Listener
+
+logger = logging.getLogger(__name__)
+
+Receipt = AttributeDict[str, Any]
+
+
+class ReceiptTracker:
+    """Resolve transaction receipts on each new block
+
+    Args:
+        node: Endpoint used to look up receipts
+        timeout: Default seconds to wait for a receipt
+
+    Example:
+        tracker = ReceiptTracker(core.endpoint)
+        await tracker.attach(core.listener)
+        oracle.receipt_tracker = tracker
+    """
+
+    def __init__(self, node: RPCEndpoint, timeout: float = 360.0):
+        self.node = node
+        self.timeout = timeout
+
+        self._pending: Dict[HexBytes, "asyncio.Future[Receipt]"] = {}
+        self._lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def track(self, tx_hash: HexBytes) -> "asyncio.Future[Receipt]":
+        """Get or create the future for a transaction receipt"""
+        tx_hash = HexBytes(tx_hash)
+        future = self._pending.get(tx_hash)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[tx_hash] = future
+        return future
+
+    async def wait_for_receipt(self, tx_hash: HexBytes, timeout: Optional[float] = None) -> Receipt:
+        """Wait until a transaction is mined
+
+        Raises web3's `TimeExhausted` if no receipt is found in time,
+        the same as `wait_for_transaction_receipt`.
+        """
+        tx_hash = HexBytes(tx_hash)
+        timeout = self.timeout if timeout is None else timeout
+        future = self.track(tx_hash)
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            self._pending.pop(tx_hash, None)
+            raise TimeExhausted(f"Transaction {tx_hash.to_0x_hex()} is not in the chain after {timeout} seconds")
+
+    async def check(self) -> None:
+        """Look up all pending receipts and resolve the mined transactions"""
+        async with self._lock:
+            self._pending = {h: f for h, f in self._pending.items() if not f.done()}
+            tx_hashes = list(self._pending)
+            if not tx_hashes:
+                return
+
+            try:
+                results = await self._get_receipts(tx_hashes)
+            except Exception as e:
+                # Pending transactions are checked again on the next block
+                logger.warning(f"Receipt lookup failed: {e!r}")
+                return
+
+            for tx_hash, receipt in zip(tx_hashes, results):
+                if receipt is None:
+                    continue
+                future = self._pending.pop(tx_hash)
+                if future.done():
+                    continue
+                if isinstance(receipt, Exception):
+                    # Only the transaction whose lookup failed is affected
+                    logger.warning(f"Receipt lookup of {tx_hash.to_0x_hex()} failed: {receipt!r}")
+                    future.set_exception(receipt)
+                else:
+                    future.set_result(receipt)
+
+    async def _get_receipts(self, tx_hashes: List[HexBytes]) -> List[Union[Receipt, None, Exception]]:
+        """Batched eth_getTransactionReceipt
+
+        Returns the receipts, None for unmined transactions, or the error of a failed lookup.
+        """
+        async_web3 = await self.node.connect_async()
+        method = RPCMethod("eth_getTransactionReceipt")
+        requests = [(method, [tx_hash.to_0x_hex()]) for tx_hash in tx_hashes]
+
+        responses = await async_web3.provider.make_batch_request(requests)
+        if not isinstance(responses, list):
+            # Node does not support batches: look up receipts one at a time
+            logger.debug(f"JSON-RPC batch failed, falling back to single requests: {responses}")
+            responses = await asyncio.gather(*[async_web3.provider.make_request(m, p) for m, p in requests])
+
+        results: List[Union[Receipt, None, Exception]] = []
+        for response in responses:
+            if "error" in response:
+                results.append(ValueError(response["error"]))
+                continue
+            result = response.get("result")
+            try:
+                results.append(AttributeDict.recursive(receipt_formatter(result)) if result else None)
+            except Exception as e:
+                results.append(e)
+        return results
+
+    async def handle_new_block(self, block: Any) -> None:
+        """Listener handler for new block headers"""
+        await self.check()
+
+    async def attach(self, listener: "Listener") -> None:
+        """Check pending receipts on each new block seen by the listener"""
+        await listener.subscribe_new_blocks(handler=self.handle_new_block)
@@ -1,22 +1,153 @@
+import asyncio
+import functools
 import json
+import logging
 from dataclasses import dataclass
 from dataclasses import field
 from pathlib import Path
 from typing import Any
+from typing import Iterable
 from typing import Optional
+from typing import TYPE_CHECKING
 
+import aiohttp
 import requests
 from clamfig import deserialize
 from clamfig import Serializable
+from eth_utils.address import to_checksum_address
 
+from telliot_core.abi_cache import default_abi_cache
 from telliot_core.apps.config import ConfigOptions
 from telliot_core.utils.home import TELLIOT_CORE_ROOT
+from telliot_core.utils.lazy import load_with_snapshot
 
+logger = logging.getLogger(__name__)
 
 # Read contract ABIs from json files
 _abi_folder = Path(__file__).resolve().parent / "data" / "abi"
 
 
+def explorer_api_url(chain_id: int) -> str:
+    """Block explorer API used to retrieve contract ABIs"""
+    if chain_id == 1:
+        url = "https://api.etherscan.io"
+    elif chain_id == 3:
+        url = "https://api-ropsten.etherscan.io"
+    elif chain_id == 4:
+        url = "https://api-rinkeby.etherscan.io"
+    elif chain_id == 5:
+        url = "https://api-goerli.etherscan.io"
+    elif chain_id == 42:
+        url = "https://api-kovan.etherscan.io"
+    elif chain_id == 137:
+        url = "https://api.polygonscan.com"
+    elif chain_id == 420:
+        url = "https://goerli-optimism.etherscan.io/"
+    elif chain_id == 80001:
+        url = "https://api-testnet.polygonscan.com"
+    elif chain_id == 42161:
+        url = "https://api.arbiscan.io/"
+    elif chain_id == 421613:
+        url = "https://goerli.arbiscan.io/"
+    elif chain_id == 10200:
+        url = "https://blockscout.chiadochain.net/"
+    elif chain_id == 100:
+        url = "https://api.gnosisscan.io"
+    elif chain_id == 10:
+        url = "https://optimistic.etherscan.io/"
+    elif chain_id == 3141:
+        url = "https://hyperspace.filfox.info/en"
+    elif chain_id == 314159:
+        url = "https://calibration.filfox.info/en"
+    elif chain_id == 314:
+        url = "https://filfox.info/en"
+    elif chain_id == 11155111:
+        url = "https://api-sepolia.etherscan.io"
+    elif chain_id == 3441005:
+        url = "https://manta-testnet.calderaexplorer.xyz"
+    elif chain_id == 84531:
+        url = "https://api-goerli.basescan.org/"
+    elif chain_id == 5001:
+        url = "https://explorer.testnet.mantle.xyz/"
+    elif chain_id == 5000:
+        url = "https://explorer.mantle.xyz/"
+    elif chain_id == 2442:
+        url = "https://cardona-zkevm.polygonscan.com/"
+    elif chain_id == 1101:
+        url = "https://zkevm.polygonscan.com/"
+    elif chain_id == 59140:
+        url = "https://goerli.lineascan.build"
+    elif chain_id == 59144:
+        url = "https://lineascan.build"
+    elif chain_id == 2522:
+        url = "https://api-holesky.fraxscan.com"
+    elif chain_id == 252:
+        url = "https://api.fraxscan.com"
+    elif chain_id == 1998:
+        url = "https://testnet.kyotoscan.io"
+    elif chain_id == 1444673419:
+        url = "https://juicy-low-small-testnet.explorer.testnet.skalenodes.com"
+    elif chain_id == 2046399126:
+        url = "https://elated-tan-skat.explorer.mainnet.skalenodes.com"
+    elif chain_id == 59141:
+        url = "https://api-sepolia.lineascan.build"
+    elif chain_id == 324:
+        url = "https://block-explorer-api.mainnet.zksync.io"
+    elif chain_id == 300:
+        url = "https://block-explorer-api.sepolia.zksync.io"
+    elif chain_id == 80002:
+        url = "https://api-amoy.polygonscan.com/"
+    elif chain_id == 11155420:
+        url = "https://api-sepolia-optimism.etherscan.io/"
+    elif chain_id == 421614:
+        url = "https://api-sepolia.arbiscan.io/"
+    elif chain_id == 5003:
+        url = "https://explorer.sepolia.mantle.xyz/"
+    elif chain_id == 84532:
+        url = "https://api-sepolia.basescan.org/"
+    elif chain_id == 111:
+        url = "https://testnet-explorer.gobob.xyz:443"
+    elif chain_id == 60808:
+        url = "https://explorer.gobob.xyz:443"
+    elif chain_id == 919:
+        url = "https://sepolia.explorer.mode.network:443"
+    elif chain_id == 1918988905:
+        url = "https://testnet.rpc.rarichain.org/http"
+    elif chain_id == 41:
+        url = "https://testnet.telos.net/evm"
+    elif chain_id == 2340:
+        url = "https://testnet-rpc.atleta.network:9944"
+    elif chain_id == 842:
+        url = "https://rpc.testnet.taraxa.io"
+    elif chain_id == 808813:
+        url = "https://bob-sepolia.explorer.gobob.xyz/"
+    elif chain_id == 534352:
+        url = "https://rpc.scroll.io"
+    elif chain_id == 8453:
+        url = "https://base.llamarpc.com"
+    elif chain_id == 1135:
+        url = "https://blockscout.lisk.com/"
+    else:
+        raise ValueError(f"Could not retrieve ABI using chain_id {chain_id}")
+
+    return url
+
+
+_EXPLORER_HEADERS = {"User-Agent": "Mozilla/5.0 (Windows NT 6.1; WOW64; rv:77.0) Gecko/20190101 Firefox/77.0"}
+
+#: Seconds to wait for a chain explorer response
+EXPLORER_TIMEOUT = 10.0
+
+
+async def _get_abi_json(session: aiohttp.ClientSession, url: str) -> Any:
+    timeout = aiohttp.ClientTimeout(total=EXPLORER_TIMEOUT)
+    try:
+        async with session.get(url, headers=_EXPLORER_HEADERS, timeout=timeout) as response:
+            return json.loads(await response.read())
+    except asyncio.TimeoutError as e:
+        raise TimeoutError(f"Chain explorer did not respond within {EXPLORER_TIMEOUT} s") from e
+
+
 @dataclass
 class ContractInfo(Serializable):
     name: str
@@ -30,8 +161,9 @@ class ContractInfo(Serializable):
         """Returns the contract ABI.
 
         The ABI is lazily loaded from a file the first time it is requested
-        and stored for later access.  If an abi file is not defined, an attempt
-        is made to retrieve the ABI from the chain explorer.
+        and stored for later access.  If an abi file is not defined, the ABI
+        is loaded from the on-disk ABI cache, or retrieved from the chain
+        explorer and added to the cache.
         """
         if not chain_id:
             chain_id = list(self.address.keys())[0]
@@ -41,120 +173,75 @@ class ContractInfo(Serializable):
                 with open(_abi_folder / self.abi_file, "r") as f:
                     self._abi = json.load(f)
             else:
-                # try to get from etherscan or other explorer using example:
-                address = self.address[chain_id]
-                if chain_id == 1:
-                    url = "https://api.etherscan.io"
-                elif chain_id == 3:
-                    url = "https://api-ropsten.etherscan.io"
-                elif chain_id == 4:
-                    url = "https://api-rinkeby.etherscan.io"
-                elif chain_id == 5:
-                    url = "https://api-goerli.etherscan.io"
-                elif chain_id == 42:
-                    url = "https://api-kovan.etherscan.io"
-                elif chain_id == 137:
-                    url = "https://api.polygonscan.com"
-                elif chain_id == 420:
-                    url = "https://goerli-optimism.etherscan.io/"
-                elif chain_id == 80001:
-                    url = "https://api-testnet.polygonscan.com"
-                elif chain_id == 42161:
-                    url = "https://api.arbiscan.io/"
-                elif chain_id == 421613:
-                    url = "https://goerli.arbiscan.io/"
-                elif chain_id == 10200:
-                    url = "https://blockscout.chiadochain.net/"
-                elif chain_id == 100:
-                    url = "https://api.gnosisscan.io"
-                elif chain_id == 10:
-                    url = "https://optimistic.etherscan.io/"
-                elif chain_id == 3141:
-                    url = "https://hyperspace.filfox.info/en"
-                elif chain_id == 314159:
-                    url = "https://calibration.filfox.info/en"
-                elif chain_id == 314:
-                    url = "https://filfox.info/en"
-                elif chain_id == 11155111:
-                    url = "https://api-sepolia.etherscan.io"
-                elif chain_id == 3441005:
-                    url = "https://manta-testnet.calderaexplorer.xyz"
-                elif chain_id == 84531:
-                    url = "https://api-goerli.basescan.org/"
-                elif chain_id == 5001:
-                    url = "https://explorer.testnet.mantle.xyz/"
-                elif chain_id == 5000:
-                    url = "https://explorer.mantle.xyz/"
-                elif chain_id == 2442:
-                    url = "https://cardona-zkevm.polygonscan.com/"
-                elif chain_id == 1101:
-                    url = "https://zkevm.polygonscan.com/"
-                elif chain_id == 59140:
-                    url = "https://goerli.lineascan.build"
-                elif chain_id == 59144:
-                    url = "https://lineascan.build"
-                elif chain_id == 2522:
-                    url = "https://api-holesky.fraxscan.com"
-                elif chain_id == 252:
-                    url = "https://api.fraxscan.com"
-                elif chain_id == 1998:
-                    url = "https://testnet.kyotoscan.io"
-                elif chain_id == 1444673419:
-                    url = "https://juicy-low-small-testnet.explorer.testnet.skalenodes.com"
-                elif chain_id == 2046399126:
-                    url = "https://elated-tan-skat.explorer.mainnet.skalenodes.com"
-                elif chain_id == 59141:
-                    url = "https://api-sepolia.lineascan.build"
-                elif chain_id == 324:
-                    url = "https://block-explorer-api.mainnet.zksync.io"
-                elif chain_id == 300:
-                    url = "https://block-explorer-api.sepolia.zksync.io"
-                elif chain_id == 80002:
-                    url = "https://api-amoy.polygonscan.com/"
-                elif chain_id == 11155420:
-                    url = "https://api-sepolia-optimism.etherscan.io/"
-                elif chain_id == 421614:
-                    url = "https://api-sepolia.arbiscan.io/"
-                elif chain_id == 5003:
-                    url = "https://explorer.sepolia.mantle.xyz/"
-                elif chain_id == 84532:
-                    url = "https://api-sepolia.basescan.org/"
-                elif chain_id == 111:
-                    url = "https://testnet-explorer.gobob.xyz:443"
-                elif chain_id == 60808:
-                    url = "https://explorer.gobob.xyz:443"
-                elif chain_id == 919:
-                    url = "https://sepolia.explorer.mode.network:443"
-                elif chain_id == 1918988905:
-                    url = "https://testnet.rpc.rarichain.org/http"
-                elif chain_id == 41:
-                    url = "https://testnet.telos.net/evm"
-                elif chain_id == 2340:
-                    url = "https://testnet-rpc.atleta.network:9944"
-                elif chain_id == 842:
-                    url = "https://rpc.testnet.taraxa.io"
-                elif chain_id == 808813:
-                    url = "https://bob-sepolia.explorer.gobob.xyz/"
-                elif chain_id == 534352:
-                    url = "https://rpc.scroll.io"
-                elif chain_id == 8453:
-                    url = "https://base.llamarpc.com"
-                elif chain_id == 1135:
-                    url = "https://blockscout.lisk.com/"
-                else:
-                    raise ValueError(f"Could not retrieve ABI using chain_id {chain_id}")
-
-                url = url + f"/api?module=contract&action=getabi&address={address}&format=raw"
-
-                if api_key:
-                    url = url + f"&apikey={api_key}"
-
-                headers = {"User-Agent": "Mozilla/5.0 (Windows NT 6.1; WOW64; rv:77.0) Gecko/20190101 Firefox/77.0"}
-                response = requests.get(url, headers=headers)
-                self._abi = response.json()
+                self._abi = self._fetch_abi(chain_id, api_key)
 
         return self._abi
 
+    async def get_abi_async(
+        self,
+        chain_id: int = 0,
+        api_key: str = "",
+        session: Optional[aiohttp.ClientSession] = None,
+    ) -> list[Any]:
+        """Returns the contract ABI, retrieving it from the chain explorer without blocking."""
+        if not chain_id:
+            chain_id = list(self.address.keys())[0]
+
+        if not self._abi and not self.abi_file:
+            self._abi = await self.fetch_abi_async(chain_id, api_key=api_key, session=session)
+
+        return self.get_abi(chain_id=chain_id, api_key=api_key)
+
+    async def fetch_abi_async(
+        self,
+        chain_id: int,
+        api_key: str = "",
+        session: Optional[aiohttp.ClientSession] = None,
+    ) -> Any:
+        """Load the ABI deployed on a chain from the ABI cache or the chain explorer"""
+        abi = default_abi_cache().get(chain_id, self.address[chain_id])
+        if abi is None:
+            url = self.abi_url(chain_id, api_key)
+            if session is None:
+                async with aiohttp.ClientSession() as temp_session:
+                    abi = await _get_abi_json(temp_session, url)
+            else:
+                abi = await _get_abi_json(session, url)
+            self._cache_abi(chain_id, abi)
+
+        return abi
+
+    def abi_url(self, chain_id: int, api_key: str = "") -> str:
+        """Chain explorer URL of the contract ABI"""
+        address = self.address[chain_id]
+        url = explorer_api_url(chain_id) + f"/api?module=contract&action=getabi&address={address}&format=raw"
+
+        if api_key:
+            url = url + f"&apikey={api_key}"
+
+        return url
+
+    def _fetch_abi(self, chain_id: int, api_key: str) -> Any:
+        """Load the ABI from the ABI cache or the chain explorer"""
+        address = self.address[chain_id]
+        abi = default_abi_cache().get(chain_id, address)
+        if abi is None:
+            response = requests.get(
+                self.abi_url(chain_id, api_key), headers=_EXPLORER_HEADERS, timeout=EXPLORER_TIMEOUT
+            )
+            abi = response.json()
+            self._cache_abi(chain_id, abi)
+
+        return abi
+
+    def _cache_abi(self, chain_id: int, abi: Any) -> None:
+        """Store ABIs retrieved from the explorer (error messages are not cached)"""
+        if isinstance(abi, list) and abi:
+            try:
+                default_abi_cache().put(chain_id, self.address[chain_id], abi)
+            except OSError as e:
+                logger.warning(f"Unable to cache ABI of {self.name}: {e!r}")
+
     def restore_state(self, state: dict[Any, Any]) -> None:
         """Workaround JSON dict key type issue.  This should be handled by clamfig in future."""
         strkeys = list(state["address"].keys())
@@ -164,12 +251,45 @@ class ContractInfo(Serializable):
         super().restore_state(state)
 
 
+def _address_key(address: str) -> str:
+    """Address index key: the checksummed address, if valid"""
+    try:
+        return to_checksum_address(address.strip())
+    except ValueError:
+        return address
+
+
 @dataclass
 class ContractDirectory(ConfigOptions):
-    """Contract directory object"""
+    """Contract directory object
+
+    Entries are indexed by name, by (chain_id, name) and by checksummed address,
+    so exact lookups with `get()` and `get_by_address()` take constant time.
+    """
 
     entries: dict[str, ContractInfo] = field(default_factory=dict)
 
+    _by_chain: dict[int, dict[str, ContractInfo]] = field(default_factory=dict, init=False, repr=False)
+    _by_address: dict[str, list[ContractInfo]] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.reindex()
+
+    def reindex(self) -> None:
+        """Rebuild the lookup indexes from the entries."""
+
+        self._by_chain = {}
+        self._by_address = {}
+        for entry in self.entries.values():
+            self._index(entry)
+
+    def _index(self, entry: ContractInfo) -> None:
+        for chain_id, address in entry.address.items():
+            self._by_chain.setdefault(chain_id, {})[entry.name] = entry
+            same_address = self._by_address.setdefault(_address_key(address), [])
+            if entry not in same_address:
+                same_address.append(entry)
+
     def add_entry(self, entry: ContractInfo) -> None:
         """Add ContractInfo object to directory."""
 
@@ -177,6 +297,11 @@ class ContractDirectory(ConfigOptions):
             raise ValueError(f"Contrct {entry.name} already in directory")
 
         self.entries[entry.name] = entry
+        self._index(entry)
+
+    def restore_state(self, state: dict[Any, Any]) -> None:
+        super().restore_state(state)
+        self.reindex()
 
     @classmethod
     def from_file(cls, filepath: Path) -> "ContractDirectory":
@@ -194,6 +319,49 @@ class ContractDirectory(ConfigOptions):
 
         return obj
 
+    async def prefetch_abis(
+        self,
+        chain_ids: Iterable[int],
+        api_key: str = "",
+        session: Optional[aiohttp.ClientSession] = None,
+    ) -> None:
+        """Retrieve the explorer ABIs of all contracts deployed on the given chains
+
+        ABIs are fetched concurrently and stored in the on-disk ABI cache,
+        so later calls to get_abi() do not depend on the explorer.
+        """
+        infos = []
+        for chain_id in chain_ids:
+            for info in self._by_chain.get(chain_id, {}).values():
+                if not info.abi_file:
+                    infos.append((chain_id, info))
+
+        results = await asyncio.gather(
+            *[info.fetch_abi_async(chain_id, api_key=api_key, session=session) for chain_id, info in infos],
+            return_exceptions=True,
+        )
+        for (chain_id, info), result in zip(infos, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Unable to retrieve ABI of {info.name} on chain {chain_id}: {result!r}")
+
+    def get(self, name: str, chain_id: Optional[int] = None) -> Optional[ContractInfo]:
+        """Get a contract by exact name, optionally requiring a deployment on chain_id."""
+
+        if chain_id is None:
+            return self.entries.get(name)
+
+        return self._by_chain.get(chain_id, {}).get(name)
+
+    def get_by_address(self, address: str, chain_id: Optional[int] = None) -> Optional[ContractInfo]:
+        """Get the contract deployed at an address (any letter case)."""
+
+        key = _address_key(address)
+        for info in self._by_address.get(key, []):
+            if chain_id is None or (chain_id in info.address and _address_key(info.address[chain_id]) == key):
+                return info
+
+        return None
+
     def find(
         self,
         *,
@@ -202,10 +370,21 @@ class ContractDirectory(ConfigOptions):
         address: Optional[str] = None,
         chain_id: Optional[int] = None,
     ) -> list[ContractInfo]:
-        """Search the Contract Directory."""
+        """Search the Contract Directory.
+
+        Contracts match if their name contains `name`.  Use `get()` for exact name lookups.
+        """
+
+        candidates: Iterable[ContractInfo]
+        if address is not None:
+            candidates = self._by_address.get(_address_key(address), [])
+        elif chain_id is not None:
+            candidates = self._by_chain.get(chain_id, {}).values()
+        else:
+            candidates = self.entries.values()
 
         result = []
-        for info in self.entries.values():
+        for info in candidates:
             if org is not None:
                 if org != info.org:
                     continue
@@ -224,4 +403,24 @@ class ContractDirectory(ConfigOptions):
         return result
 
 
-contract_directory = ContractDirectory.from_file(TELLIOT_CORE_ROOT / "data/contract_directory.json")
+def load_contract_directory() -> ContractDirectory:
+    """Load the packaged contract directory"""
+    return load_with_snapshot(TELLIOT_CORE_ROOT / "data/contract_directory.json", ContractDirectory.from_file)
+
+
+@functools.lru_cache(maxsize=None)
+def get_contract_directory() -> ContractDirectory:
+    """Packaged contract directory, loaded on first use"""
+    return load_contract_directory()
+
+
+if TYPE_CHECKING:
+    #: Packaged contract directory (see `get_contract_directory`)
+    contract_directory: ContractDirectory
+
+
+def __getattr__(name: str) -> Any:
+    # Load the contract directory when the module attribute is first used
+    if name == "contract_directory":
+        return get_contract_directory()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,183 @@
+"""
+EIP-1559 fee estimation from eth_feeHistory
+
+`FeeHistoryOracle` keeps a rolling window of recent base fees and priority
+fee (reward) percentiles, fetched from the node with `eth_feeHistory`.
+After the first request, only blocks newer than the window are fetched.
+"""
+import logging
+import math
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+from typing import Deque
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+from eth_typing import BlockNumber
+from web3 import Web3
+from web3.types import FeeHistory
+
+from telliot_core.model.endpoints import RPCEndpoint
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BlockFees:
+    """Fee data of a single block"""
+
+    number: int
+    base_fee_per_gas: int
+    gas_used_ratio: float
+
+    #: Priority fees paid at each of the oracle's reward percentiles
+    rewards: List[int]
+
+
+@dataclass
+class FeeEstimate:
+    """Suggested EIP-1559 fees in wei"""
+
+    #: Base fee of the next block
+    base_fee_per_gas: int
+    max_priority_fee_per_gas: int
+    max_fee_per_gas: int
+
+    def write_kwargs(self) -> Dict[str, float]:
+        """Gas arguments for Contract.write (in gwei)"""
+        return {
+            "max_fee_per_gas": float(Web3.from_wei(self.max_fee_per_gas, "gwei")),
+            "max_priority_fee_per_gas": float(Web3.from_wei(self.max_priority_fee_per_gas, "gwei")),
+        }
+
+
+def interpolated_percentile(values: Sequence[float], p: float) -> float:
+    """Linearly interpolated percentile (0-100) of a list of values"""
+    if not values:
+        raise ValueError("percentile of empty sequence")
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * p / 100
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+class FeeHistoryOracle:
+    """EIP-1559 fee oracle for any RPCEndpoint
+
+    Args:
+        node:
+            Endpoint used to fetch fee history
+        block_count:
+            Number of recent blocks kept in the window
+        reward_percentiles:
+            Priority fee percentiles requested from the node for each block
+        base_fee_multiplier:
+            The max fee covers this multiple of the next base fee, so that
+            the transaction stays valid while the base fee rises
+
+    Example:
+        oracle = FeeHistoryOracle(core.endpoint)
+        fees = await oracle.estimate(percentile=50)
+        await tellor360.oracle.write("submitValue", gas_limit=None, **fees.write_kwargs(), ...)
+    """
+
+    def __init__(
+        self,
+        node: RPCEndpoint,
+        block_count: int = 20,
+        reward_percentiles: Sequence[float] = (10, 50, 90),
+        base_fee_multiplier: float = 2.0,
+    ):
+        self.node = node
+        self.block_count = block_count
+        self.reward_percentiles = list(reward_percentiles)
+        self.base_fee_multiplier = base_fee_multiplier
+
+        self._blocks: Deque[BlockFees] = deque(maxlen=block_count)
+        self._next_base_fee: Optional[int] = None
+
+    #: Fee data of the blocks in the window, oldest first
+    blocks = property(lambda self: list(self._blocks))
+
+    #: Number of the newest block in the window, or None if empty
+    newest_block = property(lambda self: self._blocks[-1].number if self._blocks else None)
+
+    async def update(self, newest_block: Optional[int] = None) -> None:
+        """Fetch the fee history of blocks not yet in the window
+
+        Args:
+            newest_block: Latest block number, if known (saves a request)
+        """
+        async_web3 = await self.node.connect_async()
+        if newest_block is None:
+            newest_block = await async_web3.eth.block_number
+
+        if self.newest_block is None:
+            count = self.block_count
+        else:
+            count = min(newest_block - self.newest_block, self.block_count)
+        if count <= 0:
+            return
+
+        history = await async_web3.eth.fee_history(count, BlockNumber(newest_block), self.reward_percentiles)
+        self._add_history(history)
+
+    def _add_history(self, history: FeeHistory) -> None:
+        """Append the blocks of an eth_feeHistory response to the window"""
+        oldest = int(history["oldestBlock"])
+        base_fees = history["baseFeePerGas"]
+        ratios = history["gasUsedRatio"]
+        rewards: Sequence[Sequence[int]] = history.get("reward") or [[0] * len(self.reward_percentiles)] * len(ratios)
+
+        for i, (ratio, reward) in enumerate(zip(ratios, rewards)):
+            number = oldest + i
+            if self.newest_block is not None and number <= self.newest_block:
+                continue
+            self._blocks.append(BlockFees(number, int(base_fees[i]), float(ratio), [int(r) for r in reward]))
+
+        # baseFeePerGas has one extra entry: the base fee of the next block
+        self._next_base_fee = int(base_fees[-1])
+
+    async def handle_new_block(self, block: Any) -> None:
+        """Listener handler for new block headers"""
+        await self.update(newest_block=int(block["number"]))
+
+    async def estimate(self, percentile: float = 50, update: bool = True) -> Optional[FeeEstimate]:
+        """Suggest EIP-1559 fees
+
+        Args:
+            percentile:
+                One of the reward percentiles.  Higher percentiles pay
+                more for faster inclusion.
+            update:
+                Fetch new blocks before estimating
+
+        returns:
+            Suggested fees in wei, or None if no fee history is available
+        """
+        if percentile not in self.reward_percentiles:
+            raise ValueError(f"percentile {percentile} not in reward percentiles {self.reward_percentiles}")
+
+        if update:
+            try:
+                await self.update()
+            except Exception as e:
+                logger.error(f"Error fetching fee history: {e!r}")
+
+        if self._next_base_fee is None:
+            return None
+
+        column = self.reward_percentiles.index(percentile)
+        # Empty blocks report zero rewards, which says nothing about the fee market
+        rewards = [block.rewards[column] for block in self._blocks if block.gas_used_ratio > 0]
+        priority_fee = int(interpolated_percentile(rewards, 50)) if rewards else 0
+
+        return FeeEstimate(
+            base_fee_per_gas=self._next_base_fee,
+            max_priority_fee_per_gas=priority_fee,
+            max_fee_per_gas=int(self._next_base_fee * self.base_fee_multiplier) + priority_fee,
+        )
@@ -1,17 +1,26 @@
+import asyncio
 import json
 import logging
 import math
+import time
 from dataclasses import dataclass
 from json.decoder import JSONDecodeError
+from typing import Any
+from typing import Dict
+from typing import Iterable
 from typing import Literal
 from typing import Optional
+from typing import Tuple
 from typing import Union
 
-import requests
+import aiohttp
 
 logger = logging.getLogger(__name__)
 ethgastypes = Literal["fast", "fastest", "safeLow", "average", "standard"]
 
+#: Seconds to wait for a gas station response
+REQUEST_TIMEOUT = 10.0
+
 
 @dataclass
 class GasStation:
@@ -19,7 +28,58 @@ class GasStation:
     parse_rsp: list[Union[str, int, ethgastypes]]
 
 
-async def fetch_gas_price() -> Optional[int]:
+async def _get_json(url: str, session: Optional[aiohttp.ClientSession] = None) -> Any:
+    """GET a JSON document, using the shared session if one is provided"""
+    timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+    if session is None:
+        async with aiohttp.ClientSession(timeout=timeout) as temp_session:
+            return await _get_json(url, temp_session)
+
+    async with session.get(url, timeout=timeout) as rsp:
+        return json.loads(await rsp.read())
+
+
+class GasStationCache:
+    """TTL cache of gas station responses
+
+    Concurrent requests for the same API share one upstream request,
+    and responses are reused for `ttl` seconds.
+    """
+
+    def __init__(self, ttl: float = 10.0):
+        self.ttl = ttl
+        self._responses: Dict[str, Tuple[float, Any]] = {}
+        self._in_flight: Dict[str, "asyncio.Future[Any]"] = {}
+
+    async def get(self, url: str, session: Optional[aiohttp.ClientSession] = None) -> Any:
+        """Fetch a gas station response, or reuse a recent one"""
+        cached = self._responses.get(url)
+        if cached is not None and time.monotonic() - cached[0] < self.ttl:
+            return cached[1]
+
+        future = self._in_flight.get(url)
+        if future is None:
+            future = asyncio.ensure_future(_get_json(url, session))
+            self._in_flight[url] = future
+            try:
+                response = await asyncio.shield(future)
+                self._responses[url] = (time.monotonic(), response)
+                return response
+            finally:
+                del self._in_flight[url]
+
+        return await asyncio.shield(future)
+
+    def clear(self) -> None:
+        """Drop all cached responses"""
+        self._responses.clear()
+
+
+#: Gas station responses shared by all callers
+gas_station_cache = GasStationCache()
+
+
+async def fetch_gas_price(session: Optional[aiohttp.ClientSession] = None) -> Optional[int]:
     """Estimate current ETH gas price
 
     Current implementation fetches from ethgasstation
@@ -27,25 +87,28 @@ async def fetch_gas_price() -> Optional[int]:
     Returns:
         eth gas price in gwei
     """
-    return await ethgasstation("fast")
+    return await ethgasstation("fast", session=session)
 
 
-async def ethgasstation(style: ethgastypes = "fast", retries: int = 2) -> Optional[int]:
+async def ethgasstation(
+    style: ethgastypes = "fast",
+    retries: int = 2,
+    session: Optional[aiohttp.ClientSession] = None,
+) -> Optional[int]:
     """Fetch gas price from ethgasstation in gwei"""
     for _ in range(retries):
         try:
-            rsp = requests.get("https://ethgasstation.info/json/ethgasAPI.json")
-            prices = json.loads(rsp.content)
+            prices = await gas_station_cache.get(ETH_GAS_PRICE_API, session)
             gas_price = int(prices[style])
             return int(gas_price / 10)  # json output is gwei*10
         except JSONDecodeError:
             logger.error("Error decoding JSON from ethgasstation API")
             continue
-        except requests.exceptions.SSLError:
+        except aiohttp.ClientSSLError:
             logger.error("SSLError -- Unable to fetch gas price")
             return None
         except Exception as e:
-            logger.error(f"Error fetching gas price: {e}")
+            logger.error(f"Error fetching gas price: {e!r}")
     return None
 
 
@@ -72,26 +135,29 @@ gas_station = {
 
 
 async def legacy_gas_station(
-    chain_id: int, speed_parse_lis: Optional[list[Union[str, int, ethgastypes]]] = None, retries: int = 2
+    chain_id: int,
+    speed_parse_lis: Optional[list[Union[str, int, ethgastypes]]] = None,
+    retries: int = 2,
+    session: Optional[aiohttp.ClientSession] = None,
 ) -> Optional[int]:
     """Fetch gas price from gas station Api in gwei"""
-    prices = {}
+    prices: Any = {}
     if chain_id not in gas_station:
         logger.error(f"Please add gas station API for chain id: {chain_id}")
         return None
 
     for _ in range(retries):
         try:
-            rsp = requests.get(gas_station[chain_id].api)
-            prices = json.loads(rsp.content)
+            prices = await gas_station_cache.get(gas_station[chain_id].api, session)
+            break
         except JSONDecodeError:
             logger.error("Error decoding JSON from gasstation API")
             continue
-        except requests.exceptions.SSLError:
+        except aiohttp.ClientSSLError:
             logger.error("SSLError: Unable to fetch gas price")
             return None
         except Exception as e:
-            logger.error(f"Error fetching gas price: {e}")
+            logger.error(f"Error fetching gas price: {e!r}")
             return None
 
     if speed_parse_lis is None:
@@ -115,12 +181,23 @@ async def legacy_gas_station(
     return gas_price if chain_id not in (1, 5) else int(gas_price / 10)  # json output is gwei*10 for eth
 
 
+async def legacy_gas_stations(
+    chain_ids: Iterable[int],
+    session: Optional[aiohttp.ClientSession] = None,
+) -> Dict[int, Optional[int]]:
+    """Fetch gas prices for several chains concurrently, in gwei"""
+    chain_ids = list(chain_ids)
+    prices = await asyncio.gather(*[legacy_gas_station(chain_id, session=session) for chain_id in chain_ids])
+    return dict(zip(chain_ids, prices))
+
+
 if __name__ == "__main__":
-    import asyncio
-
-    loop = asyncio.get_event_loop()
-    for chain_id in gas_station:
-        price = loop.run_until_complete(legacy_gas_station(chain_id))
-        assert isinstance(price, int)
-        assert price > 0
-        print(chain_id, price)
+
+    async def main() -> None:
+        prices = await legacy_gas_stations(gas_station)
+        for chain_id, price in prices.items():
+            assert isinstance(price, int)
+            assert price > 0
+            print(chain_id, price)
+
+    asyncio.run(main())
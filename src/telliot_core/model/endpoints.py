@@ -4,15 +4,20 @@ Utils for creating a JSON RPC connection to an EVM blockchain
 import logging
 from dataclasses import dataclass
 from dataclasses import field
+from typing import Any
 from typing import List
 from typing import Optional
 
+import aiohttp
 from requests.exceptions import ConnectionError
 from requests.exceptions import HTTPError
+from web3 import AsyncHTTPProvider
+from web3 import AsyncWeb3
 from web3 import Web3
 
 from telliot_core.apps.config import ConfigFile
 from telliot_core.apps.config import ConfigOptions
+from telliot_core.contract.batch_provider import BatchingHTTPProvider
 from telliot_core.model.base import Base
 
 logger = logging.getLogger(__name__)
@@ -37,10 +42,60 @@ class RPCEndpoint(Base):
     #: Explorer URL ')
     explorer: Optional[str] = None
 
+    #: Seconds to wait while coalescing async requests into a JSON-RPC batch
+    #: (None disables batching, 0 batches requests issued in the same event loop iteration)
+    batch_window: Optional[float] = None
+
     #: Read-only Web3 Connection with private storage
     web3 = property(lambda self: self._web3)
     _web3: Optional[Web3] = field(default=None, init=False, repr=False)
 
+    #: Async Web3 Connection, created by connect_async()
+    async_web3 = property(lambda self: self._async_web3)
+    _async_web3: Optional["AsyncWeb3[Any]"] = field(default=None, init=False, repr=False)
+
+    #: Shared aiohttp session used by the async connection
+    _session: Optional[aiohttp.ClientSession] = field(default=None, init=False, repr=False)
+
+    def use_session(self, session: Optional[aiohttp.ClientSession]) -> None:
+        """Share an aiohttp session with the async connection
+
+        If the session changes, the async connection is re-created
+        the next time connect_async() is called.
+        """
+        if session is not self._session:
+            self._session = session
+            self._async_web3 = None
+
+    async def connect_async(self) -> "AsyncWeb3[Any]":
+        """Get or create the async Web3 connection
+
+        Requests are sent with the shared session (see use_session()), if any,
+        and coalesced into JSON-RPC batches if `batch_window` is set.
+        Unlike connect(), the connection is not verified with a request.
+
+        returns:
+            AsyncWeb3 connection
+        """
+
+        if self._async_web3:
+            return self._async_web3
+
+        if not self.url.startswith("http"):
+            raise ValueError(f"Invalid endpoint url: {self.url}")
+
+        if self.batch_window is None:
+            provider = AsyncHTTPProvider(self.url)
+        else:
+            provider = BatchingHTTPProvider(self.url, batch_window=self.batch_window)
+        if self._session:
+            await provider.cache_async_session(self._session)
+
+        self._async_web3 = AsyncWeb3(provider)
+        logger.debug("Connected async to {}".format(self))
+
+        return self._async_web3
+
     def connect(self) -> bool:
         """Connect to EVM blockchain
 
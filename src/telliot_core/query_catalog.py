@@ -0,0 +1,202 @@
+"""
+Indexed query catalog
+
+`QueryCatalog` loads the query catalog (`data/query_catalog.yaml`) once,
+checks all query IDs against their descriptors, and indexes the entries by
+tag, query ID and query type, so that e.g. the query IDs of oracle or
+autopay events are mapped back to catalog entries with a dict lookup.
+Pickled catalogs only store the entry fields; the indexes are rebuilt on
+load (see `load_with_snapshot`).
+"""
+import functools
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import TYPE_CHECKING
+from typing import Union
+
+import yaml
+from eth_abi import encode
+from eth_abi.exceptions import EncodingError
+from eth_abi.exceptions import ParseError
+from hexbytes import HexBytes
+from web3 import Web3
+
+from telliot_core.utils.home import TELLIOT_CORE_ROOT
+from telliot_core.utils.lazy import load_with_snapshot
+
+#: Query catalog packaged with telliot-core
+QUERY_CATALOG_FILE = TELLIOT_CORE_ROOT / "data" / "query_catalog.yaml"
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    """Query catalog entry"""
+
+    tag: str
+    title: str
+    query_type: str
+
+    #: JSON query descriptor
+    descriptor: str
+
+    query_id: bytes
+    active: bool
+
+    #: JSON encoding ABI of the query parameters
+    abi: str
+
+    @property
+    def parameters(self) -> Dict[str, Any]:
+        """Query parameters from the descriptor"""
+        params: Dict[str, Any] = json.loads(self.descriptor)
+        del params["type"]
+        return params
+
+    def query_data(self) -> bytes:
+        """ABI encoded query type and parameters"""
+        abi = json.loads(self.abi)
+        params = self.parameters
+        encoded_params = encode([p["type"] for p in abi], [params[p["name"]] for p in abi])
+        return encode(["string", "bytes"], [self.query_type, encoded_params])
+
+    def compute_query_id(self) -> bytes:
+        """Query ID from the descriptor
+
+        The query ID of a legacy request is its legacy ID.
+        """
+        if self.query_type == "LegacyRequest":
+            return int(self.parameters["legacy_id"]).to_bytes(32, "big")
+        return bytes(Web3.keccak(self.query_data()))
+
+
+_Row = Tuple[str, str, str, str, bytes, bool, str]
+
+
+class QueryCatalog:
+    """Catalog entries indexed by tag, query ID and query type"""
+
+    def __init__(self, entries: List[CatalogEntry]):
+        self._entries = entries
+        self._by_tag: Dict[str, CatalogEntry] = {}
+        self._by_query_id: Dict[bytes, CatalogEntry] = {}
+        self._by_type: Dict[str, List[CatalogEntry]] = {}
+
+        for entry in entries:
+            if entry.tag in self._by_tag:
+                raise ValueError(f"Duplicate catalog tag: {entry.tag}")
+            self._by_tag[entry.tag] = entry
+            if entry.query_id in self._by_query_id:
+                other = self._by_query_id[entry.query_id]
+                raise ValueError(f"Duplicate catalog query ID: {entry.tag} and {other.tag}")
+            self._by_query_id[entry.query_id] = entry
+            self._by_type.setdefault(entry.query_type, []).append(entry)
+
+    @classmethod
+    def from_file(cls, filepath: Path, validate: bool = True) -> "QueryCatalog":
+        """Load a YAML query catalog
+
+        Args:
+            filepath: Catalog file
+            validate: Check that all query IDs match their descriptors
+        """
+        with open(filepath) as f:
+            state = yaml.safe_load(f)
+
+        entries = [
+            CatalogEntry(
+                tag=item["tag"],
+                title=item["title"],
+                query_type=item["query_type"],
+                descriptor=item["descriptor"],
+                query_id=bytes(HexBytes(item["query_id"])),
+                active=bool(item.get("active", True)),
+                abi=item["abi"],
+            )
+            for item in state
+        ]
+        catalog = cls(entries)
+
+        if validate:
+            errors = catalog.validation_errors()
+            if errors:
+                reasons = ", ".join(f"{tag} ({reason})" for tag, reason in errors.items())
+                raise ValueError(f"Invalid query catalog entries: {reasons}")
+
+        return catalog
+
+    def validation_errors(self) -> Dict[str, str]:
+        """Reasons why query IDs do not match their descriptors, by tag"""
+        errors = {}
+        for entry in self._entries:
+            try:
+                if entry.compute_query_id() != entry.query_id:
+                    errors[entry.tag] = "query ID does not match descriptor"
+            except (ValueError, KeyError, TypeError, EncodingError, ParseError) as e:
+                errors[entry.tag] = f"invalid descriptor: {e!r}"
+        return errors
+
+    def invalid_entries(self) -> List[CatalogEntry]:
+        """Entries whose query ID does not match their descriptor"""
+        errors = self.validation_errors()
+        return [entry for entry in self._entries if entry.tag in errors]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[CatalogEntry]:
+        return iter(self._entries)
+
+    def __contains__(self, tag: object) -> bool:
+        return tag in self._by_tag
+
+    def get(self, tag: str) -> Optional[CatalogEntry]:
+        return self._by_tag.get(tag)
+
+    def by_query_id(self, query_id: Union[bytes, str]) -> Optional[CatalogEntry]:
+        """Entry of a query ID (bytes32 or hex string)"""
+        if not isinstance(query_id, bytes):
+            query_id = bytes(HexBytes(query_id))
+        return self._by_query_id.get(query_id)
+
+    def by_query_type(self, query_type: str) -> List[CatalogEntry]:
+        return list(self._by_type.get(query_type, []))
+
+    @property
+    def query_types(self) -> List[str]:
+        return list(self._by_type)
+
+    def __getstate__(self) -> List[_Row]:
+        return [(e.tag, e.title, e.query_type, e.descriptor, e.query_id, e.active, e.abi) for e in self._entries]
+
+    def __setstate__(self, rows: List[_Row]) -> None:
+        self.__init__([CatalogEntry(*row) for row in rows])
+
+
+def load_query_catalog(filepath: Path = QUERY_CATALOG_FILE) -> QueryCatalog:
+    """Load and validate the query catalog, reusing a snapshot if the file is unchanged"""
+    return load_with_snapshot(filepath, QueryCatalog.from_file)
+
+
+@functools.lru_cache(maxsize=None)
+def get_query_catalog() -> QueryCatalog:
+    """Query catalog, loaded on first use"""
+    return load_query_catalog()
+
+
+if TYPE_CHECKING:
+    #: Query catalog (see `get_query_catalog`)
+    query_catalog: QueryCatalog
+
+
+def __getattr__(name: str) -> Any:
+    # Load the query catalog when the module attribute is first used
+    if name == "query_catalog":
+        return get_query_catalog()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
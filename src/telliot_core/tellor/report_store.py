@@ -0,0 +1,205 @@
+"""
+Local store of Tellor oracle reports
+
+`ReportStore` keeps an append-only SQLite table of the reports submitted
+to an oracle contract: query ID, timestamp, value, reporter and block.
+It is filled from `NewReport` events, either by incremental `sync()` with a
+`LogBackfill` or live from a listener subscription (see `attach()`), so
+history queries are answered from local disk instead of the chain.
+"""
+import logging
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import TYPE_CHECKING
+from typing import Union
+
+from hexbytes import HexBytes
+
+from telliot_core.contract.events import ContractEvent
+from telliot_core.utils.home import telliot_homedir
+
+if TYPE_CHECKING:
+    from telliot_core.contract.listener import Listener
+    from telliot_core.contract.log_backfill import LogBackfill
+
+logger = logging.getLogger(__name__)
+
+QueryId = Union[bytes, str]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS reports (
+    oracle TEXT NOT NULL,
+    query_id BLOB NOT NULL,
+    timestamp INTEGER NOT NULL,
+    value BLOB NOT NULL,
+    reporter TEXT NOT NULL,
+    block INTEGER NOT NULL,
+    PRIMARY KEY (oracle, query_id, timestamp)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS sync (
+    oracle TEXT PRIMARY KEY,
+    last_block INTEGER NOT NULL
+);
+"""
+
+
+def _query_id(query_id: QueryId) -> bytes:
+    return bytes(HexBytes(query_id))
+
+
+@dataclass(frozen=True)
+class Report:
+    """An oracle report"""
+
+    query_id: bytes
+    timestamp: int
+    value: bytes
+    reporter: str
+    block: int
+
+    @classmethod
+    def from_event(cls, event: ContractEvent) -> "Report":
+        """Report from a decoded NewReport event (any oracle version)"""
+        return cls(
+            query_id=bytes(event.args["_queryId"]),
+            timestamp=int(event.args["_time"]),
+            value=bytes(event.args["_value"]),
+            reporter=str(event.args["_reporter"]),
+            block=event.blockNumber,
+        )
+
+
+class ReportStore:
+    """Append-only store of the reports of one oracle contract
+
+    Args:
+        chain_id: Chain ID of the oracle
+        oracle: Oracle contract address
+        path: SQLite database file (default: `reports.sqlite` in the telliot
+            home directory), or ":memory:"
+    """
+
+    def __init__(self, chain_id: int, oracle: str, path: Union[Path, str, None] = None):
+        self.chain_id = chain_id
+        self.oracle = oracle
+        self._key = f"{chain_id}:{oracle.strip().lower()}"
+
+        if path is None:
+            path = telliot_homedir() / "reports.sqlite"
+        self._db = sqlite3.connect(str(path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._db:
+            if str(path) != ":memory:":
+                self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._db.close()
+
+    def add(self, reports: Iterable[Report]) -> int:
+        """Store reports, ignoring reports already stored
+
+        Returns:
+            Number of new reports
+        """
+        rows = [(self._key, r.query_id, r.timestamp, r.value, r.reporter, r.block) for r in reports]
+        with self._lock, self._db:
+            before = self._db.total_changes
+            self._db.executemany("INSERT OR IGNORE INTO reports VALUES (?, ?, ?, ?, ?, ?)", rows)
+            return self._db.total_changes - before
+
+    def add_events(self, events: Iterable[ContractEvent]) -> int:
+        """Store the reports of NewReport events (other events are ignored)"""
+        return self.add(Report.from_event(e) for e in events if e.event == "NewReport" and not e.removed)
+
+    @property
+    def last_block(self) -> Optional[int]:
+        """Last block synced with sync()"""
+        with self._lock:
+            row = self._db.execute("SELECT last_block FROM sync WHERE oracle = ?", (self._key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_last_block(self, block: int) -> None:
+        with self._lock, self._db:
+            self._db.execute("INSERT OR REPLACE INTO sync VALUES (?, ?)", (self._key, block))
+
+    def _select(self, where: str, params: Iterable[Any], suffix: str = "") -> List[Report]:
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT query_id, timestamp, value, reporter, block FROM reports "
+                f"WHERE oracle = ? AND {where} {suffix}",
+                (self._key, *params),
+            ).fetchall()
+        return [Report(*row) for row in rows]
+
+    def latest(self, query_id: QueryId) -> Optional[Report]:
+        """Most recent report of a query"""
+        reports = self._select("query_id = ?", (_query_id(query_id),), "ORDER BY timestamp DESC LIMIT 1")
+        return reports[0] if reports else None
+
+    def reports(self, query_id: QueryId, start: int = 0, end: Optional[int] = None) -> List[Report]:
+        """Reports of a query with start <= timestamp <= end, oldest first"""
+        end = end if end is not None else 2**63 - 1
+        return self._select(
+            "query_id = ? AND timestamp BETWEEN ? AND ?", (_query_id(query_id), start, end), "ORDER BY timestamp"
+        )
+
+    def count(self, query_id: QueryId) -> int:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT COUNT(*) FROM reports WHERE oracle = ? AND query_id = ?", (self._key, _query_id(query_id))
+            ).fetchone()
+        return int(row[0])
+
+    def query_ids(self) -> List[bytes]:
+        """Query IDs with stored reports"""
+        with self._lock:
+            rows = self._db.execute("SELECT DISTINCT query_id FROM reports WHERE oracle = ?", (self._key,)).fetchall()
+        return [row[0] for row in rows]
+
+    async def sync(self, backfill: "LogBackfill", to_block: int, from_block: int = 0, batch: int = 100_000) -> int:
+        """Store the reports from the last synced block up to a block
+
+        Progress is saved after each batch of blocks, so an interrupted sync resumes
+        where it stopped.
+
+        Args:
+            backfill: Log reader
+            to_block: Last block to sync (inclusive)
+            from_block: First block if never synced (e.g. the oracle deployment block)
+            batch: Blocks per saved step
+
+        Returns:
+            Number of new reports
+        """
+        last_block = self.last_block
+        start = last_block + 1 if last_block is not None else from_block
+
+        added = 0
+        for batch_start in range(start, to_block + 1, batch):
+            batch_end = min(to_block, batch_start + batch - 1)
+            events = await backfill.get_events(batch_start, batch_end, address=self.oracle, events=["NewReport"])
+            added += self.add_events(events)
+            self._set_last_block(batch_end)
+            logger.debug(f"Synced reports of {self._key} up to block {batch_end}")
+
+        return added
+
+    async def handle_event(self, event: Any) -> None:
+        """Listener handler storing live NewReport events
+
+        Live events do not advance the synced block, so a later sync() reads
+        any blocks missed before the subscription started.
+        """
+        if isinstance(event, ContractEvent):
+            self.add_events([event])
+
+    async def attach(self, listener: "Listener") -> None:
+        """Store new reports seen by the listener"""
+        await listener.subscribe_events(handler=self.handle_event, address=self.oracle, events=["NewReport"])
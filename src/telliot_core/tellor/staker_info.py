@@ -0,0 +1,116 @@
+"""
+Bulk staker status
+
+`get_staker_infos` reads `getStakerInfo` for many addresses with batched
+(Multicall3) reads and decodes the results of the TellorX master,
+TellorFlex oracle and Tellor360 oracle contracts into `StakerInfo` records.
+"""
+from dataclasses import dataclass
+from typing import Any
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import TYPE_CHECKING
+
+from eth_utils import to_checksum_address
+
+from telliot_core.utils.response import ResponseStatus
+from telliot_core.utils.timestamp import TimeStamp
+
+if TYPE_CHECKING:
+    from telliot_core.contract.contract import Contract
+
+#: TellorX staker status codes
+account_status_map = {
+    0: "NotStaked",
+    1: "Staked",
+    2: "LockedForWithdraw",
+    3: "InDispute",
+    4: "disbursed",
+    5: "slashed",
+}
+
+
+def account_status(code: int) -> str:
+    """Name of a TellorX staker status code"""
+    return account_status_map.get(code, f"Unknown({code})")
+
+
+@dataclass(frozen=True)
+class StakerInfo:
+    """Staker status of an address"""
+
+    address: str
+
+    #: Staker status (see `account_status`)
+    status: str
+
+    #: Time of staking
+    start_date: int
+
+    #: Staked and locked (withdrawing) amounts, zero on TellorX
+    staked_balance: int = 0
+    locked_balance: int = 0
+
+    #: Time of the last report and number of reports, zero on TellorX
+    reporter_last_timestamp: int = 0
+    reports_submitted: int = 0
+
+    @property
+    def date_staked(self) -> TimeStamp:
+        return TimeStamp(self.start_date)
+
+    @classmethod
+    def from_result(cls, address: str, result: Sequence[Any]) -> "StakerInfo":
+        """Decode the output of `getStakerInfo` of any oracle version"""
+        if len(result) == 2:
+            # TellorX master: status, start date
+            return cls(address=address, status=account_status(result[0]), start_date=int(result[1]))
+
+        if len(result) == 5:
+            # TellorFlex: start date, staked, locked, last report, reports
+            start_date, staked, locked, last_report, reports = result
+        else:
+            # Tellor360: start date, staked, locked, reward debt, last report, reports,
+            # start vote count, start vote tally, staked
+            start_date, staked, locked, _, last_report, reports = result[:6]
+
+        if staked:
+            status = "Staked"
+        elif locked:
+            status = "LockedForWithdraw"
+        else:
+            status = "NotStaked"
+
+        return cls(
+            address=address,
+            status=status,
+            start_date=int(start_date),
+            staked_balance=int(staked),
+            locked_balance=int(locked),
+            reporter_last_timestamp=int(last_report),
+            reports_submitted=int(reports),
+        )
+
+
+async def get_staker_infos(
+    contract: "Contract", addresses: Iterable[str]
+) -> List[Tuple[Optional[StakerInfo], ResponseStatus]]:
+    """Read the staker status of many addresses with batched reads
+
+    Args:
+        contract: TellorX master, TellorFlex oracle or Tellor360 oracle contract
+        addresses: Staker addresses
+
+    Returns:
+        (StakerInfo, ResponseStatus) pairs, in the order of the addresses
+    """
+    stakers = [to_checksum_address(address) for address in addresses]
+    results = await contract.read_many([("getStakerInfo", {"_staker": staker}) for staker in stakers])
+
+    infos: List[Tuple[Optional[StakerInfo], ResponseStatus]] = []
+    for staker, (result, status) in zip(stakers, results):
+        infos.append((StakerInfo.from_result(staker, result) if status.ok else None, status))
+    return infos
@@ -1,13 +1,17 @@
 import logging
 from typing import Any
+from typing import Iterable
+from typing import List
 from typing import Optional
 from typing import Tuple
 
 from chained_accounts import ChainedAccount
 
 from telliot_core.contract.contract import Contract
-from telliot_core.directory import contract_directory
+from telliot_core.directory import get_contract_directory
 from telliot_core.model.endpoints import RPCEndpoint
+from telliot_core.tellor.staker_info import get_staker_infos
+from telliot_core.tellor.staker_info import StakerInfo
 from telliot_core.utils.response import ResponseStatus
 from telliot_core.utils.timestamp import TimeStamp
 
@@ -20,14 +24,14 @@ class Tellor360OracleContract(Contract):
         chain_id = node.chain_id
         assert chain_id is not None
 
-        contract_info = contract_directory.find(chain_id=chain_id, name="tellor360-oracle")
+        contract_info = get_contract_directory().get("tellor360-oracle", chain_id=chain_id)
         if not contract_info:
             raise Exception(f"Tellor360 oracle contract not found on chain_id {chain_id}")
 
-        contract_abi = contract_info[0].get_abi(chain_id=chain_id)
+        contract_abi = contract_info.get_abi(chain_id=chain_id)
 
         super().__init__(
-            address=contract_info[0].address[chain_id],
+            address=contract_info.address[chain_id],
             abi=contract_abi,
             node=node,
             account=account,
@@ -105,6 +109,10 @@ class Tellor360OracleContract(Contract):
 
         return staker_info, status
 
+    async def get_staker_infos(self, addresses: Iterable[str]) -> List[Tuple[Optional[StakerInfo], ResponseStatus]]:
+        """Get the staker info of many addresses with batched reads"""
+        return await get_staker_infos(self, addresses)
+
     async def get_new_value_count_by_qeury_id(self, query_id: bytes) -> Tuple[int, ResponseStatus]:
         count, status = await self.read(func_name="getNewValueCountbyQueryId", _queryId=query_id)
         return count, status
@@ -1,15 +1,22 @@
 import logging
+from typing import Any
+from typing import Iterable
+from typing import List
 from typing import Optional
 from typing import Tuple
+from typing import TYPE_CHECKING
 
 from chained_accounts import ChainedAccount
 from web3.exceptions import ContractLogicError
 
 from telliot_core.contract.contract import Contract
-from telliot_core.directory import contract_directory
+from telliot_core.directory import get_contract_directory
 from telliot_core.model.endpoints import RPCEndpoint
 from telliot_core.utils.response import ResponseStatus
 
+if TYPE_CHECKING:
+    from telliot_core.tellor.tip_scanner import QueryTips
+
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +32,7 @@ class TellorFlexAutopayContract(Contract):
         chain_id = node.chain_id
         assert chain_id is not None
 
-        contract_info = contract_directory.find(chain_id=chain_id, name="tellorflex-autopay")[0]
+        contract_info = get_contract_directory().get("tellorflex-autopay", chain_id=chain_id)
         if not contract_info:
             raise Exception(f"Tellorflex autopay contract not found on chain_id {chain_id}")
         contract_abi = contract_info.get_abi(chain_id=chain_id)
@@ -50,6 +57,15 @@ class TellorFlexAutopayContract(Contract):
         else:
             return None, status
 
+    async def scan_tips(self, query_ids: Iterable[Any], **kwargs: Any) -> List["QueryTips"]:
+        """Current tips of many query IDs with batched reads, highest reward first
+
+        See `TipScanner` for options and for keeping the tips up to date.
+        """
+        from telliot_core.tellor.tip_scanner import TipScanner
+
+        return await TipScanner(self, **kwargs).scan_tips(query_ids)
+
 
 if __name__ == "__main__":
     import asyncio
@@ -4,7 +4,7 @@ from typing import Optional
 from chained_accounts import ChainedAccount
 
 from telliot_core.contract.contract import Contract
-from telliot_core.directory import contract_directory
+from telliot_core.directory import get_contract_directory
 from telliot_core.model.endpoints import RPCEndpoint
 
 logger = logging.getLogger(__name__)
@@ -22,9 +22,9 @@ class TokenContract(Contract):
         assert chain_id is not None
 
         if chain_id == 122:
-            contract_info = contract_directory.find(chain_id=chain_id, name="wrapped-fuse-token")[0]
+            contract_info = get_contract_directory().get("wrapped-fuse-token", chain_id=chain_id)
         else:
-            contract_info = contract_directory.find(chain_id=chain_id, name="trb-token")[0]
+            contract_info = get_contract_directory().get("trb-token", chain_id=chain_id)
 
         if not contract_info:
             raise Exception(f"Tellorflex token contract not found on chain_id {chain_id}")
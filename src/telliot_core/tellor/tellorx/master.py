@@ -1,24 +1,23 @@
 from dataclasses import dataclass
+from typing import Iterable
+from typing import List
 from typing import Optional
+from typing import Tuple
 
 from chained_accounts import ChainedAccount
 from eth_utils import to_checksum_address
 
 from telliot_core.contract.contract import Contract
-from telliot_core.directory import contract_directory as directory
+from telliot_core.directory import get_contract_directory
 from telliot_core.model.endpoints import RPCEndpoint
+from telliot_core.tellor.staker_info import account_status
+from telliot_core.tellor.staker_info import account_status_map  # noqa: F401
+from telliot_core.tellor.staker_info import get_staker_infos
+from telliot_core.tellor.staker_info import StakerInfo
 from telliot_core.tellor.tellorx.oracle import ReadRespType
+from telliot_core.utils.response import ResponseStatus
 from telliot_core.utils.timestamp import TimeStamp
 
-account_status_map = {
-    0: "NotStaked",
-    1: "Staked",
-    2: "LockedForWithdraw",
-    3: "InDispute",
-    4: "disbursed",
-    5: "slashed",
-}
-
 
 @dataclass
 class DisputeReport:
@@ -38,10 +37,9 @@ class TellorxMasterContract(Contract):
         chain_id = node.chain_id
         assert chain_id is not None
 
-        entries = directory.find(name="tellorx-master", chain_id=chain_id)
-        if not entries:
+        contract_info = get_contract_directory().get("tellorx-master", chain_id=chain_id)
+        if not contract_info:
             raise Exception(f"TellorX master contract not found on chain_id {chain_id}")
-        contract_info = entries[0]
         contract_abi = contract_info.get_abi(chain_id=chain_id)
 
         super().__init__(
@@ -60,12 +58,16 @@ class TellorxMasterContract(Contract):
 
         if status.ok:
             current_status, ts_staked = result
-            staker_status = account_status_map[current_status]
+            staker_status = account_status(current_status)
             date_staked = TimeStamp(ts_staked)
             return (staker_status, date_staked), status
         else:
             return (None, None), status
 
+    async def get_staker_infos(self, addresses: Iterable[str]) -> List[Tuple[Optional[StakerInfo], ResponseStatus]]:
+        """Get the staker info of many addresses with batched reads"""
+        return await get_staker_infos(self, addresses)
+
     async def disputesById(self, dispute_id: int) -> ReadRespType:
 
         response, status = await self.read("disputesById", dispute_id)
@@ -5,7 +5,7 @@ from typing import Tuple
 from chained_accounts import ChainedAccount
 
 from telliot_core.contract.contract import Contract
-from telliot_core.directory import contract_directory
+from telliot_core.directory import get_contract_directory
 from telliot_core.model.endpoints import RPCEndpoint
 from telliot_core.utils.response import ResponseStatus
 from telliot_core.utils.timestamp import TimeStamp
@@ -19,7 +19,7 @@ class TellorxOracleContract(Contract):
         chain_id = node.chain_id
         assert chain_id is not None
 
-        contract_info = contract_directory.find(chain_id=chain_id, name="tellorx-oracle")[0]
+        contract_info = get_contract_directory().get("tellorx-oracle", chain_id=chain_id)
         if not contract_info:
             raise Exception(f"TellorX oracle contract not found on chain_id {chain_id}")
 
@@ -0,0 +1,176 @@
+"""
+Client-side index of oracle report timestamps
+
+Looking up the report at or before a time with the oracle contract takes
+one RPC per call (`getTimestampIndexByTimestamp`), or one per step when
+walking `getReportTimestampByIndex`.  `ReportTimestampIndex` instead keeps
+the report timestamps of a query ID in a compact `array("Q")`, loaded
+lazily in pages of batched (Multicall3) reads.  Lookups are binary
+searches that load only the pages they probe, and are answered locally
+once those pages are cached.
+"""
+import logging
+from array import array
+from bisect import bisect_left
+from bisect import bisect_right
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from telliot_core.contract.contract import Contract
+
+logger = logging.getLogger(__name__)
+
+#: Oracle function names: (timestamp count, timestamp by index, value by timestamp)
+_TELLORX_FUNCTIONS = ("getTimestampCountById", "getReportTimestampByIndex", "getValueByTimestamp")
+_TELLOR360_FUNCTIONS = ("getNewValueCountbyQueryId", "getTimestampbyQueryIdandIndex", "retrieveData")
+
+
+class ReportTimestampIndex:
+    """Report timestamps of one query ID
+
+    Works with the TellorX, TellorFlex and Tellor360 oracle contracts.
+
+    Args:
+        oracle: Oracle contract
+        query_id: Query ID
+        page_size: Number of timestamps loaded per batched read
+    """
+
+    def __init__(self, oracle: "Contract", query_id: bytes, page_size: int = 200):
+        self.oracle = oracle
+        self.query_id = query_id
+        self.page_size = max(1, page_size)
+
+        if "getTimestampCountById" in oracle.compiled_abi.functions:
+            self._count_fn, self._timestamp_fn, self._value_fn = _TELLORX_FUNCTIONS
+        else:
+            self._count_fn, self._timestamp_fn, self._value_fn = _TELLOR360_FUNCTIONS
+
+        #: Report timestamps by index (0 where not loaded yet)
+        self.timestamps = array("Q")
+
+        self._loaded: Set[int] = set()
+        self._values: Dict[int, bytes] = {}
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    async def refresh(self) -> int:
+        """Read the number of reports, extending the index with any new reports
+
+        Returns:
+            Number of reports
+        """
+        count, status = await self.oracle.read(self._count_fn, _queryId=self.query_id)
+        if not status.ok:
+            raise ValueError(f"Unable to read report count: {status.error}")
+
+        count = int(count)
+        old_count = len(self.timestamps)
+        if count > old_count:
+            self.timestamps.frombytes(bytes(self.timestamps.itemsize * (count - old_count)))
+            # The last page may have been partial
+            self._loaded.discard(old_count // self.page_size)
+        return count
+
+    async def _ensure_count(self) -> int:
+        if not self.timestamps:
+            await self.refresh()
+        return len(self.timestamps)
+
+    async def load_pages(self, pages: Iterable[int]) -> None:
+        """Load pages of timestamps with one batched read"""
+        missing = sorted(set(pages) - self._loaded)
+        indices = [
+            i
+            for page in missing
+            for i in range(page * self.page_size, min(len(self.timestamps), (page + 1) * self.page_size))
+        ]
+        if not indices:
+            return
+
+        results = await self.oracle.read_many(
+            [(self._timestamp_fn, {"_queryId": self.query_id, "_index": i}) for i in indices]
+        )
+        for i, (timestamp, status) in zip(indices, results):
+            if not status.ok:
+                raise ValueError(f"Unable to read report timestamp {i}: {status.error}")
+            self.timestamps[i] = int(timestamp)
+        self._loaded.update(missing)
+
+    async def load_all(self) -> None:
+        """Load all timestamps (lookups are then answered without any reads)"""
+        count = await self._ensure_count()
+        await self.load_pages(range((count + self.page_size - 1) // self.page_size))
+
+    def _page_bounds(self, page: int) -> Tuple[int, int]:
+        return page * self.page_size, min(len(self.timestamps), (page + 1) * self.page_size)
+
+    async def _bisect(self, timestamp: int, right: bool) -> int:
+        """bisect_right (or bisect_left) of a timestamp, loading only the pages probed"""
+        lo, hi = 0, await self._ensure_count()
+        find = bisect_right if right else bisect_left
+        while lo < hi:
+            page = ((lo + hi) // 2) // self.page_size
+            await self.load_pages([page])
+            start, end = self._page_bounds(page)
+            first, last = self.timestamps[start], self.timestamps[end - 1]
+            if timestamp < first or (not right and timestamp == first):
+                hi = start
+            elif timestamp > last or (right and timestamp == last):
+                lo = end
+            else:
+                return find(self.timestamps, timestamp, start, end)
+        return lo
+
+    async def index_before(self, timestamp: int) -> Optional[int]:
+        """Index of the last report at or before a timestamp"""
+        index = await self._bisect(timestamp, right=True) - 1
+        return index if index >= 0 else None
+
+    async def timestamp_before(self, timestamp: int) -> Optional[int]:
+        """Time of the last report at or before a timestamp"""
+        index = await self.index_before(timestamp)
+        return self.timestamps[index] if index is not None else None
+
+    async def timestamps_between(self, start: int, end: int) -> List[int]:
+        """Times of the reports with start <= timestamp <= end"""
+        lo = await self._bisect(start, right=False)
+        hi = await self._bisect(end, right=True)
+        if lo >= hi:
+            return []
+        await self.load_pages(range(lo // self.page_size, (hi - 1) // self.page_size + 1))
+        return list(self.timestamps[lo:hi])
+
+    async def values(self, timestamps: List[int]) -> List[Optional[bytes]]:
+        """Report values at the given report times (cached after the first read)"""
+        missing = [t for t in dict.fromkeys(timestamps) if t not in self._values]
+        if missing:
+            results = await self.oracle.read_many(
+                [(self._value_fn, {"_queryId": self.query_id, "_timestamp": t}) for t in missing]
+            )
+            for t, (value, status) in zip(missing, results):
+                if status.ok:
+                    self._values[t] = bytes(value)
+                else:
+                    logger.warning(f"Unable to read value at {t}: {status.error}")
+        return [self._values.get(t) for t in timestamps]
+
+    async def value_at(self, timestamp: int) -> Tuple[Optional[int], Optional[bytes]]:
+        """Time and value of the last report at or before a timestamp"""
+        report_time = await self.timestamp_before(timestamp)
+        if report_time is None:
+            return None, None
+        (value,) = await self.values([report_time])
+        return report_time, value
+
+    async def values_between(self, start: int, end: int) -> List[Tuple[int, Optional[bytes]]]:
+        """Times and values of the reports with start <= timestamp <= end"""
+        report_times = await self.timestamps_between(start, end)
+        return list(zip(report_times, await self.values(report_times)))
@@ -0,0 +1,224 @@
+"""
+Batch scanning of autopay tips
+
+`get_current_tip` on the autopay contracts reads one query ID per RPC.
+`TipScanner` reads the current one-time tip and the data feeds of many
+query IDs with batched (Multicall3) reads, a bounded number of batches
+at a time, and ranks the query IDs by the reward of a report submitted
+now (feeds only pay within their reward windows).  Attached to a listener,
+it rescans a query ID whenever a `TipAdded` or `DataFeedFunded` event is
+seen, keeping the ranking up to date.
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import TYPE_CHECKING
+
+from hexbytes import HexBytes
+from web3.exceptions import ContractLogicError
+
+from telliot_core.contract.events import ContractEvent
+
+if TYPE_CHECKING:
+    from telliot_core.contract.contract import Contract
+    from telliot_core.contract.listener import Listener
+
+logger = logging.getLogger(__name__)
+
+#: Autopay events that change the tips of a query ID
+TIP_EVENTS = ("TipAdded", "DataFeedFunded")
+
+
+@dataclass(frozen=True)
+class FeedDetails:
+    """Data feed of a query ID (see autopay `getDataFeed`)"""
+
+    feed_id: bytes
+
+    #: Reward per eligible report
+    reward: int
+
+    #: Remaining feed funds
+    balance: int
+
+    #: First reward window starts at start_time, and a new one every interval seconds
+    start_time: int
+    interval: int
+
+    #: Seconds after the start of each interval in which a report is rewarded
+    window: int
+
+    def payable_reward(self, timestamp: int) -> int:
+        """Reward the feed can pay for a report at a timestamp (zero outside the reward windows)"""
+        if timestamp < self.start_time:
+            return 0
+        if self.interval > 0 and (timestamp - self.start_time) % self.interval >= self.window:
+            return 0
+        return min(self.reward, self.balance)
+
+
+@dataclass(frozen=True)
+class QueryTips:
+    """Current tips of a query ID"""
+
+    query_id: bytes
+
+    #: Current one-time tip
+    tip: int
+
+    #: Data feeds of the query ID
+    feeds: Tuple[FeedDetails, ...] = ()
+
+    #: Time of the scan, at which the feed rewards are evaluated
+    timestamp: int = 0
+
+    def feed_reward_at(self, timestamp: int) -> int:
+        return sum(feed.payable_reward(timestamp) for feed in self.feeds)
+
+    def total_at(self, timestamp: int) -> int:
+        """One-time tip plus the payable reward of all feeds for a report at a timestamp"""
+        return self.tip + self.feed_reward_at(timestamp)
+
+    @property
+    def feed_reward(self) -> int:
+        return self.feed_reward_at(self.timestamp)
+
+    @property
+    def total(self) -> int:
+        """One-time tip plus the payable reward of all feeds at the time of the scan"""
+        return self.total_at(self.timestamp)
+
+
+class TipScanner:
+    """Ranks query IDs by their current autopay tips
+
+    Works with the TellorFlex and Tellor360 autopay contracts.
+
+    Args:
+        autopay: Autopay contract
+        batch_size: Query IDs per batched read
+        concurrency: Maximum number of batches read at the same time
+
+    Example:
+        scanner = TipScanner(core.get_tellor360_contracts().autopay)
+        ranking = await scanner.scan_tips(query_ids)
+        await scanner.attach(listener)
+    """
+
+    def __init__(self, autopay: "Contract", batch_size: int = 100, concurrency: int = 4):
+        self.autopay = autopay
+        self.batch_size = max(1, batch_size)
+        self.concurrency = max(1, concurrency)
+
+        #: Latest scanned tips by query ID
+        self.tips: Dict[bytes, QueryTips] = {}
+
+        #: Errors of the query IDs that could not be read in their latest scan
+        self.failures: Dict[bytes, str] = {}
+
+        # Created in the running loop, since asyncio primitives bind to a loop on Python 3.9
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+            self._loop = loop
+        return self._semaphore
+
+    async def _scan_batch(self, query_ids: Sequence[bytes], timestamp: int) -> List[QueryTips]:
+        async with self._get_semaphore():
+            calls = []
+            for query_id in query_ids:
+                calls.append(("getCurrentTip", {"_queryId": query_id}))
+                calls.append(("getCurrentFeeds", {"_queryId": query_id}))
+            results = await self.autopay.read_many(calls)
+
+            tips: Dict[bytes, int] = {}
+            feed_ids: Dict[bytes, List[bytes]] = {}
+            for query_id, (tip, tip_status), (feeds, feeds_status) in zip(query_ids, results[0::2], results[1::2]):
+                if not tip_status.ok and not isinstance(tip_status.e, ContractLogicError):
+                    self._failed(query_id, f"Unable to read tip: {tip_status.error}")
+                elif not feeds_status.ok:
+                    self._failed(query_id, f"Unable to read feeds: {feeds_status.error}")
+                else:
+                    # autopay contract reverts when tip amount is zero
+                    tips[query_id] = int(tip) if tip_status.ok else 0
+                    feed_ids[query_id] = [bytes(feed_id) for feed_id in feeds]
+
+            all_feeds = list(dict.fromkeys(feed_id for ids in feed_ids.values() for feed_id in ids))
+            details: Dict[bytes, FeedDetails] = {}
+            feed_errors: Dict[bytes, str] = {}
+            if all_feeds:
+                results = await self.autopay.read_many([("getDataFeed", {"_feedId": f}) for f in all_feeds])
+                for feed_id, (feed, status) in zip(all_feeds, results):
+                    if not status.ok:
+                        feed_errors[feed_id] = f"Unable to read data feed {feed_id.hex()}: {status.error}"
+                        continue
+                    # FeedDetails field order is the same on TellorFlex and Tellor360
+                    reward, balance, start_time, interval, window = feed[:5]
+                    details[feed_id] = FeedDetails(feed_id, reward, balance, start_time, interval, window)
+
+        scanned = []
+        for query_id, ids in feed_ids.items():
+            errors = [feed_errors[f] for f in ids if f in feed_errors]
+            if errors:
+                self._failed(query_id, errors[0])
+                continue
+            scanned.append(QueryTips(query_id, tips[query_id], tuple(details[f] for f in ids), timestamp))
+        return scanned
+
+    def _failed(self, query_id: bytes, error: str) -> None:
+        logger.warning(f"Skipping query {query_id.hex()}: {error}")
+        self.failures[query_id] = error
+
+    async def scan_tips(self, query_ids: Iterable[Any], timestamp: Optional[int] = None) -> List[QueryTips]:
+        """Read the current tips of query IDs
+
+        Query IDs whose tips cannot be read are skipped and recorded in `failures`.
+
+        Args:
+            query_ids: Query IDs (bytes or hex strings)
+            timestamp: Time at which the feed rewards are evaluated (default: now)
+
+        Returns:
+            Tips of the query IDs, highest total reward first
+        """
+        if timestamp is None:
+            timestamp = int(time.time())
+        ids = list(dict.fromkeys(bytes(HexBytes(q)) for q in query_ids))
+        batches = []
+        for start in range(0, len(ids), self.batch_size):
+            end = start + self.batch_size
+            batches.append(ids[start:end])
+        results = await asyncio.gather(*(self._scan_batch(batch, timestamp) for batch in batches))
+        scanned = [tips for batch in results for tips in batch]
+
+        for tips in scanned:
+            self.tips[tips.query_id] = tips
+            self.failures.pop(tips.query_id, None)
+        return sorted(scanned, key=lambda t: t.total, reverse=True)
+
+    def ranking(self, timestamp: Optional[int] = None) -> List[QueryTips]:
+        """All scanned query IDs, highest total reward at a timestamp (default: now) first"""
+        if timestamp is None:
+            timestamp = int(time.time())
+        return sorted(self.tips.values(), key=lambda t: t.total_at(timestamp), reverse=True)
+
+    async def handle_event(self, event: Any) -> None:
+        """Listener handler rescanning the query ID of tip events"""
+        if isinstance(event, ContractEvent) and event.event in TIP_EVENTS and not event.removed:
+            await self.scan_tips([event.args["_queryId"]])
+
+    async def attach(self, listener: "Listener") -> None:
+        """Keep the tips up to date from the autopay events seen by the listener"""
+        await listener.subscribe_events(handler=self.handle_event, address=self.autopay.address, events=TIP_EVENTS)
@@ -0,0 +1,71 @@
+"""
+Lazy loading of the packaged data registries
+
+The contract directory, asset registry and query catalog are built from
+their data files on first use instead of at import time (see e.g.
+`get_contract_directory`).  The built objects are also stored as pickled
+snapshots under the telliot home directory, which are reused until the
+data file changes.
+"""
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Callable
+from typing import TypeVar
+
+import telliot_core
+from telliot_core.utils.home import telliot_homedir
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def _snapshot_file(json_file: Path) -> Path:
+    return telliot_homedir() / "cache" / f"{json_file.stem}.pickle"
+
+
+def _source_key(json_file: Path) -> tuple[str, str, int, int]:
+    stat = json_file.stat()
+    return telliot_core.__version__, str(json_file.resolve()), stat.st_mtime_ns, stat.st_size
+
+
+def load_with_snapshot(json_file: Path, build: Callable[[Path], T], use_snapshot: bool = True) -> T:
+    """Build an object from a JSON file, reusing a pickled snapshot if the file is unchanged
+
+    Snapshots are keyed by the telliot version and by the path, mtime and size
+    of the JSON file.  Snapshot errors are ignored and the object is rebuilt.
+    """
+    if not use_snapshot or os.environ.get("TELLIOT_NO_SNAPSHOT"):
+        return build(json_file)
+
+    key = _source_key(json_file)
+    snapshot_file = _snapshot_file(json_file)
+    try:
+        with open(snapshot_file, "rb") as f:
+            snapshot_key, obj = pickle.load(f)
+        if snapshot_key == key:
+            return obj  # type: ignore
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.debug(f"Ignoring snapshot of {json_file.name}: {e!r}")
+
+    obj = build(json_file)
+
+    try:
+        snapshot_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=snapshot_file.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((key, obj), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, snapshot_file)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except Exception as e:
+        logger.debug(f"Unable to write snapshot of {json_file.name}: {e!r}")
+
+    return obj
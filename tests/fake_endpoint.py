@@ -0,0 +1,19 @@
+"""
+RPCEndpoint stand-in for unit tests that do not need a node
+"""
+from types import SimpleNamespace
+
+
+class FakeEndpoint:
+    """Endpoint whose async connection is a stub
+
+    Args:
+        eth: Stand-in for `web3.eth`
+        provider: Stand-in for `web3.provider`
+    """
+
+    def __init__(self, eth=None, provider=None):
+        self.async_web3 = SimpleNamespace(eth=eth, provider=provider)
+
+    async def connect_async(self):
+        return self.async_web3
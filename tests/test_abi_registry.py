@@ -0,0 +1,84 @@
+"""
+Tests covering the precompiled ABI registry
+"""
+import copy
+import gc
+import json
+import weakref
+
+import pytest
+from web3 import AsyncWeb3
+from web3 import Web3
+
+from telliot_core.contract.abi_registry import compile_abi
+from telliot_core.contract.abi_registry import contract_factory
+from telliot_core.contract.contract import Contract
+from telliot_core.directory import contract_directory
+from telliot_core.model.endpoints import RPCEndpoint
+
+
+def test_compile_abi():
+    """ABIs are compiled once and shared by content"""
+    abi = contract_directory.get("tellor360-oracle").get_abi()
+
+    compiled = compile_abi(abi)
+    assert compile_abi(abi) is compiled
+    assert compile_abi(json.dumps(abi)) is compiled
+    assert compile_abi(json.loads(json.dumps(abi))) is compiled
+
+    fn = compiled.function("getReportingLock")
+    assert fn.selector == Web3.keccak(text="getReportingLock()")[:4]
+    assert fn.output_types == ["uint256"]
+    assert compiled.selectors[fn.selector] is fn
+
+    event = compiled.events["NewReport"]
+    assert compiled.topics[event.topic] is event
+
+    with pytest.raises(ValueError):
+        compiled.function("notAFunction")
+
+
+def test_contract_factory():
+    """One web3 contract class is shared per ABI and connection"""
+    compiled = compile_abi(contract_directory.get("trb-token").get_abi())
+    w3 = Web3()
+
+    factory = contract_factory(w3, compiled)
+    assert contract_factory(w3, compiled) is factory
+    assert contract_factory(Web3(), compiled) is not factory
+
+
+def test_compiled_abi_released():
+    """ABIs fetched at run time are not kept alive by the registry"""
+    abi = [{"type": "function", "name": "released", "inputs": [], "outputs": [], "stateMutability": "view"}]
+    compiled = compile_abi(abi)
+    ref = weakref.ref(compiled)
+    assert compile_abi(copy.deepcopy(abi)) is compiled
+
+    del compiled
+    gc.collect()
+    assert ref() is None
+
+
+def test_contract_malformed_abi():
+    """A malformed ABI is reported when connecting, not when creating the contract"""
+    node = RPCEndpoint(chain_id=1, network="mainnet", url="http://localhost:8545")
+    contract = Contract(address="0x" + "11" * 20, abi=[{"type": "function"}], node=node)
+
+    status = contract.connect()
+    assert not status.ok
+    assert status.error == "invalid contract abi"
+    assert isinstance(status.e, KeyError)
+
+
+@pytest.mark.parametrize("make_w3", [Web3, AsyncWeb3])
+def test_contract_factory_released(make_w3):
+    """Contract classes do not keep their connection alive"""
+    compiled = compile_abi(contract_directory.get("trb-token").get_abi())
+    w3 = make_w3()
+    contract_factory(w3, compiled)
+    ref = weakref.ref(w3)
+
+    del w3
+    gc.collect()
+    assert ref() is None
@@ -6,10 +6,23 @@ The bug prevents CliRunner from capturing logger output
   - https://github.com/pallets/click/issues/2156
   - https://github.com/pallets/click/issues/824
 """
+import json
+import subprocess
+import sys
+from types import SimpleNamespace
+
+import click
 import pytest
 from click.testing import CliRunner
 
+from telliot_core.cli.commands import account as account_cmd
 from telliot_core.cli.main import main
+from telliot_core.cli.profile import ImportProfiler
+from telliot_core.tellor.staker_info import StakerInfo
+from telliot_core.utils.response import ResponseStatus
+
+#: Modules that must not be imported to show the version or help
+HEAVY_MODULES = ["web3", "aiohttp", "eth_account", "chained_accounts", "telliot_core.apps.core"]
 
 
 def test_main_help():
@@ -20,6 +33,65 @@ def test_main_help():
     assert "Usage:" in result.stdout
 
 
+@pytest.mark.parametrize("args", [["--version"], ["--help"]])
+def test_startup_imports(args):
+    """`--version` and `--help` skip the subcommand imports"""
+    script = f"""
+import json, sys
+from telliot_core.cli.main import main
+try:
+    main({args!r}, standalone_mode=False)
+finally:
+    print(json.dumps(sorted(sys.modules)))
+"""
+    out = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    modules = json.loads(out.stdout.splitlines()[-1])
+
+    assert "telliot_core.cli.main" in modules
+    assert not set(HEAVY_MODULES) & set(modules)
+
+
+def test_lazy_help():
+    """The short help listed by `--help` matches the subcommands"""
+    ctx = click.Context(main)
+    for name, short_help in main.lazy_help.items():
+        assert main.get_command(ctx, name).get_short_help_str() == short_help
+
+
+def test_profile_startup(monkeypatch):
+    """Import times and config load time are reported"""
+    runner = CliRunner()
+    result = runner.invoke(main, ["--profile-startup", "config", "--help"])
+    assert not result.exception
+    assert "Imported" in result.stderr
+    assert "Loaded configuration in" in result.stderr
+
+    monkeypatch.delitem(sys.modules, "telliot_core.utils.versions", raising=False)
+    with ImportProfiler() as profiler:
+        import telliot_core.utils.versions  # noqa: F401
+    assert profiler.timings[-1].name == "telliot_core.utils.versions"
+    assert profiler.timings[-1].depth == 0
+
+
+def test_profile_startup_core():
+    """The TelliotCore import deferred to `cli_core` is included in the report"""
+    script = """
+import click
+from telliot_core.cli.main import main
+from telliot_core.cli.utils import cli_core
+
+@main.command()
+@click.pass_context
+def core(ctx):
+    cli_core(ctx)
+
+main(["--profile-startup", "core"], standalone_mode=False)
+"""
+    out = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    assert "telliot_core.apps.core" in out.stderr
+    assert "Loaded configuration in" in out.stderr
+
+
 def test_config_cmd():
     """Test telliot_core CLI command: report."""
     runner = CliRunner()
@@ -71,3 +143,40 @@ def test_account_status():
     runner = CliRunner()
     result = runner.invoke(main, ["--test_config", "account", "status"])
     assert not result.exception
+
+
+def test_account_status_all(monkeypatch):
+    """All accounts are grouped by chain and read with one batch per chain"""
+    accounts = [
+        SimpleNamespace(name="alice", address="0x" + "11" * 20, chains=[1, 137]),
+        SimpleNamespace(name="bob", address="0x" + "22" * 20, chains=[137]),
+        SimpleNamespace(name="carol", address="0x" + "33" * 20, chains=[5]),
+    ]
+    batches = []
+
+    async def get_chain_staker_infos(ctx, chain_id, chain_accounts):
+        batches.append((chain_id, [acc.name for acc in chain_accounts]))
+        if chain_id == 5:
+            raise ConnectionError("node unavailable")
+        infos = []
+        for acc in chain_accounts:
+            if acc.name == "bob":
+                infos.append((None, ResponseStatus(ok=False, error="error reading from contract")))
+            else:
+                info = StakerInfo(acc.address, "Staked", 1650000000, staked_balance=10**20)
+                infos.append((info, ResponseStatus()))
+        return infos
+
+    monkeypatch.setattr(account_cmd, "find_accounts", lambda: accounts)
+    monkeypatch.setattr(account_cmd, "get_chain_staker_infos", get_chain_staker_infos)
+
+    result = CliRunner().invoke(main, ["account", "status", "--all"])
+    assert not result.exception
+
+    assert sorted(batches) == [(1, ["alice"]), (5, ["carol"]), (137, ["alice", "bob"])]
+    lines = result.stdout.splitlines()
+    assert lines[0].startswith("alice (0x1111111111111111111111111111111111111111) on chain 1: Staked, staked on")
+    assert lines[0].endswith(", 100.0 TRB")
+    assert lines[1] == "Chain 5: failed to retrieve account status (ConnectionError('node unavailable'))"
+    assert lines[2].startswith("alice (0x1111111111111111111111111111111111111111) on chain 137: Staked")
+    assert lines[3] == "bob on chain 137: failed to retrieve account status (error reading from contract)"
@@ -1,10 +1,13 @@
 """
 Test covering Pytelliot EVM contract connection utils.
 """
+import asyncio
+
 import pytest
 import web3
 
 from telliot_core.apps.core import TelliotCore
+from telliot_core.tellor.tellorx.oracle import TellorxOracleContract
 
 
 @pytest.mark.asyncio
@@ -38,3 +41,20 @@ async def test_mixed_gas_inputs(sepolia_test_cfg):
                 legacy_gas_price=1,
                 max_fee_per_gas=2,
             )
+
+
+@pytest.mark.asyncio
+async def test_async_read(sepolia_test_cfg, project, accounts):
+    """Contract.read() should use the endpoint's async connection"""
+    mock_oracle = accounts[0].deploy(project.TellorXOracleMock)
+
+    async with TelliotCore(config=sepolia_test_cfg) as core:
+        oracle = TellorxOracleContract(core.endpoint, core.get_account())
+        oracle.address = mock_oracle.address
+        oracle.connect()
+
+        results = await asyncio.gather(*[oracle.read("getReportingLock") for _ in range(5)])
+
+        assert isinstance(core.endpoint.async_web3, web3.AsyncWeb3)
+        assert all(status.ok for _, status in results)
+        assert [value for value, _ in results] == [12] * 5
@@ -1,7 +1,12 @@
+import asyncio
 import time
 
 import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 
+from telliot_core import abi_cache
+from telliot_core.abi_cache import AbiCache
 from telliot_core.directory import contract_directory
 from telliot_core.directory import ContractInfo
 
@@ -40,6 +45,71 @@ def test_contract_directory():
     assert isinstance(mainnet_contracts[0], ContractInfo)
 
 
+def test_indexed_lookups():
+    """Exact lookups by name and address use the directory indexes"""
+    cd = contract_directory
+
+    oracle = cd.get("tellor360-oracle")
+    assert oracle is cd.entries["tellor360-oracle"]
+    assert cd.get("tellor360") is None
+
+    chain_id, address = next(iter(oracle.address.items()))
+    assert cd.get("tellor360-oracle", chain_id=chain_id) is oracle
+    assert cd.get("tellor360-oracle", chain_id=-1) is None
+
+    assert cd.get_by_address(address) is oracle
+    assert cd.get_by_address(address.lower(), chain_id=chain_id) is oracle
+    assert cd.get_by_address("0x0000000000000000000000000000000000000001") is None
+
+    # find() still matches name substrings, narrowed by the indexes
+    assert cd.find(name="tellor360", chain_id=chain_id)[0] is oracle
+    assert cd.find(address=address, chain_id=chain_id) == [oracle]
+
+
+def test_abi_cache(tmp_path, monkeypatch):
+    """Explorer ABIs are loaded from the on-disk cache"""
+    cache = AbiCache(tmp_path)
+    monkeypatch.setattr(abi_cache, "_abi_cache", cache)
+
+    def no_explorer(*args, **kwargs):
+        raise AssertionError("Explorer should not be used")
+
+    monkeypatch.setattr("requests.get", no_explorer)
+
+    abi = [{"type": "function", "name": "tellorReport", "inputs": [], "outputs": []}]
+    address = "0x88dF592F8eb5D7Bd38bFeF7dEb0fBc02cf3778a0"
+    cache.put(1, address, abi)
+    cache.put(5, address.lower(), abi)
+
+    # Identical ABIs are stored once
+    assert len(list((tmp_path / "abis").iterdir())) == 1
+    assert AbiCache(tmp_path).get(5, address) == abi
+    assert cache.get(4, address) is None
+
+    info = ContractInfo(org="tellor", name="tellor-provider", address={1: address})
+    assert info.get_abi(chain_id=1) == abi
+
+
+@pytest.mark.asyncio
+async def test_abi_explorer_timeout(tmp_path, monkeypatch):
+    """A hung explorer fails the ABI fetch after the timeout"""
+    monkeypatch.setattr(abi_cache, "_abi_cache", AbiCache(tmp_path))
+    monkeypatch.setattr("telliot_core.directory.EXPLORER_TIMEOUT", 0.05)
+
+    async def hang(request):
+        await asyncio.sleep(1)
+        return web.json_response([])
+
+    app = web.Application()
+    app.router.add_get("/api", hang)
+    async with TestServer(app) as server:
+        info = ContractInfo(org="tellor", name="tellor-provider", address={1: "0x" + "11" * 20})
+        monkeypatch.setattr(info, "abi_url", lambda chain_id, api_key="": str(server.make_url("/api")))
+
+        with pytest.raises(TimeoutError):
+            await info.fetch_abi_async(1)
+
+
 def test_directory_config_file():
     """Test the contract directory config file"""
     cd = contract_directory
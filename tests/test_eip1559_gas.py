@@ -0,0 +1,65 @@
+"""
+Test covering EIP-1559 fee estimation from fee history
+"""
+import pytest
+
+from telliot_core.gas.eip1559_gas import FeeHistoryOracle
+from telliot_core.gas.eip1559_gas import interpolated_percentile
+from tests.fake_endpoint import FakeEndpoint
+
+GWEI = 10**9
+
+
+class FakeEth:
+    """Node stand-in with base fee (n + 10) gwei and rewards (n, 2n, 3n) gwei in block n"""
+
+    def __init__(self, block_number):
+        self.block_number_value = block_number
+        self.requests = []
+
+    @property
+    async def block_number(self):
+        return self.block_number_value
+
+    async def fee_history(self, block_count, newest_block, reward_percentiles):
+        self.requests.append((block_count, newest_block))
+        oldest = newest_block - block_count + 1
+        blocks = range(oldest, newest_block + 1)
+        return {
+            "oldestBlock": oldest,
+            "baseFeePerGas": [(n + 10) * GWEI for n in range(oldest, newest_block + 2)],
+            "gasUsedRatio": [0.0 if n == newest_block else 0.5 for n in blocks],
+            "reward": [[n * GWEI, 2 * n * GWEI, 3 * n * GWEI] for n in blocks],
+        }
+
+
+def test_interpolated_percentile():
+    assert interpolated_percentile([3, 1, 2], 50) == 2
+    assert interpolated_percentile([1, 2, 3, 4], 50) == 2.5
+    assert interpolated_percentile([1, 2, 3, 4], 100) == 4
+    with pytest.raises(ValueError):
+        interpolated_percentile([], 50)
+
+
+@pytest.mark.asyncio
+async def test_fee_history_oracle():
+    node = FakeEndpoint(eth=FakeEth(block_number=100))
+    oracle = FeeHistoryOracle(node, block_count=5)
+
+    fees = await oracle.estimate(percentile=90)
+
+    # Blocks 96-99 are not empty, median of 3n gwei is 292.5 gwei
+    assert [b.number for b in oracle.blocks] == [96, 97, 98, 99, 100]
+    assert fees.base_fee_per_gas == 111 * GWEI
+    assert fees.max_priority_fee_per_gas == int(292.5 * GWEI)
+    assert fees.max_fee_per_gas == 2 * 111 * GWEI + fees.max_priority_fee_per_gas
+    assert fees.write_kwargs() == {"max_fee_per_gas": 514.5, "max_priority_fee_per_gas": 292.5}
+
+    # Only new blocks are fetched
+    await oracle.handle_new_block({"number": 102})
+    await oracle.estimate(percentile=10, update=False)
+    assert node.async_web3.eth.requests == [(5, 100), (2, 102)]
+    assert [b.number for b in oracle.blocks] == [98, 99, 100, 101, 102]
+
+    with pytest.raises(ValueError):
+        await oracle.estimate(percentile=75)
@@ -0,0 +1,59 @@
+"""
+Tests covering ABI decoding of contract events
+"""
+import pytest
+from eth_abi import encode
+from web3 import Web3
+
+from telliot_core.contract.events import default_event_table
+from telliot_core.contract.events import EventTable
+from telliot_core.contract.listener import log_entry_formatter
+from telliot_core.directory import contract_directory
+
+REPORTER = "0x88df592f8eb5d7bd38bfef7deb0fbc02cf3778a0"
+
+
+def new_report_log(query_id: bytes, timestamp: int, value: bytes) -> dict:
+    topic0 = Web3.keccak(text="NewReport(bytes32,uint256,bytes,uint256,bytes,address)")
+    topics = [topic0, query_id, encode(["uint256"], [timestamp]), encode(["address"], [REPORTER])]
+    return {
+        "address": "0x" + "11" * 20,
+        "topics": ["0x" + t.hex() for t in topics],
+        "data": "0x" + encode(["bytes", "uint256", "bytes"], [value, 7, b"query data"]).hex(),
+        "blockNumber": "0x10",
+        "logIndex": "0x0",
+    }
+
+
+def test_decode_new_report():
+    """Events are decoded by topic0 into ContractEvents"""
+    table = default_event_table()
+    query_id = Web3.keccak(text="query")
+    raw = new_report_log(query_id, 1700000000, b"\x01\x02")
+
+    event = table.format_log(raw)
+    assert event.event == "NewReport"
+    assert event.blockNumber == 16
+    assert event.args._queryId == query_id
+    assert event.args._time == 1700000000
+    assert event.args._value == b"\x01\x02"
+    assert event.args._nonce == 7
+    assert event["args"]["_reporter"] == Web3.to_checksum_address(REPORTER)
+    assert list(event.args) == ["_queryId", "_time", "_value", "_nonce", "_queryData", "_reporter"]
+
+    # Unknown events are passed on undecoded
+    raw["topics"][0] = "0x" + "00" * 32
+    assert table.decode(log_entry_formatter(raw)) is None
+    assert table.format_log(raw).blockNumber == 16
+
+
+def test_event_topics():
+    """Event names map to the topic0 hashes of all their signatures"""
+    table = EventTable.from_abis([contract_directory.get("tellor360-autopay").get_abi()])
+    assert table.topics(["TipAdded"]) == ["0x" + Web3.keccak(text="TipAdded(bytes32,uint256,bytes,address)").hex()]
+
+    # NewReport differs between TellorX and Tellor360
+    assert len(default_event_table().topics(["NewReport"])) == 2
+
+    with pytest.raises(ValueError):
+        table.topics(["NotAnEvent"])
@@ -1,31 +1,43 @@
 """
 Test covering gas price fetching utils
 """
+import asyncio
+from json.decoder import JSONDecodeError
+
+import aiohttp
 import pytest
-from requests.exceptions import SSLError
 
+from src.telliot_core.gas import legacy_gas
 from src.telliot_core.gas.legacy_gas import fetch_gas_price
 from src.telliot_core.gas.legacy_gas import legacy_gas_station
+from src.telliot_core.gas.legacy_gas import legacy_gas_stations
 
 
-def raise_ssl_error(*args, **kwargs):
-    raise SSLError
+async def raise_ssl_error(*args, **kwargs):
+    raise aiohttp.ClientSSLError(None, OSError())
 
 
-def raise_exception():
+async def raise_exception(*args, **kwargs):
     raise Exception
 
 
+@pytest.fixture(autouse=True)
+def clear_gas_station_cache():
+    legacy_gas.gas_station_cache.clear()
+    yield
+    legacy_gas.gas_station_cache.clear()
+
+
 @pytest.mark.asyncio
 async def test_fetch_legacy_gas_price(monkeypatch, caplog):
 
-    monkeypatch.setattr("requests.get", lambda x: raise_ssl_error())
+    monkeypatch.setattr(legacy_gas, "_get_json", raise_ssl_error)
     gp = await fetch_gas_price()
 
     assert gp is None
     assert "SSLError -- Unable to fetch gas price" in caplog.text
 
-    monkeypatch.setattr("requests.get", lambda x: raise_exception())
+    monkeypatch.setattr(legacy_gas, "_get_json", raise_exception)
     gp = await fetch_gas_price()
 
     assert gp is None
@@ -41,19 +53,47 @@ async def test_legacy_gasstation(monkeypatch, caplog):
     assert gp is None
     assert "Please add gas station API for chain id: 0" in caplog.text
 
+    async def eth_prices(*args, **kwargs):
+        return {"fast": 350}
+
+    monkeypatch.setattr(legacy_gas, "_get_json", eth_prices)
     gp = await legacy_gas_station(chain_id=1, speed_parse_lis="premium")
 
     assert gp is None
     assert "Unable to parse gas price from gasstation: premium" in caplog.text
 
-    monkeypatch.setattr("requests.get", lambda x: raise_ssl_error())
+    legacy_gas.gas_station_cache.clear()
+    monkeypatch.setattr(legacy_gas, "_get_json", raise_ssl_error)
     gp = await legacy_gas_station(chain_id=1)
 
     assert gp is None
     assert "SSLError: Unable to fetch gas price" in caplog.text
 
-    monkeypatch.setattr("requests.get", lambda x: raise_exception())
+    monkeypatch.setattr(legacy_gas, "_get_json", raise_exception)
     gp = await legacy_gas_station(chain_id=1)
 
     assert gp is None
     assert "Error fetching gas price:" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_gasstation_retry_and_cache(monkeypatch):
+    """Failed fetches are retried, successful ones are shared"""
+    requests = []
+
+    async def flaky_prices(url, session=None):
+        requests.append(url)
+        await asyncio.sleep(0.01)
+        if len(requests) == 1:
+            raise JSONDecodeError("bad json", "", 0)
+        return {"fast": 350, "safeLow": 30}
+
+    monkeypatch.setattr(legacy_gas, "_get_json", flaky_prices)
+
+    assert await legacy_gas_station(chain_id=1) == 35
+    assert len(requests) == 2
+
+    # Concurrent requests for chains sharing an API are deduplicated and cached
+    prices = await legacy_gas_stations([1, 5, 11155111, 137, 80001])
+    assert prices == {1: 35, 5: 35, 11155111: 350, 137: 30, 80001: 30}
+    assert len(requests) == 3
@@ -0,0 +1,60 @@
+"""
+Tests covering the gas estimate cache
+"""
+import asyncio
+
+import pytest
+
+from telliot_core.contract.gas_cache import GasEstimateCache
+
+ADDRESS = "0x88dF592F8eb5D7Bd38bFeF7dEb0fBc02cf3778a0"
+
+
+def test_rolling_maximum():
+    """Cached gas limit is the largest recent estimate plus margin"""
+    cache = GasEstimateCache(margin=1.5, window=2)
+    key = cache.key(ADDRESS, "submitValue", {"_queryId": b"\x00" * 32, "_value": b"\x01" * 32, "_nonce": 0})
+    assert cache.get(key) is None
+
+    cache.record(key, 100)
+    cache.record(key, 200)
+    assert cache.get(key) == 300
+
+    cache.record(key, 120)
+    cache.record(key, 100)
+    assert cache.get(key) == 180
+
+    # Arguments of a different size use separate estimates
+    other = cache.key(ADDRESS, "submitValue", {"_queryId": b"\x00" * 32, "_value": b"\x01" * 64, "_nonce": 0})
+    assert other != key
+    assert cache.get(other) is None
+
+    # Reverted or out-of-gas transactions drop the estimates
+    cache.check_receipt(key, 180, {"status": 1, "gasUsed": 100})
+    assert cache.get(key) == 180
+    cache.check_receipt(key, 180, {"status": 1, "gasUsed": 180})
+    assert cache.get(key) is None
+
+
+@pytest.mark.asyncio
+async def test_background_refresh():
+    cache = GasEstimateCache(margin=1, refresh_interval=0)
+    key = cache.key(ADDRESS, "tip", {"_amount": 1})
+    calls = []
+
+    async def estimate_gas():
+        calls.append(1)
+        return 500
+
+    # Nothing to refresh before the first live estimate
+    cache.refresh(key, estimate_gas)
+    await asyncio.sleep(0)
+    assert not calls
+
+    cache.record(key, 100)
+    cache.refresh(key, estimate_gas)
+    cache.refresh(key, estimate_gas)
+    await asyncio.sleep(0)
+
+    assert len(calls) == 1
+    assert cache.get(key) == 500
@@ -0,0 +1,111 @@
+"""
+Tests covering the bounded listener handler queue
+"""
+import asyncio
+
+import pytest
+
+from telliot_core.contract.handler_queue import HandlerQueue
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "overflow, expected, dropped, coalesced",
+    [
+        ("drop_oldest", [0, 4, 5], 3, 0),
+        ("coalesce", [0, 1, 5], 0, 3),
+        ("block", [0, 1, 2, 3, 4, 5], 0, 0),
+    ],
+)
+async def test_overflow_policies(overflow, expected, dropped, coalesced):
+    """Full queues block, drop the oldest messages, or replace the newest queued message"""
+    release = asyncio.Event()
+    handled = []
+
+    async def handler(msg):
+        await release.wait()
+        handled.append(msg)
+
+    queue = HandlerQueue(workers=1, maxsize=2)
+    await queue.put("sub", handler, 0, overflow)
+    await asyncio.sleep(0)  # The worker takes the first message
+
+    producer = asyncio.create_task(_put_all(queue, handler, range(1, 6), overflow))
+    await asyncio.sleep(0.01)
+    assert len(queue) <= 2
+    assert producer.done() is (overflow != "block")
+
+    release.set()
+    await producer
+    await queue.join()
+    await queue.close()
+
+    assert handled == expected
+    assert queue.stats.processed == len(expected)
+    assert queue.stats.dropped == dropped
+    assert queue.stats.coalesced == coalesced
+    assert queue.stats.max_depth <= 2
+
+
+async def _put_all(queue, handler, messages, overflow):
+    for msg in messages:
+        await queue.put("sub", handler, msg, overflow)
+
+
+@pytest.mark.asyncio
+async def test_coalesce_shared_queue():
+    """Coalescing only replaces messages of the same subscription, and only when the queue is full"""
+    release = asyncio.Event()
+    handled = []
+
+    async def handler(msg):
+        await release.wait()
+        handled.append(msg)
+
+    queue = HandlerQueue(workers=1, maxsize=3)
+    await queue.put("a", handler, ("a", 0), "coalesce")
+    await asyncio.sleep(0)  # The worker takes the first message
+
+    # Not full yet: all messages are queued
+    for msg in [("a", 1), ("b", 1), ("a", 2)]:
+        await queue.put(msg[0], handler, msg, "coalesce")
+    assert queue.stats.coalesced == 0
+
+    # Full: newest queued message of the same subscription is replaced, other subscriptions are kept
+    for msg in [("b", 2), ("a", 3), ("c", 1), ("b", 3)]:
+        await queue.put(msg[0], handler, msg, "coalesce")
+
+    release.set()
+    await queue.join()
+    await queue.close()
+
+    assert handled == [("a", 0), ("a", 1), ("b", 3), ("a", 3)]
+    assert queue.stats.coalesced == 3
+    assert queue.stats.dropped == 1
+
+
+@pytest.mark.asyncio
+async def test_bounded_workers():
+    """No more than the configured number of handlers run at the same time"""
+    running = 0
+    peak = 0
+
+    async def handler(msg):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+        if msg == 3:
+            raise ValueError("handler error")
+
+    queue = HandlerQueue(workers=3, maxsize=100)
+    for i in range(50):
+        await queue.put(i, handler, i)
+    await queue.join()
+    await queue.close()
+
+    assert peak == 3
+    assert queue.stats.processed == 50
+    assert queue.stats.failed == 1
+    assert queue.stats.max_latency >= 0.001
@@ -0,0 +1,58 @@
+"""
+Tests covering lazy loading of the packaged registries
+"""
+import json
+import os
+
+import pytest
+
+from telliot_core import directory
+from telliot_core.directory import ContractDirectory
+from telliot_core.directory import get_contract_directory
+from telliot_core.utils import lazy
+from telliot_core.utils.lazy import load_with_snapshot
+
+
+def test_lazy_contract_directory():
+    """The module attribute is the contract directory itself, loaded on first use"""
+    get_contract_directory.cache_clear()
+    assert get_contract_directory.cache_info().currsize == 0
+
+    cd = directory.contract_directory
+    assert get_contract_directory.cache_info().currsize == 1
+    assert isinstance(cd, ContractDirectory)
+    assert cd is get_contract_directory()
+    assert directory.contract_directory is cd
+
+    with pytest.raises(AttributeError):
+        directory.not_a_registry
+
+
+def test_snapshot_follows_json_changes(tmp_path, monkeypatch):
+    """Snapshots are reused until the JSON file changes"""
+    monkeypatch.setattr(lazy, "_snapshot_file", lambda json_file: tmp_path / f"{json_file.stem}.pickle")
+    monkeypatch.delenv("TELLIOT_NO_SNAPSHOT", raising=False)
+
+    json_file = tmp_path / "directory.json"
+    entry = {"type": "ContractInfo", "name": "trb-token", "org": "tellor", "address": {"1": "0x" + "11" * 20}}
+    json_file.write_text(json.dumps([entry]))
+
+    builds = []
+
+    def build(path):
+        builds.append(path)
+        return ContractDirectory.from_file(path)
+
+    first = load_with_snapshot(json_file, build)
+    second = load_with_snapshot(json_file, build)
+    assert len(builds) == 1
+    assert second.get("trb-token", chain_id=1).address == first.get("trb-token", chain_id=1).address
+
+    entry["name"] = "tellor360-oracle"
+    json_file.write_text(json.dumps([entry]))
+    stat = json_file.stat()
+    os.utime(json_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    third = load_with_snapshot(json_file, build)
+    assert len(builds) == 2
+    assert third.get("tellor360-oracle") is not None
@@ -1,10 +1,25 @@
 import asyncio
 import logging
+from collections import defaultdict
 
+import aiohttp
 import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from eth_abi import encode
+from hexbytes import HexBytes
+from web3 import Web3
 
 from telliot_core.apps.core import TelliotCore
+from telliot_core.contract.listener import block_formatter
 from telliot_core.contract.listener import block_logger
+from telliot_core.contract.listener import eth_subscribe
+from telliot_core.contract.listener import Listener
+from telliot_core.contract.listener import ListenerConnection
+from telliot_core.contract.listener import ListenerOptions
+from telliot_core.contract.listener import log_entry_formatter
+from telliot_core.contract.listener import receive_message_task
 
 
 async def block_printer(msg) -> None:
@@ -25,3 +40,414 @@ async def test_subscribe_new_blocks(caplog, amoy_test_cfg):
         await asyncio.sleep(1)  # Note delay needed
 
     print(caplog.text)
+
+
+ADDRESS_1 = "0x" + "01" * 20
+ADDRESS_2 = "0x" + "02" * 20
+
+
+class FakeNode:
+    """Websocket node serving subscriptions, eth_blockNumber and eth_getLogs"""
+
+    def __init__(self):
+        self.connections = 0
+        self.requests = []
+        self.subscriptions = {}
+        self.sockets = set()
+        self.block = 100
+        self.logs = []
+        self.before_get_logs = None
+        self.get_logs_errors = []
+        self.max_log_range = None
+        self.app = web.Application()
+        self.app.router.add_get("/ws", self.handle)
+
+    async def handle(self, request):
+        self.connections += 1
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.sockets.add(ws)
+        async for msg in ws:
+            request = msg.json()
+            method, params = request["method"], request["params"]
+            self.requests.append((method, params))
+            if method == "eth_subscribe":
+                result = hex(len(self.subscriptions) + 1)
+                self.subscriptions[result] = (ws, params)
+            elif method == "eth_blockNumber":
+                result = hex(self.block)
+            elif method == "eth_getLogs":
+                if self.before_get_logs is not None:
+                    await self.before_get_logs()
+                start, end = int(params[0]["fromBlock"], 16), int(params[0]["toBlock"], 16)
+                error = self.get_logs_errors.pop(0) if self.get_logs_errors else None
+                if error is None and self.max_log_range is not None and end - start + 1 > self.max_log_range:
+                    error = {"code": -32005, "message": "query returned more than 10000 results"}
+                if error is not None:
+                    await ws.send_json({"jsonrpc": "2.0", "id": request["id"], "error": error})
+                    continue
+                result = [
+                    log
+                    for log in self.logs
+                    if log["address"] == params[0]["address"] and start <= int(log["blockNumber"], 16) <= end
+                ]
+            await ws.send_json({"jsonrpc": "2.0", "id": request["id"], "result": result})
+        self.sockets.discard(ws)
+        return ws
+
+    async def notify(self, params, result):
+        for sub_id, (ws, sub_params) in self.subscriptions.items():
+            if sub_params == params and not ws.closed:
+                msg = {"subscription": sub_id, "result": result}
+                await ws.send_json({"jsonrpc": "2.0", "method": "eth_subscription", "params": msg})
+
+    async def send_raw(self, data):
+        for ws in list(self.sockets):
+            await ws.send_str(data)
+
+    async def drop(self):
+        for ws in list(self.sockets):
+            await ws.close()
+
+    @property
+    def subscribed(self):
+        return [params for method, params in self.requests if method == "eth_subscribe"]
+
+
+@pytest_asyncio.fixture
+async def fake_node():
+    node = FakeNode()
+    async with TestServer(node.app) as server:
+        node.url = str(server.make_url("/ws"))
+        yield node
+
+
+async def wait_until(condition, timeout=2.0):
+    for _ in range(int(timeout / 0.01)):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    raise TimeoutError
+
+
+def log_entry(address, block, index=0, removed=False):
+    return {"address": address, "blockNumber": hex(block), "logIndex": hex(index), "data": "0x", "removed": removed}
+
+
+@pytest.mark.asyncio
+async def test_multiplexed_subscriptions(fake_node):
+    """Subscriptions share one connection and messages are routed by subscription ID"""
+    received = defaultdict(list)
+
+    def collect(name):
+        async def handler(msg):
+            received[name].append(msg)
+
+        return handler
+
+    async with aiohttp.ClientSession() as session:
+        listener = Listener(session=session, ws_url=fake_node.url)
+        blocks = await listener.subscribe_new_blocks(handler=collect("blocks"))
+        assert await listener.subscribe_new_blocks(handler=collect("blocks2")) is blocks
+        await listener.subscribe_contract_events(handler=collect("master"), address=ADDRESS_1)
+        await listener.subscribe_contract_events(handler=collect("oracle"), address=ADDRESS_2)
+        await wait_until(lambda: len(fake_node.subscribed) == 3)
+
+        await fake_node.notify(["newHeads"], {"number": "0x10"})
+        await fake_node.notify(["logs", {"address": ADDRESS_1}], log_entry(ADDRESS_1, 16))
+        await fake_node.notify(["logs", {"address": ADDRESS_2}], log_entry(ADDRESS_2, 16))
+        await wait_until(lambda: len(received) == 4)
+        await listener.shutdown()
+
+    assert fake_node.connections == 1
+    assert fake_node.subscribed == [["newHeads"], ["logs", {"address": ADDRESS_1}], ["logs", {"address": ADDRESS_2}]]
+
+    assert received["blocks"][0].number == 16
+    assert received["blocks2"] == received["blocks"]
+    assert [m.address for m in received["master"]] == [ADDRESS_1]
+    assert [m.address for m in received["oracle"]] == [ADDRESS_2]
+
+
+@pytest.mark.asyncio
+async def test_reconnect_backfill(fake_node):
+    """Events emitted while disconnected are backfilled after reconnecting"""
+    received = []
+
+    async def handler(log):
+        received.append(log.blockNumber)
+
+    async with aiohttp.ClientSession() as session:
+        options = ListenerOptions(reconnect_delay=0.01, backfill_chunk_size=2)
+        listener = Listener(session=session, ws_url=fake_node.url, options=options)
+        await listener.subscribe_contract_events(handler=handler, address=ADDRESS_1)
+        await wait_until(lambda: ("eth_blockNumber", []) in fake_node.requests)
+
+        await fake_node.notify(["logs", {"address": ADDRESS_1}], log_entry(ADDRESS_1, 101))
+        await wait_until(lambda: received == [101])
+
+        fake_node.logs = [
+            log_entry(ADDRESS_1, 101),
+            log_entry(ADDRESS_2, 102),
+            log_entry(ADDRESS_1, 102),
+            log_entry(ADDRESS_1, 105),
+        ]
+        fake_node.block = 105
+        await fake_node.drop()
+        await wait_until(lambda: len(received) == 3)
+
+        await fake_node.notify(["logs", {"address": ADDRESS_1}], log_entry(ADDRESS_1, 106))
+        await wait_until(lambda: len(received) == 4)
+        await listener.shutdown()
+
+    assert fake_node.connections == 2
+    assert received == [101, 102, 105, 106]
+    get_logs = [params[0] for method, params in fake_node.requests if method == "eth_getLogs"]
+    assert [(p["fromBlock"], p["toBlock"]) for p in get_logs] == [("0x65", "0x66"), ("0x67", "0x68"), ("0x69", "0x69")]
+
+
+@pytest.mark.asyncio
+async def test_reconnect_backfill_same_block(fake_node):
+    """Logs of a partly processed block are backfilled once, and live logs seen during the backfill are not repeated"""
+    received = []
+
+    async def handler(log):
+        received.append((log.blockNumber, log.logIndex, log.removed))
+
+    async with aiohttp.ClientSession() as session:
+        options = ListenerOptions(reconnect_delay=0.01)
+        listener = Listener(session=session, ws_url=fake_node.url, options=options)
+        await listener.subscribe_contract_events(handler=handler, address=ADDRESS_1)
+        await wait_until(lambda: ("eth_blockNumber", []) in fake_node.requests)
+
+        params = ["logs", {"address": ADDRESS_1}]
+        await fake_node.notify(params, log_entry(ADDRESS_1, 101, 0))
+        await fake_node.notify(params, log_entry(ADDRESS_1, 101, 1))
+        await wait_until(lambda: len(received) == 2)
+
+        async def live_logs():
+            # Sent while the missed logs are backfilled
+            fake_node.before_get_logs = None
+            await fake_node.notify(params, log_entry(ADDRESS_1, 102, 0))
+            await fake_node.notify(params, log_entry(ADDRESS_1, 101, 1, removed=True))
+            await fake_node.notify(params, log_entry(ADDRESS_1, 103, 0))
+
+        fake_node.logs = [log_entry(ADDRESS_1, 101, i) for i in range(3)] + [log_entry(ADDRESS_1, 102, 0)]
+        fake_node.block = 102
+        fake_node.before_get_logs = live_logs
+        await fake_node.drop()
+        await wait_until(lambda: len(received) == 6)
+        await listener.shutdown()
+
+    assert received == [
+        (101, 0, False),
+        (101, 1, False),
+        (101, 2, False),
+        (102, 0, False),
+        (101, 1, True),
+        (103, 0, False),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_reconnect_backfill_errors(fake_node):
+    """Failed backfills are retried and split, and live logs seen meanwhile are delivered afterwards"""
+    received = []
+
+    async def handler(log):
+        received.append(log.blockNumber)
+
+    async with aiohttp.ClientSession() as session:
+        options = ListenerOptions(reconnect_delay=0.01, backfill_chunk_size=4)
+        listener = Listener(session=session, ws_url=fake_node.url, options=options)
+        await listener.subscribe_contract_events(handler=handler, address=ADDRESS_1)
+        await wait_until(lambda: ("eth_blockNumber", []) in fake_node.requests)
+
+        params = ["logs", {"address": ADDRESS_1}]
+        await fake_node.notify(params, log_entry(ADDRESS_1, 101))
+        await wait_until(lambda: received == [101])
+
+        async def live_logs():
+            fake_node.before_get_logs = None
+            await fake_node.notify(params, log_entry(ADDRESS_1, 106))
+
+        fake_node.logs = [log_entry(ADDRESS_1, 102), log_entry(ADDRESS_1, 105)]
+        fake_node.block = 105
+        fake_node.before_get_logs = live_logs
+        # More failures than LogBackfill retries, then chunks with too many results
+        fake_node.get_logs_errors = [{"code": -32000, "message": "internal error"}] * 4
+        fake_node.max_log_range = 2
+        await fake_node.drop()
+        await wait_until(lambda: len(received) == 4)
+        await listener.shutdown()
+
+    assert fake_node.connections == 2
+    assert received == [101, 102, 105, 106]
+    get_logs = [params[0] for method, params in fake_node.requests if method == "eth_getLogs"]
+    assert [(p["fromBlock"], p["toBlock"]) for p in get_logs][-4:] == [
+        ("0x65", "0x68"),
+        ("0x65", "0x66"),
+        ("0x67", "0x68"),
+        ("0x69", "0x69"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_malformed_messages(fake_node, caplog):
+    """Malformed messages are logged and do not stop the connection"""
+    received = []
+
+    async def handler(block):
+        received.append(block.number)
+
+    async with aiohttp.ClientSession() as session:
+        listener = Listener(session=session, ws_url=fake_node.url)
+        await listener.subscribe_new_blocks(handler=handler)
+        await wait_until(lambda: len(fake_node.subscribed) == 1)
+
+        await fake_node.send_raw("not json")
+        await fake_node.send_raw('{"jsonrpc": "2.0", "method": "eth_subscription", "params": {}}')
+        await fake_node.send_raw("[1, 2]")
+        await fake_node.notify(["newHeads"], {"number": "0x10"})
+        await wait_until(lambda: received == [16])
+        await listener.shutdown()
+
+    assert fake_node.connections == 1
+    assert "Invalid JSON message" in caplog.text
+    assert "Unable to handle message" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_full_queue_keeps_reading(fake_node):
+    """Requests complete while messages wait for a full handler queue"""
+    release = asyncio.Event()
+    handled = []
+
+    async def handler(block):
+        await release.wait()
+        handled.append(block.number)
+
+    async with aiohttp.ClientSession() as session:
+        options = ListenerOptions(handler_workers=1, max_queued_messages=2, overflow="block")
+        assert ListenerConnection(session=session, ws_url=fake_node.url, options=options).queue.maxsize == 2
+
+        listener = Listener(session=session, ws_url=fake_node.url, options=options)
+        await listener.subscribe_new_blocks(handler=handler)
+        await wait_until(lambda: fake_node.subscribed)
+        for number in range(1, 9):
+            await fake_node.notify(["newHeads"], {"number": hex(number)})
+
+        # The queue is full and the handler is blocked, but the subscription still completes
+        events = await listener.subscribe_contract_events(handler=handler, address=ADDRESS_1)
+        await wait_until(lambda: events.sub_id is not None and events.last_block is not None)
+        assert not handled
+
+        release.set()
+        await wait_until(lambda: handled and handled[-1] == 8)
+        await listener.shutdown()
+
+    assert handled == sorted(handled)
+    assert len(handled) + listener.stats.dropped == 8
+
+
+def test_formatters():
+    """Only numeric fields are converted to integers and hashes to bytes"""
+    block = block_formatter(
+        {
+            "number": "0x10",
+            "hash": "0x" + "ab" * 32,
+            "parentHash": "0x" + "cd" * 32,
+            "timestamp": "0x64",
+            "baseFeePerGas": "0x7",
+            "miner": "0x88df592f8eb5d7bd38bfef7deb0fbc02cf3778a0",
+            "logsBloom": "0x" + "ff" * 256,
+        }
+    )
+    assert block.number == block["number"] == 16
+    assert block.hash == bytes.fromhex("ab" * 32)
+    assert block.baseFeePerGas == 7
+    assert block.gasUsed is None
+    assert block["logsBloom"] == block.logsBloom == "0x" + "ff" * 256
+    assert block.get("nonce") is None
+    with pytest.raises(AttributeError):
+        block.nonce
+    assert block.miner == block["miner"] == "0x88dF592F8eb5D7Bd38bFeF7dEb0fBc02cf3778a0"
+    assert "logsBloom" in block and "gasUsed" in block and "nonce" not in block
+
+    log = log_entry_formatter(
+        {
+            "address": "0x88df592f8eb5d7bd38bfef7deb0fbc02cf3778a0",
+            "topics": ["0x" + "01" * 32, "0x" + "00" * 32],
+            "data": "0x0000",
+            "blockNumber": "0x1b4",
+            "transactionHash": "0x" + "ef" * 32,
+            "logIndex": "0x0",
+            "blockTimestamp": "0x64",
+        }
+    )
+    assert log.blockTimestamp == log["blockTimestamp"] == "0x64"
+    assert log.address == log["address"] == log.get("address") == "0x88dF592F8eb5D7Bd38bFeF7dEb0fBc02cf3778a0"
+    assert log.topics == [bytes.fromhex("01" * 32), bytes(32)]
+    assert log.topics[0].hex() == "01" * 32
+    assert log.data == b"\x00\x00"
+    assert log.blockNumber == log.get("blockNumber") == 436
+    assert log.logIndex == 0
+    assert log.removed is False
+
+
+@pytest.mark.asyncio
+async def test_subscribe_events(fake_node):
+    """Event names are filtered by the node and handlers receive decoded events"""
+    received = []
+
+    async def handler(event):
+        received.append(event)
+
+    topic0 = "0x" + Web3.keccak(text="TipAdded(bytes32,uint256,bytes,address)").hex()
+    query_id = Web3.keccak(text="query")
+    log = {
+        "address": ADDRESS_1,
+        "topics": [topic0, "0x" + query_id.hex(), "0x" + encode(["uint256"], [10**18]).hex()],
+        "data": "0x" + encode(["bytes", "address"], [b"query data", "0x" + "22" * 20]).hex(),
+        "blockNumber": "0x10",
+    }
+
+    async with aiohttp.ClientSession() as session:
+        listener = Listener(session=session, ws_url=fake_node.url)
+        await listener.subscribe_events(handler=handler, address=ADDRESS_1, events=["TipAdded"])
+        await wait_until(lambda: ("eth_blockNumber", []) in fake_node.requests)
+        params = fake_node.subscribed[0][1]
+        await fake_node.notify(["logs", params], log)
+        await wait_until(lambda: received)
+        await listener.shutdown()
+
+    # Both the TellorFlex and Tellor360 TipAdded signatures are requested
+    assert len(params["topics"]) == 1 and topic0 in params["topics"][0]
+    assert received[0].event == "TipAdded"
+    assert received[0].args._queryId == query_id
+    assert received[0].args._amount == 10**18
+    assert received[0].args._tipper == "0x" + "22" * 20
+
+
+@pytest.mark.asyncio
+async def test_deprecated_subscribe(fake_node):
+    """The module-level eth_subscribe and receive_message_task still work and warn"""
+    received = []
+
+    async def handler(block):
+        received.append(block)
+
+    async with aiohttp.ClientSession() as session:
+        async with session.ws_connect(fake_node.url) as ws:
+            with pytest.warns(DeprecationWarning):
+                sub_id = await eth_subscribe(ws=ws, name="newHeads")
+            assert sub_id == HexBytes("0x01")
+
+            with pytest.warns(DeprecationWarning):
+                task = asyncio.create_task(receive_message_task(ws, handler, block_formatter))
+                await asyncio.sleep(0)
+            await fake_node.notify(["newHeads"], {"number": "0x10"})
+            await wait_until(lambda: received)
+            task.cancel()
+            await task
+
+    assert received[0].number == 16
@@ -0,0 +1,115 @@
+"""
+Tests covering the chunked eth_getLogs backfill
+"""
+import asyncio
+
+import pytest
+from eth_abi import encode
+from web3 import Web3
+
+from telliot_core.contract.log_backfill import LogBackfill
+from telliot_core.contract.log_backfill import RateLimited
+from telliot_core.contract.log_backfill import TooManyResults
+from tests.fake_endpoint import FakeEndpoint
+
+TIP_ADDED = Web3.keccak(text="TipAdded(bytes32,uint256,bytes,address)")
+ADDRESS_1 = "0x" + "01" * 20
+
+
+def tip_log(block: int, index: int) -> dict:
+    return {
+        "address": ADDRESS_1,
+        "topics": ["0x" + t.hex() for t in (TIP_ADDED, bytes(32), encode(["uint256"], [block]))],
+        "data": "0x" + encode(["bytes", "address"], [b"", "0x" + "22" * 20]).hex(),
+        "blockNumber": hex(block),
+        "logIndex": hex(index),
+    }
+
+
+class FakeProvider:
+    """Serves two logs per block and rejects requests with more than 50 results"""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.ranges = []
+
+    async def get_logs(self, log_filter):
+        start, end = int(log_filter["fromBlock"], 16), int(log_filter["toBlock"], 16)
+        self.ranges.append((start, end))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.001)
+            if 2 * (end - start + 1) > 50:
+                raise TooManyResults("query returned more than 10000 results")
+            return [tip_log(block, index) for block in range(end, start - 1, -1) for index in (1, 0)]
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.mark.asyncio
+async def test_adaptive_chunks():
+    """Chunks are split when the provider reports too many results, and results are ordered"""
+    provider = FakeProvider()
+    backfill = LogBackfill(provider.get_logs, chunk_size=100, concurrency=3)
+
+    logs = await backfill.get_logs(1000, 1499, address=ADDRESS_1)
+
+    assert [(log.blockNumber, log.logIndex) for log in logs] == [(b, i) for b in range(1000, 1500) for i in (0, 1)]
+    assert provider.max_in_flight == 3
+    assert backfill.chunk_size <= 50
+    assert backfill.requests == len(provider.ranges)
+
+
+@pytest.mark.asyncio
+async def test_get_events():
+    """Logs are decoded with the event table and filtered by event name"""
+    provider = FakeProvider()
+    backfill = LogBackfill(provider.get_logs, chunk_size=10)
+
+    events = await backfill.get_events(1, 20, address=ADDRESS_1, events=["TipAdded"])
+    assert len(events) == 40
+    assert events[-1].event == "TipAdded"
+    assert events[-1].args._amount == 20
+
+
+@pytest.mark.asyncio
+async def test_retries():
+    """Other errors are retried, then raised"""
+    calls = []
+
+    async def get_logs(log_filter):
+        calls.append(log_filter)
+        raise ConnectionError("boom")
+
+    backfill = LogBackfill(get_logs, retries=2)
+    with pytest.raises(ConnectionError):
+        await backfill.get_logs(1, 10)
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_rate_limits():
+    """Rate limit errors are retried without splitting the chunk"""
+    errors = [
+        {"code": 429, "message": "Too Many Requests: limit exceeded"},
+        {"code": -32005, "message": "daily request count exceeded, request rate limited"},
+        {"code": -32005, "message": "query returned more than 10000 results"},
+    ]
+    requests = []
+
+    class Provider:
+        async def make_request(self, method, params):
+            requests.append((int(params[0]["fromBlock"], 16), int(params[0]["toBlock"], 16)))
+            if errors:
+                return {"jsonrpc": "2.0", "id": 1, "error": errors.pop(0)}
+            return {"jsonrpc": "2.0", "id": 1, "result": []}
+
+    backfill = LogBackfill.from_endpoint(FakeEndpoint(provider=Provider()), chunk_size=10, retry_delay=0)
+    assert await backfill.get_logs(1, 10) == []
+    assert requests == [(1, 10), (1, 10), (1, 10), (1, 5), (6, 10)]
+
+    with pytest.raises(RateLimited):
+        errors.extend([{"code": -32005, "message": "project ID request rate exceeded"}] * 3)
+        await backfill.get_logs(1, 5)
@@ -0,0 +1,116 @@
+import pytest
+
+from telliot_core.apps.core import TelliotCore
+from telliot_core.contract.multicall import MulticallBatch
+from telliot_core.contract.read_cache import ReadCache
+from telliot_core.tellor.tellor360.autopay import Tellor360AutopayContract
+from telliot_core.tellor.tellorx.oracle import TellorxOracleContract
+from telliot_core.utils.response import ResponseStatus
+
+
+@pytest.fixture
+def multicall_mock_contract(project, accounts):
+    """Reusable fixture for Multicall3Mock contract"""
+    return accounts[0].deploy(project.Multicall3Mock)
+
+
+@pytest.fixture
+def tellorx_oracle_mock_contract(project, accounts):
+    return accounts[0].deploy(project.TellorXOracleMock)
+
+
+@pytest.fixture
+def mock_autopay_contract(project, accounts):
+    return accounts[0].deploy(project.AutopayMock)
+
+
+@pytest.mark.asyncio
+async def test_multicall_batch(
+    sepolia_test_cfg, multicall_mock_contract, tellorx_oracle_mock_contract, mock_autopay_contract
+):
+    """MulticallBatch should read from several contracts in one request"""
+    async with TelliotCore(config=sepolia_test_cfg) as core:
+        account = core.get_account()
+
+        oracle = TellorxOracleContract(core.endpoint, account)
+        oracle.address = tellorx_oracle_mock_contract.address
+        oracle.connect()
+
+        autopay = Tellor360AutopayContract(core.endpoint, account)
+        autopay.address = mock_autopay_contract.address
+        autopay.connect()
+
+        query_id = bytes.fromhex("0000000000000000000000000000000000000000000000000000000000000001")
+
+        batch = MulticallBatch(core.endpoint, address=multicall_mock_contract.address)
+        batch.add(oracle, "getReportingLock")
+        batch.add(oracle, "getTimestampCountById", _queryId=query_id)
+        batch.add(autopay, "getCurrentTip", _queryId=query_id)
+        batch.add(oracle, "notAFunction")
+
+        results = await batch.execute()
+        assert len(results) == 4
+
+        (lock, status), (count, count_status), (tip, tip_status), (_, bad_status) = results
+        assert status.ok and lock == 12
+        assert count_status.ok and count == 30
+        assert tip_status.ok and tip == 32
+        assert not bad_status.ok
+        assert "not found in contract abi" in bad_status.error
+
+
+@pytest.mark.asyncio
+async def test_read_many(sepolia_test_cfg, multicall_mock_contract, tellorx_oracle_mock_contract, monkeypatch):
+    """Contract.read_many should match individual reads"""
+    monkeypatch.setattr("telliot_core.contract.multicall.MULTICALL3_ADDRESS", multicall_mock_contract.address)
+    async with TelliotCore(config=sepolia_test_cfg) as core:
+        account = core.get_account()
+        oracle = TellorxOracleContract(core.endpoint, account)
+        oracle.address = tellorx_oracle_mock_contract.address
+        oracle.connect()
+
+        results = await oracle.read_many([("getReportingLock", {}), ("getTimeOfLastNewValue", {})])
+        single = [await oracle.read("getReportingLock"), await oracle.read("getTimeOfLastNewValue")]
+
+        assert [value for value, _ in results] == [value for value, _ in single]
+        assert all(status.ok for _, status in results)
+
+
+@pytest.mark.asyncio
+async def test_read_many_without_multicall(sepolia_test_cfg, tellorx_oracle_mock_contract, monkeypatch):
+    """Contract.read_many should fall back to individual reads if Multicall3 is not deployed"""
+    monkeypatch.setattr("telliot_core.contract.multicall.MULTICALL3_ADDRESS", "0x" + "12" * 20)
+    monkeypatch.setattr("telliot_core.contract.multicall._missing_multicall", set())
+    async with TelliotCore(config=sepolia_test_cfg) as core:
+        account = core.get_account()
+        oracle = TellorxOracleContract(core.endpoint, account)
+        oracle.address = tellorx_oracle_mock_contract.address
+        oracle.connect()
+
+        results = await oracle.read_many([("getReportingLock", {}), ("notAFunction", {})])
+
+        (lock, status), (_, bad_status) = results
+        assert status.ok and lock == 12
+        assert "not found in contract abi" in bad_status.error
+
+
+@pytest.mark.asyncio
+async def test_read_many_cache(sepolia_test_cfg, multicall_mock_contract, tellorx_oracle_mock_contract, monkeypatch):
+    """Contract.read_many should answer cached reads without a request"""
+    monkeypatch.setattr("telliot_core.contract.multicall.MULTICALL3_ADDRESS", multicall_mock_contract.address)
+    async with TelliotCore(config=sepolia_test_cfg) as core:
+        account = core.get_account()
+        oracle = TellorxOracleContract(core.endpoint, account)
+        oracle.address = tellorx_oracle_mock_contract.address
+        oracle.connect()
+        oracle.read_cache = ReadCache()
+        oracle.read_cache.set_block_number(1)
+
+        ((lock, status),) = await oracle.read_many([("getReportingLock", {})])
+        assert status.ok and lock == 12
+
+        async def no_batch(self):
+            raise AssertionError("cached read sent a request")
+
+        monkeypatch.setattr(MulticallBatch, "execute", no_batch)
+        assert await oracle.read_many([("getReportingLock", {})]) == [(12, ResponseStatus(ok=True))]
@@ -0,0 +1,121 @@
+"""
+Tests covering local transaction nonce management
+"""
+import asyncio
+
+import pytest
+
+from telliot_core.contract.nonce_manager import is_nonce_error
+from telliot_core.contract.nonce_manager import NonceManager
+from tests.fake_endpoint import FakeEndpoint
+
+ADDRESS = "0x88dF592F8eb5D7Bd38bFeF7dEb0fBc02cf3778a0"
+
+
+class FakeEth:
+    def __init__(self, count):
+        self.count = count
+        self.calls = 0
+
+    async def get_transaction_count(self, address, block_identifier):
+        self.calls += 1
+        return self.count
+
+
+@pytest.mark.asyncio
+async def test_consecutive_nonces():
+    """Nonces are synced once, then handed out locally"""
+    node = FakeEndpoint(eth=FakeEth(count=7))
+    manager = NonceManager(node=node, address=ADDRESS)
+
+    nonces = await asyncio.gather(*[manager.next_nonce() for _ in range(5)])
+
+    assert sorted(nonces) == [7, 8, 9, 10, 11]
+    assert node.async_web3.eth.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_release_and_errors():
+    """Unused nonces are reused, nonce errors force a resync"""
+    node = FakeEndpoint(eth=FakeEth(count=3))
+    manager = NonceManager(node=node, address=ADDRESS)
+
+    nonce = await manager.next_nonce()
+    manager.release(nonce)
+    assert await manager.next_nonce() == 3
+
+    first = await manager.next_nonce()
+    await manager.next_nonce()
+    manager.release(first)  # leaves a gap, filled by the next reservation
+    assert manager.next == 6
+    assert await manager.next_nonce() == first
+    assert manager.reserved == {3, 4, 5}
+
+    for n in (3, 4, 5):
+        manager.confirm(n)
+    node.async_web3.eth.count = 10
+    nonce = await manager.next_nonce()
+    assert nonce == 6
+
+    manager.handle_error(nonce, ValueError({"message": "nonce too low"}))
+    assert manager.next is None
+    assert await manager.next_nonce() == 10
+    assert node.async_web3.eth.calls == 2
+
+    manager.observe(20)
+    assert manager.next == 21
+
+
+@pytest.mark.asyncio
+async def test_resync_keeps_reserved_nonces():
+    """A resync does not hand out nonces reserved but not yet broadcast"""
+    node = FakeEndpoint(eth=FakeEth(count=5))
+    manager = NonceManager(node=node, address=ADDRESS)
+    first, second, third = [await manager.next_nonce() for _ in range(3)]
+
+    # The node has not seen the reserved nonces yet
+    manager.handle_error(first, ValueError("nonce too low"))
+    assert await manager.next_nonce() == third + 1
+    assert manager.reserved == {second, third, third + 1}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_sends():
+    """Concurrent senders with failures and resyncs never broadcast a nonce twice"""
+    node = FakeEndpoint(eth=FakeEth(count=0))
+    manager = NonceManager(node=node, address=ADDRESS)
+    broadcast = set()
+
+    async def send(i):
+        nonce = await manager.next_nonce()
+        await asyncio.sleep(0.001 * (i % 4))
+        if i % 5 == 1:
+            # e.g. gas estimation failed, nothing was broadcast
+            manager.handle_error(nonce, ValueError("insufficient funds for gas"))
+        elif i % 7 == 3:
+            # Another client used this nonce
+            broadcast.add(nonce)
+            node.async_web3.eth.count = pending_count()
+            manager.handle_error(nonce, ValueError("nonce too low"))
+        else:
+            assert nonce not in broadcast
+            broadcast.add(nonce)
+            node.async_web3.eth.count = pending_count()
+            manager.confirm(nonce)
+
+    def pending_count():
+        count = 0
+        while count in broadcast:
+            count += 1
+        return count
+
+    for _ in range(5):
+        await asyncio.gather(*[send(i) for i in range(20)])
+
+    assert not manager.reserved
+    assert len(broadcast) == 5 * 20 - 5 * 4
+
+
+def test_is_nonce_error():
+    assert is_nonce_error(ValueError("Nonce too high"))
+    assert not is_nonce_error(ValueError("insufficient funds for gas"))
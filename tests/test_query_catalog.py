@@ -0,0 +1,73 @@
+"""
+Tests covering the indexed query catalog
+"""
+import dataclasses
+import pickle
+
+import pytest
+
+from telliot_core.query_catalog import load_query_catalog
+from telliot_core.query_catalog import QUERY_CATALOG_FILE
+from telliot_core.query_catalog import QueryCatalog
+from telliot_core.utils.home import TELLIOT_CORE_ROOT
+
+OHM_ETH = "0xee4fcdeed773931af0bcd16cfcea5b366682ffbd4994cf78b4f0a6a40b570340"
+
+
+def test_lookups():
+    catalog = QueryCatalog.from_file(QUERY_CATALOG_FILE)
+
+    entry = catalog.by_query_id(OHM_ETH)
+    assert entry is not None and entry.tag == "ohm-eth-spot"
+    assert catalog.by_query_id(bytes.fromhex(OHM_ETH[2:])) is entry
+    assert catalog.get("ohm-eth-spot") is entry
+    assert "ohm-eth-spot" in catalog
+    assert entry.parameters == {"asset": "ohm", "currency": "eth"}
+
+    assert catalog.by_query_id((1).to_bytes(32, "big")).tag == "eth-usd-legacy"
+    assert {e.tag for e in catalog.by_query_type("SpotPrice")} == {"ohm-eth-spot", "vsq-usd-spot"}
+    assert catalog.by_query_type("Unknown") == []
+    assert catalog.invalid_entries() == []
+
+
+def test_invalid_query_id(tmp_path):
+    text = QUERY_CATALOG_FILE.read_text().replace(OHM_ETH[2:], "ab" * 32)
+    catalog_file = tmp_path / "query_catalog.yaml"
+    catalog_file.write_text(text)
+
+    with pytest.raises(ValueError, match=r"ohm-eth-spot \(query ID does not match descriptor\)"):
+        QueryCatalog.from_file(catalog_file)
+
+    catalog = QueryCatalog.from_file(catalog_file, validate=False)
+    assert [e.tag for e in catalog.invalid_entries()] == ["ohm-eth-spot"]
+
+
+def test_invalid_descriptor(tmp_path):
+    text = QUERY_CATALOG_FILE.read_text().replace('"asset":"ohm"', '"coin":"ohm"')
+    assert '"coin":"ohm"' in text
+    catalog_file = tmp_path / "query_catalog.yaml"
+    catalog_file.write_text(text)
+
+    with pytest.raises(ValueError, match=r"ohm-eth-spot \(invalid descriptor: KeyError\('asset'\)\)"):
+        QueryCatalog.from_file(catalog_file)
+
+
+def test_duplicate_query_id():
+    entry = QueryCatalog.from_file(QUERY_CATALOG_FILE).get("ohm-eth-spot")
+    duplicate = dataclasses.replace(entry, tag="ohm-eth-spot-2")
+
+    with pytest.raises(ValueError, match="Duplicate catalog query ID: ohm-eth-spot-2 and ohm-eth-spot"):
+        QueryCatalog([entry, duplicate])
+
+
+def test_packaged_catalog():
+    """The catalog is loaded from the package data"""
+    assert QUERY_CATALOG_FILE == TELLIOT_CORE_ROOT / "data" / "query_catalog.yaml"
+    assert len(load_query_catalog()) > 0
+
+
+def test_snapshot():
+    catalog = load_query_catalog()
+    restored = pickle.loads(pickle.dumps(catalog))
+    assert list(restored) == list(catalog)
+    assert restored.by_query_id(OHM_ETH).tag == "ohm-eth-spot"
@@ -0,0 +1,70 @@
+"""
+Tests covering the block-scoped contract read cache
+"""
+import pytest
+
+from telliot_core.contract.read_cache import ReadCache
+
+ADDRESS = "0x88dF592F8eb5D7Bd38bFeF7dEb0fBc02cf3778a0"
+
+
+def test_requires_block_number():
+    """Block-scoped reads are not cached until a block is seen"""
+    cache = ReadCache()
+    assert cache.key(ADDRESS, "getStakeAmount", (), {}) is None
+
+    cache.set_block_number(10)
+    key = cache.key(ADDRESS, "getStakeAmount", (), {})
+    assert key is not None
+
+    assert cache.get(key) == (False, None)
+    cache.set(key, 100)
+    assert cache.get(key) == (True, 100)
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+@pytest.mark.asyncio
+async def test_new_block_invalidates():
+    """Entries from earlier blocks are dropped on a new block"""
+    cache = ReadCache(ttl={"getTokenAddress": None})
+    await cache.handle_new_block({"number": 1})
+
+    stake_key = cache.key(ADDRESS, "getStakeAmount", (), {})
+    token_key = cache.key(ADDRESS, "getTokenAddress", (), {})
+    cache.set(stake_key, 100)
+    cache.set(token_key, ADDRESS)
+
+    await cache.handle_new_block({"number": 2})
+
+    assert len(cache) == 1
+    assert cache.get(cache.key(ADDRESS, "getStakeAmount", (), {})) == (False, None)
+    assert cache.get(cache.key(ADDRESS, "getTokenAddress", (), {})) == (True, ADDRESS)
+
+
+def test_stale_key_not_stored():
+    """A read that started in an earlier block is not cached"""
+    cache = ReadCache()
+    cache.set_block_number(1)
+    key = cache.key(ADDRESS, "getStakerInfo", (ADDRESS,), {})
+
+    cache.set_block_number(2)
+    cache.set(key, [1, 2])
+
+    assert len(cache) == 0
+
+
+def test_lru_eviction():
+    """Least recently used entries are evicted first"""
+    cache = ReadCache(maxsize=2)
+    cache.set_block_number(1)
+
+    keys = [cache.key(ADDRESS, "getStakerInfo", (), {"_staker": str(i)}) for i in range(3)]
+    cache.set(keys[0], 0)
+    cache.set(keys[1], 1)
+    cache.get(keys[0])
+    cache.set(keys[2], 2)
+
+    assert cache.get(keys[0]) == (True, 0)
+    assert cache.get(keys[1]) == (False, None)
+    assert cache.get(keys[2]) == (True, 2)
@@ -0,0 +1,78 @@
+"""
+Tests covering block-driven transaction confirmation
+"""
+import pytest
+from hexbytes import HexBytes
+from web3.exceptions import TimeExhausted
+
+from telliot_core.contract.receipt_tracker import ReceiptTracker
+from tests.fake_endpoint import FakeEndpoint
+
+MINED = HexBytes("0x" + "11" * 32)
+UNMINED = HexBytes("0x" + "22" * 32)
+FAILING = HexBytes("0x" + "33" * 32)
+
+
+class FakeProvider:
+    def __init__(self):
+        self.batches = []
+
+    async def make_batch_request(self, requests):
+        self.batches.append(requests)
+        responses = []
+        for i, (_, [tx_hash]) in enumerate(requests):
+            if tx_hash == FAILING.to_0x_hex():
+                responses.append({"jsonrpc": "2.0", "id": i, "error": {"code": -32000, "message": "internal error"}})
+                continue
+            result = {"transactionHash": tx_hash, "status": "0x1", "blockNumber": "0x5"}
+            responses.append({"jsonrpc": "2.0", "id": i, "result": result if tx_hash == MINED.to_0x_hex() else None})
+        return responses
+
+
+@pytest.mark.asyncio
+async def test_new_block_resolves_receipts():
+    """Pending receipts are looked up in one batch per block"""
+    node = FakeEndpoint(provider=FakeProvider())
+    tracker = ReceiptTracker(node)
+
+    mined = tracker.track(MINED)
+    unmined = tracker.track(UNMINED)
+    assert tracker.track(MINED) is mined
+
+    await tracker.handle_new_block({"number": 5})
+
+    assert len(node.async_web3.provider.batches) == 1
+    assert mined.done()
+    assert mined.result()["status"] == 1
+    assert mined.result()["blockNumber"] == 5
+    assert not unmined.done()
+    assert len(tracker) == 1
+
+
+@pytest.mark.asyncio
+async def test_receipt_timeout():
+    tracker = ReceiptTracker(FakeEndpoint(provider=FakeProvider()))
+
+    with pytest.raises(TimeExhausted):
+        await tracker.wait_for_receipt(UNMINED, timeout=0.01)
+
+    assert len(tracker) == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_lookup_only_fails_its_transaction():
+    """An error response fails only the transaction whose receipt lookup errored"""
+    node = FakeEndpoint(provider=FakeProvider())
+    tracker = ReceiptTracker(node)
+
+    mined = tracker.track(MINED)
+    unmined = tracker.track(UNMINED)
+    failing = tracker.track(FAILING)
+
+    await tracker.handle_new_block({"number": 5})
+
+    assert mined.result()["status"] == 1
+    with pytest.raises(ValueError, match="internal error"):
+        failing.result()
+    assert not unmined.done()
+    assert len(tracker) == 1
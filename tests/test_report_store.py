@@ -0,0 +1,79 @@
+"""
+Tests covering the local oracle report store
+"""
+import pytest
+from eth_abi import encode
+from web3 import Web3
+
+from telliot_core.contract.events import default_event_table
+from telliot_core.tellor.report_store import ReportStore
+
+ORACLE = "0x" + "11" * 20
+REPORTER = "0x" + "22" * 20
+QUERY_ID = Web3.keccak(text="query")
+NEW_REPORT = Web3.keccak(text="NewReport(bytes32,uint256,bytes,uint256,bytes,address)")
+
+
+def new_report(block: int, timestamp: int, value: int, query_id: bytes = QUERY_ID):
+    topics = [NEW_REPORT, query_id, encode(["uint256"], [timestamp]), encode(["address"], [REPORTER])]
+    raw = {
+        "address": ORACLE,
+        "topics": ["0x" + t.hex() for t in topics],
+        "data": "0x" + encode(["bytes", "uint256", "bytes"], [encode(["uint256"], [value]), 0, b""]).hex(),
+        "blockNumber": hex(block),
+        "logIndex": "0x0",
+    }
+    return default_event_table().format_log(raw)
+
+
+class FakeBackfill:
+    """Serves one report every 10 blocks"""
+
+    def __init__(self):
+        self.ranges = []
+
+    async def get_events(self, from_block, to_block, address, events):
+        assert address == ORACLE and events == ["NewReport"]
+        self.ranges.append((from_block, to_block))
+        return [new_report(b, 1000 + b, b) for b in range(from_block, to_block + 1) if b % 10 == 0]
+
+
+@pytest.mark.asyncio
+async def test_sync_and_query():
+    """Reports are synced incrementally and read back by query ID and time"""
+    store = ReportStore(chain_id=1, oracle=ORACLE, path=":memory:")
+    backfill = FakeBackfill()
+
+    assert await store.sync(backfill, to_block=250, from_block=1, batch=100) == 25
+    assert backfill.ranges == [(1, 100), (101, 200), (201, 250)]
+    assert store.last_block == 250
+
+    # Resume from the last synced block
+    assert await store.sync(backfill, to_block=300) == 5
+    assert backfill.ranges[-1] == (251, 300)
+
+    latest = store.latest("0x" + QUERY_ID.hex())
+    assert latest.timestamp == 1300
+    assert latest.block == 300
+    assert latest.reporter == REPORTER
+    assert int.from_bytes(latest.value, "big") == 300
+
+    assert [r.timestamp for r in store.reports(QUERY_ID, start=1095, end=1130)] == [1100, 1110, 1120, 1130]
+    assert store.count(QUERY_ID) == 30
+    assert store.query_ids() == [QUERY_ID]
+    assert store.latest(bytes(32)) is None
+
+
+@pytest.mark.asyncio
+async def test_live_reports(tmp_path):
+    """Listener events are stored once, without advancing the synced block"""
+    store = ReportStore(chain_id=1, oracle=ORACLE, path=tmp_path / "reports.sqlite")
+    await store.handle_event(new_report(500, 5000, 1))
+    await store.handle_event(new_report(500, 5000, 1))
+    assert store.count(QUERY_ID) == 1
+    assert store.last_block is None
+    store.close()
+
+    reopened = ReportStore(chain_id=1, oracle=ORACLE, path=tmp_path / "reports.sqlite")
+    assert reopened.latest(QUERY_ID).timestamp == 5000
+    assert ReportStore(chain_id=5, oracle=ORACLE, path=tmp_path / "reports.sqlite").latest(QUERY_ID) is None
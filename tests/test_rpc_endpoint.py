@@ -1,10 +1,15 @@
 """
 Tests covering Pytelliot rpc connection  utils.
 """
+import asyncio
+
 import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 from requests.exceptions import ConnectionError
 from requests.exceptions import HTTPError
 
+from telliot_core.contract.batch_provider import BatchingHTTPProvider
 from telliot_core.model.endpoints import EndpointList
 from telliot_core.model.endpoints import RPCEndpoint
 
@@ -52,3 +57,72 @@ def test_endpoint_list():
     # print(json.dumps(sl.get_state(), indent=2))
     ep11155111 = sl.find(chain_id=11155111)[0]
     assert ep11155111.network == "sepolia"
+
+
+@pytest.mark.asyncio
+async def test_batched_async_requests(chain):
+    """Concurrent async requests are coalesced into JSON-RPC batches"""
+    url = "http://127.0.0.1:8545"  # local Ganache node
+    endpt = RPCEndpoint(network=network, provider=provider, url=url, batch_window=0.0)
+    chain.mine(10)
+
+    w3 = await endpt.connect_async()
+    assert isinstance(w3.provider, BatchingHTTPProvider)
+
+    block_numbers = await asyncio.gather(*[w3.eth.block_number for _ in range(10)])
+    assert len(set(block_numbers)) == 1
+    assert block_numbers[0] > 1
+    assert w3.provider.http_request_count < 10
+
+
+class BatchRejectingNode:
+    """JSON-RPC node answering the first `failures` batches with a single error object"""
+
+    def __init__(self, message, failures):
+        self.message = message
+        self.failures = failures
+        self.batches = 0
+        self.app = web.Application()
+        self.app.router.add_post("/", self.handle)
+
+    async def handle(self, request):
+        body = await request.json()
+        if not isinstance(body, list):
+            return web.json_response({"jsonrpc": "2.0", "id": body["id"], "result": "0x1"})
+        self.batches += 1
+        if self.batches <= self.failures:
+            return web.json_response({"jsonrpc": "2.0", "id": None, "error": {"code": -32005, "message": self.message}})
+        return web.json_response([{"jsonrpc": "2.0", "id": r["id"], "result": "0x1"} for r in body])
+
+
+async def send_requests(provider, n=5):
+    responses = await asyncio.gather(*[provider.make_request("eth_blockNumber", []) for _ in range(n)])
+    assert all(r["result"] == "0x1" for r in responses)
+
+
+@pytest.mark.asyncio
+async def test_batch_failure_retries_batching():
+    """A transient batch error (e.g. rate limit) pauses batching only for a while"""
+    node = BatchRejectingNode("daily request limit exceeded", failures=1)
+    async with TestServer(node.app) as server:
+        provider = BatchingHTTPProvider(str(server.make_url("/")), batch_retry_delay=0.0)
+
+        await send_requests(provider)
+        assert provider.http_request_count == 6
+
+        await send_requests(provider)
+        assert node.batches == 2
+        assert provider.http_request_count == 7
+
+
+@pytest.mark.asyncio
+async def test_batches_not_supported():
+    """Batching is turned off if the node does not support batches"""
+    node = BatchRejectingNode("Batch requests are not supported", failures=1)
+    async with TestServer(node.app) as server:
+        provider = BatchingHTTPProvider(str(server.make_url("/")), batch_retry_delay=0.0)
+
+        await send_requests(provider)
+        await send_requests(provider)
+        assert node.batches == 1
+        assert provider.http_request_count == 11
@@ -0,0 +1,58 @@
+"""
+Tests covering bulk staker status reads
+"""
+import pytest
+from eth_utils import to_checksum_address
+from web3.exceptions import ContractLogicError
+
+from telliot_core.tellor.staker_info import get_staker_infos
+from telliot_core.tellor.staker_info import StakerInfo
+from telliot_core.utils.response import ResponseStatus
+
+STAKED = "0x" + "11" * 20
+UNSTAKED = "0x" + "22" * 20
+BROKEN = "0x" + "33" * 20
+
+
+def test_decode_oracle_versions():
+    tellorx = StakerInfo.from_result(STAKED, (1, 1650000000))
+    assert tellorx.status == "Staked" and tellorx.date_staked.ts == 1650000000
+    assert StakerInfo.from_result(STAKED, (9, 1650000000)).status == "Unknown(9)"
+
+    flex = StakerInfo.from_result(STAKED, (1650000000, 0, 10**19, 1660000000, 7))
+    assert flex.status == "LockedForWithdraw"
+    assert flex.locked_balance == 10**19 and flex.reports_submitted == 7
+
+    t360 = StakerInfo.from_result(STAKED, (1650000000, 10**20, 0, 5, 1660000000, 3, 0, 0, True))
+    assert t360.status == "Staked"
+    assert t360.staked_balance == 10**20 and t360.reporter_last_timestamp == 1660000000
+
+
+class FakeOracle:
+    def __init__(self):
+        self.batches = []
+
+    async def read_many(self, calls):
+        self.batches.append(calls)
+        results = []
+        for func_name, kwargs in calls:
+            assert func_name == "getStakerInfo"
+            staker = kwargs["_staker"]
+            if staker == to_checksum_address(BROKEN):
+                results.append((None, ResponseStatus(ok=False, e=ContractLogicError("reverted"), error="reverted")))
+            elif staker == to_checksum_address(STAKED):
+                results.append(((1650000000, 10**20, 0, 0, 1660000000, 3, 0, 0, True), ResponseStatus()))
+            else:
+                results.append(((0, 0, 0, 0, 0, 0, 0, 0, False), ResponseStatus()))
+        return results
+
+
+@pytest.mark.asyncio
+async def test_get_staker_infos():
+    oracle = FakeOracle()
+    infos = await get_staker_infos(oracle, [STAKED, UNSTAKED, BROKEN])
+
+    assert len(oracle.batches) == 1
+    assert [info.status if info else None for info, _ in infos] == ["Staked", "NotStaked", None]
+    assert infos[0][0].address == to_checksum_address(STAKED)
+    assert not infos[2][1].ok
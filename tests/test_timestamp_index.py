@@ -0,0 +1,91 @@
+"""
+Tests covering the report timestamp index
+"""
+import pytest
+
+from telliot_core.tellor.timestamp_index import ReportTimestampIndex
+from telliot_core.utils.response import ResponseStatus
+
+QUERY_ID = b"\x01" * 32
+
+
+class FakeABI:
+    def __init__(self, functions):
+        self.functions = {name: None for name in functions}
+
+
+class FakeOracle:
+    """Tellor360 oracle with one report every 10 seconds, from time 1000"""
+
+    def __init__(self, count, functions=("getNewValueCountbyQueryId",)):
+        self.count = count
+        self.compiled_abi = FakeABI(functions)
+        self.calls = []
+
+    async def read(self, func_name, **kwargs):
+        self.calls.append((func_name, 1))
+        assert func_name == "getNewValueCountbyQueryId" and kwargs == {"_queryId": QUERY_ID}
+        return self.count, ResponseStatus()
+
+    async def read_many(self, calls):
+        self.calls.append((calls[0][0], len(calls)))
+        results = []
+        for func_name, kwargs in calls:
+            if func_name == "getTimestampbyQueryIdandIndex":
+                results.append((1000 + 10 * kwargs["_index"], ResponseStatus()))
+            elif func_name == "retrieveData":
+                results.append((kwargs["_timestamp"].to_bytes(32, "big"), ResponseStatus()))
+            else:
+                raise AssertionError(func_name)
+        return results
+
+
+@pytest.mark.asyncio
+async def test_lookups():
+    oracle = FakeOracle(count=1000)
+    index = ReportTimestampIndex(oracle, QUERY_ID, page_size=50)
+
+    assert await index.index_before(999) is None
+    assert await index.index_before(1000) == 0
+    assert await index.timestamp_before(5555) == 5550
+    assert await index.timestamp_before(10**9) == 1000 + 10 * 999
+    assert await index.timestamps_between(1995, 2030) == [2000, 2010, 2020, 2030]
+    assert await index.timestamps_between(3001, 3009) == []
+
+    # Only the pages probed by the binary searches were read
+    assert len(index._loaded) < 20
+    assert all(n <= 50 for _, n in oracle.calls)
+
+    # Cached lookups do not read
+    oracle.calls.clear()
+    assert await index.timestamp_before(5555) == 5550
+    assert oracle.calls == []
+
+
+@pytest.mark.asyncio
+async def test_values_and_refresh():
+    oracle = FakeOracle(count=30)
+    index = ReportTimestampIndex(oracle, QUERY_ID, page_size=8)
+
+    assert await index.value_at(1105) == (1100, (1100).to_bytes(32, "big"))
+    assert await index.values_between(1000, 1020) == [(t, t.to_bytes(32, "big")) for t in (1000, 1010, 1020)]
+    await index.load_all()
+    assert list(index.timestamps) == [1000 + 10 * i for i in range(30)]
+
+    # New reports extend the index and the partial last page is read again
+    oracle.count = 35
+    assert await index.refresh() == 35
+    oracle.calls.clear()
+    assert await index.timestamp_before(10**9) == 1340
+    assert oracle.calls == [("getTimestampbyQueryIdandIndex", 8), ("getTimestampbyQueryIdandIndex", 3)]
+
+    oracle.calls.clear()
+    assert await index.value_at(1105) == (1100, (1100).to_bytes(32, "big"))
+    assert oracle.calls == []
+
+
+def test_tellorx_functions():
+    oracle = FakeOracle(count=0, functions=("getTimestampCountById",))
+    index = ReportTimestampIndex(oracle, QUERY_ID)
+    assert index._timestamp_fn == "getReportTimestampByIndex"
+    assert index._value_fn == "getValueByTimestamp"
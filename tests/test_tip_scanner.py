@@ -0,0 +1,132 @@
+"""
+Tests covering the batch autopay tip scanner
+"""
+import asyncio
+
+import pytest
+from eth_abi import encode
+from web3 import Web3
+from web3.exceptions import ContractLogicError
+
+from telliot_core.contract.events import default_event_table
+from telliot_core.tellor.tip_scanner import FeedDetails
+from telliot_core.tellor.tip_scanner import TipScanner
+from telliot_core.utils.response import ResponseStatus
+
+AUTOPAY = "0x" + "33" * 20
+TIPPER = "0x" + "44" * 20
+TIP_ADDED = Web3.keccak(text="TipAdded(bytes32,uint256,bytes,address)")
+
+#: Inside the reward window of the fake feeds (start 0, interval 3600, window 600)
+IN_WINDOW = 7200 + 60
+
+
+def qid(i):
+    return i.to_bytes(32, "big")
+
+
+class FakeAutopay:
+    """Query i has a one-time tip of i (none for even i), and query 3 has two feeds"""
+
+    address = AUTOPAY
+
+    def __init__(self):
+        self.batches = []
+        self.bonus = {}
+        self.failing = set()
+
+    async def read_many(self, calls):
+        self.batches.append(len(calls))
+        results = []
+        for func_name, kwargs in calls:
+            if kwargs.get("_queryId", kwargs.get("_feedId")) in self.failing:
+                results.append((None, ResponseStatus(ok=False, error="error reading from contract")))
+            elif func_name == "getCurrentTip":
+                i = int.from_bytes(kwargs["_queryId"], "big")
+                if i % 2 == 0:
+                    results.append((None, ResponseStatus(ok=False, e=ContractLogicError("execution reverted"))))
+                else:
+                    results.append((i + self.bonus.get(i, 0), ResponseStatus()))
+            elif func_name == "getCurrentFeeds":
+                feeds = [b"\xf1" * 32, b"\xf2" * 32] if kwargs["_queryId"] == qid(3) else []
+                results.append((feeds, ResponseStatus()))
+            elif func_name == "getDataFeed":
+                # reward, balance, startTime, interval, window, priceThreshold, feedsWithFundingIndex
+                balance = 1000 if kwargs["_feedId"] == b"\xf1" * 32 else 50
+                results.append(((100, balance, 0, 3600, 600, 0, 1), ResponseStatus()))
+            else:
+                raise AssertionError(func_name)
+        return results
+
+
+@pytest.mark.asyncio
+async def test_scan_tips():
+    autopay = FakeAutopay()
+    scanner = TipScanner(autopay, batch_size=4, concurrency=2)
+
+    ranking = await scanner.scan_tips([qid(i) for i in range(10)] + ["0x" + qid(1).hex()], timestamp=IN_WINDOW)
+    assert [int.from_bytes(t.query_id, "big") for t in ranking[:4]] == [3, 9, 7, 5]
+    assert ranking[0].tip == 3 and ranking[0].feed_reward == 150 and ranking[0].total == 153
+    assert all(t.tip == 0 for t in ranking if t.query_id[-1] % 2 == 0)
+    assert len(ranking) == 10
+
+    # 3 batches of tip/feed reads, one batch of feed details
+    assert sorted(autopay.batches) == [2, 4, 8, 8]
+
+    # Outside the reward window only the one-time tip is payable
+    assert ranking[0].total_at(IN_WINDOW + 600) == 3
+    assert [int.from_bytes(t.query_id, "big") for t in scanner.ranking(IN_WINDOW + 600)[:2]] == [9, 7]
+
+
+def test_payable_reward():
+    feed = FeedDetails(b"\xf1" * 32, reward=100, balance=30, start_time=1000, interval=3600, window=600)
+    assert feed.payable_reward(999) == 0
+    assert feed.payable_reward(1000) == 30
+    assert feed.payable_reward(1599) == 30
+    assert feed.payable_reward(1600) == 0
+    assert feed.payable_reward(1000 + 3600 * 5 + 10) == 30
+
+
+@pytest.mark.asyncio
+async def test_failed_reads_are_skipped():
+    """Queries whose tips or feeds cannot be read are recorded and skipped"""
+    autopay = FakeAutopay()
+    autopay.failing = {qid(5), b"\xf2" * 32}
+    scanner = TipScanner(autopay, batch_size=4)
+
+    ranking = await scanner.scan_tips([qid(i) for i in range(1, 8)], timestamp=IN_WINDOW)
+    assert sorted(int.from_bytes(t.query_id, "big") for t in ranking) == [1, 2, 4, 6, 7]
+    assert set(scanner.failures) == {qid(3), qid(5)}
+
+    autopay.failing = set()
+    await scanner.scan_tips([qid(3), qid(5)], timestamp=IN_WINDOW)
+    assert scanner.failures == {}
+    assert scanner.tips[qid(3)].total == 153
+
+
+def test_scanner_created_outside_loop():
+    """The scanner can be created before the event loop and used from several loops"""
+    scanner = TipScanner(FakeAutopay(), batch_size=1, concurrency=1)
+    assert len(asyncio.run(scanner.scan_tips([qid(1), qid(3)], timestamp=IN_WINDOW))) == 2
+    assert len(asyncio.run(scanner.scan_tips([qid(5), qid(7)], timestamp=IN_WINDOW))) == 2
+
+
+@pytest.mark.asyncio
+async def test_tip_event_rescans_query():
+    autopay = FakeAutopay()
+    scanner = TipScanner(autopay)
+    await scanner.scan_tips([qid(1), qid(5)])
+    assert scanner.ranking()[0].query_id == qid(5)
+
+    autopay.bonus[1] = 100
+    raw = {
+        "address": AUTOPAY,
+        "topics": ["0x" + t.hex() for t in (TIP_ADDED, qid(1), encode(["uint256"], [100]))],
+        "data": "0x" + encode(["bytes", "address"], [b"", TIPPER]).hex(),
+        "blockNumber": "0x1",
+        "logIndex": "0x0",
+    }
+    await scanner.handle_event(default_event_table().format_log(raw))
+
+    assert scanner.tips[qid(1)].tip == 101
+    assert scanner.ranking()[0].query_id == qid(1)